@@ -0,0 +1,235 @@
+"""Synthetic sample documents shared by the benchmark scripts.
+
+Real FDA PDFs are not redistributed with the repository, so the benchmarks
+build representative stand-ins locally: a multi-page text-layer PDF shaped
+like a 510(k) summary, and image-only "scanned" PDFs for the OCR benchmark.
+The summarizer benchmarks use pages of synthetic openFDA records with the
+shape and field lengths of real API results.
+"""
+
+import random
+
+SUMMARY_PARAGRAPH = (
+    "The subject device is substantially equivalent to the predicate device "
+    "K123456 in intended use, technological characteristics and performance. "
+    "Bench testing included biocompatibility per ISO 10993-1, electrical "
+    "safety per IEC 60601-1 and software verification per IEC 62304."
+)
+
+
+def build_text_pdf(path: str, pages: int = 12, lines_per_page: int = 45) -> None:
+    """Write a minimal multi-page PDF with a real text layer to `path`."""
+    objects: list[bytes] = []
+    page_ids = []
+    font_id = 3
+    next_id = 4
+    page_objects: list[tuple[int, bytes]] = []
+    for page_no in range(pages):
+        lines = [f"510(k) Summary - page {page_no + 1}"]
+        words = SUMMARY_PARAGRAPH.split()
+        for i in range(lines_per_page):
+            start = (i * 7) % len(words)
+            lines.append(" ".join(words[start:start + 12]))
+        ops = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        for line in lines:
+            safe = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({safe}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        content_id, page_id = next_id, next_id + 1
+        next_id += 2
+        page_ids.append(page_id)
+        page_objects.append((
+            content_id,
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        ))
+        page_objects.append((
+            page_id,
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                f"/Contents {content_id} 0 R >>"
+            ).encode(),
+        ))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects = [
+        (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()),
+        (3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"),
+        *page_objects,
+    ]
+    objects.sort()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id, body in objects:
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n" % obj_id + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for obj_id, _ in objects:
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref_at)
+    )
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+SCANNED_LETTER_LINES = [
+    "DEPARTMENT OF HEALTH AND HUMAN SERVICES",
+    "Food and Drug Administration",
+    "Re: P850042 Supplement 013",
+    "Trade Name: Cardiac Pacing Lead Model 4076",
+    "Dear Sir or Madam:",
+    "The Center for Devices and Radiological Health (CDRH) has",
+    "completed its review of your premarket approval application",
+    "supplement, which requested approval for a change in the",
+    "manufacturing site for the lead insulation. Based upon the",
+    "information submitted, the PMA supplement is approved. You may",
+    "begin commercial distribution of the device as modified.",
+    "Sincerely yours,",
+    "Director, Office of Device Evaluation",
+]
+
+
+def build_scanned_pdf(
+    path: str, pages: int = 5, dpi: int = 200, noise: float = 0.002, seed: int = 0
+) -> str:
+    """Write an image-only PDF imitating a scanned FDA letter to `path`.
+
+    Each page is the letter text drawn onto a US-letter bitmap with a
+    slight skew and salt-and-pepper noise, like a photocopied fax.
+
+    Returns:
+        The ground-truth text of all pages, for accuracy scoring.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    rng = random.Random(seed)
+    font = ImageFont.load_default(size=dpi // 7)
+    width, height = int(8.5 * dpi), int(11 * dpi)
+    images = []
+    truth = []
+    for page_no in range(pages):
+        lines = [f"Page {page_no + 1}", *SCANNED_LETTER_LINES]
+        image = Image.new("L", (width, height), 255)
+        draw = ImageDraw.Draw(image)
+        y = dpi
+        for line in lines:
+            draw.text((dpi, y), line, fill=0, font=font)
+            y += int(dpi * 0.3)
+        image = image.rotate(rng.uniform(-0.8, 0.8), fillcolor=255)
+        pixels = image.load()
+        for _ in range(int(width * height * noise)):
+            pixels[rng.randrange(width), rng.randrange(height)] = rng.choice((0, 255))
+        images.append(image)
+        truth.append("\n".join(lines))
+
+    images[0].save(path, save_all=True, append_images=images[1:], resolution=dpi)
+    return "\n".join(truth)
+
+
+def _drug_event(i: int) -> dict:
+    return {
+        "safetyreportid": str(10_000_000 + i),
+        "receiptdate": f"2024{(i % 12) + 1:02d}15",
+        "serious": str(1 + i % 2),
+        "seriousnessdeath": "1" if i % 17 == 0 else None,
+        "patient": {
+            "reaction": [
+                {"reactionmeddrapt": term}
+                for term in ("Nausea", "Headache", "Dizziness", "Rash")[: 1 + i % 4]
+            ],
+            "drug": [
+                {
+                    "medicinalproduct": f"DRUG {i}-{d}",
+                    "drugcharacterization": str(1 + d % 3),
+                    "drugdosagetext": "10 mg daily",
+                }
+                for d in range(1 + i % 8)
+            ],
+        },
+    }
+
+
+def _drug_label(i: int) -> dict:
+    section = SUMMARY_PARAGRAPH * 12
+    return {
+        "id": f"label-{i:06d}",
+        "openfda": {
+            "brand_name": [f"BRAND {i}"],
+            "generic_name": [f"GENERIC {i}"],
+            "manufacturer_name": ["Example Pharma Inc."],
+        },
+        "indications_and_usage": [section],
+        "dosage_and_administration": [section[:900]],
+        "warnings": [section],
+        "adverse_reactions": [section],
+        "contraindications": [section[:300]],
+    }
+
+
+def _device_event(i: int) -> dict:
+    return {
+        "mdr_report_key": str(5_000_000 + i),
+        "date_received": "20240301",
+        "event_type": ("Malfunction", "Injury", "Death")[i % 3],
+        "device": [
+            {
+                "generic_name": "INFUSION PUMP",
+                "brand_name": f"PUMP {i}",
+                "manufacturer_d_name": "Example Medical",
+            }
+        ],
+        "mdr_text": [
+            {"text": SUMMARY_PARAGRAPH * (1 + i % 4)},
+            {"text": "Manufacturer narrative: device returned for evaluation."},
+        ],
+        "patient": [{"sequence_number_outcome": ["Hospitalization", "Other"]}],
+    }
+
+
+def _device_510k(i: int) -> dict:
+    return {
+        "k_number": f"K{230000 + i}",
+        "device_name": "Blood Glucose Test System",
+        "applicant": "Example Diagnostics",
+        "decision_description": "Substantially Equivalent",
+        "decision_date": "2024-01-15",
+        "product_code": "NBW",
+        "review_panel": "CH",
+    }
+
+
+def _enforcement(i: int) -> dict:
+    return {
+        "recall_number": f"D-{i:04d}-2024",
+        "classification": "Class II",
+        "status": "Ongoing",
+        "recalling_firm": "Example Pharma Inc.",
+        "product_description": "Tablets, 10 mg, 90-count bottles",
+        "reason_for_recall": SUMMARY_PARAGRAPH * (1 + i % 3),
+        "distribution_pattern": "Nationwide",
+        "report_date": "20240110",
+    }
+
+
+SAMPLE_RECORDS = {
+    "drug/event": _drug_event,
+    "drug/label": _drug_label,
+    "drug/enforcement": _enforcement,
+    "device/event": _device_event,
+    "device/510k": _device_510k,
+}
+
+
+def build_response(endpoint: str, records: int = 1000) -> dict:
+    """An openFDA search response with `records` synthetic results."""
+    make = SAMPLE_RECORDS[endpoint]
+    return {
+        "meta": {"results": {"skip": 0, "limit": records, "total": records * 20}},
+        "results": [make(i) for i in range(records)],
+    }
@@ -0,0 +1,71 @@
+"""Benchmark PDF text-extraction backends.
+
+Times every available backend in fda_mcp.documents.fetcher on the given
+PDFs (or a synthetic 510(k)-style summary when none are given) and reports
+wall time and peak Python heap per document. The "auto" backend order in
+EXTRACTION_BACKENDS is based on these numbers.
+
+Usage:
+    uv run python benchmarks/bench_extraction.py [PDF ...] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import build_text_pdf  # noqa: E402
+
+from fda_mcp.documents import fetcher  # noqa: E402
+
+
+def _measure(backend: str, path: str, repeat: int) -> tuple[float, int, int]:
+    """Return (mean seconds, peak heap bytes, chars) for one backend."""
+    extract = fetcher._get_backend(backend)
+    text, _ = extract(path)  # warm-up (imports, page cache)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text, _ = extract(path)
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", help="PDF files to extract")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = list(args.pdfs)
+    tmpdir = None
+    if not paths:
+        tmpdir = tempfile.TemporaryDirectory()
+        sample = os.path.join(tmpdir.name, "sample_510k_summary.pdf")
+        build_text_pdf(sample)
+        paths.append(sample)
+
+    backends = [b for b in fetcher.EXTRACTION_BACKENDS if fetcher._backend_available(b)]
+    print(f"auto backend: {fetcher.select_backend('auto')}")
+    print(f"{'document':<32} {'backend':<12} {'ms':>9} {'peak KiB':>10} {'chars':>8}")
+    for path in paths:
+        name = os.path.basename(path)[:32]
+        for backend in backends:
+            elapsed, peak, chars = _measure(backend, path, args.repeat)
+            print(
+                f"{name:<32} {backend:<12} {elapsed * 1000:>9.1f} "
+                f"{peak / 1024:>10.0f} {chars:>8}"
+            )
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark JSON decoding backends on openFDA-sized responses.
+
+For each backend installed here (see fda_mcp.jsoncodec), decodes a
+1000-row count response and 1000-record search pages, and reports the
+decode throughput and the p50 time of the tool's CPU path for the page:
+decode plus summarize_count_response for counts (count_records), decode
+plus a budgeted summarize_response for search pages. Network time is left
+out, so this is the part a faster decoder can change. search_fda itself
+streams pages through ResultsParser, which stays on the stdlib decoder;
+its rows show the cost of decoding a whole page at once.
+
+Usage:
+    uv run python benchmarks/bench_json.py [--records N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import build_response  # noqa: E402
+
+from fda_mcp.config import config  # noqa: E402
+from fda_mcp.jsoncodec import (  # noqa: E402
+    JSON_BACKENDS,
+    backend_available,
+    select_codec,
+)
+from fda_mcp.openfda.summarizer import (  # noqa: E402
+    summarize_count_response,
+    summarize_response,
+)
+
+
+def _count_response(rows: int) -> dict:
+    return {
+        "meta": {"results": {"skip": 0, "limit": rows, "total": rows}},
+        "results": [
+            {"term": f"ADVERSE REACTION TERM {i}", "count": 1_000_000 // (i + 1)}
+            for i in range(rows)
+        ],
+    }
+
+
+def _times(run, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {"count": _count_response(args.records)}
+    for endpoint in ("drug/event", "drug/label", "device/event"):
+        pages[endpoint] = build_response(endpoint, args.records)
+    bodies = {name: json.dumps(page).encode() for name, page in pages.items()}
+    budget = config.search_output_budget or None
+
+    print(
+        f"{'page':<14} {'backend':<8} {'body MB':>8} {'decode MB/s':>12} "
+        f"{'p50 tool ms':>12}"
+    )
+    for name, body in bodies.items():
+        for backend in JSON_BACKENDS:
+            if not backend_available(backend):
+                continue
+            codec = select_codec(backend)
+            assert codec.loads(body) == pages[name]
+            if name == "count":
+                def tool():
+                    summarize_count_response(codec.loads(body))
+            else:
+                def tool():
+                    summarize_response(name, codec.loads(body), budget)
+            decode = min(_times(lambda: codec.loads(body), args.repeat))
+            p50 = statistics.median(_times(tool, args.repeat))
+            print(
+                f"{name:<14} {backend:<8} {len(body) / 1e6:>8.1f} "
+                f"{len(body) / 1e6 / decode:>12.0f} {p50 * 1000:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
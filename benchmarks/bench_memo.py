@@ -0,0 +1,102 @@
+"""Benchmark the per-record summary memo over overlapping pages.
+
+Replays a paging session per endpoint over 1000 synthetic records: pages
+of --limit records at skips that overlap by half a page, then the same
+pages re-sorted (reversed), then the whole session again. Each page is
+serialized as openFDA would send it and parsed up front with
+ResultsParser, as search_fda does, so the timed part is what the memo
+changes: handing each record and its raw text to a page writer. Reports
+the session time with the memo off and on, and the memo's hit rate.
+
+Usage:
+    uv run python benchmarks/bench_memo.py [--limit N] [--budget CHARS]
+        [--format summary|table] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import SAMPLE_RECORDS  # noqa: E402
+
+from fda_mcp.config import config  # noqa: E402
+from fda_mcp.openfda.memo import summary_memo  # noqa: E402
+from fda_mcp.openfda.stream import ResultsParser  # noqa: E402
+from fda_mcp.openfda.summarizer import SummaryWriter  # noqa: E402
+from fda_mcp.openfda.tabular import table_writer  # noqa: E402
+
+RECORDS = 1000
+_WRITERS = {"summary": SummaryWriter, "table": table_writer}
+
+Page = tuple[dict, list[tuple[dict, str]]]
+
+
+def _session(endpoint: str, limit: int) -> list[Page]:
+    """Meta and (record, raw text) items of each page a session fetches."""
+    make = SAMPLE_RECORDS[endpoint]
+    records = [make(i) for i in range(RECORDS)]
+    pages = []
+    for order in (records, records[::-1]):
+        for skip in range(0, RECORDS - limit + 1, max(limit // 2, 1)):
+            meta = {"results": {"skip": skip, "limit": limit, "total": RECORDS}}
+            body = json.dumps({"meta": meta, "results": order[skip:skip + limit]})
+            parser = ResultsParser(keep_text=True)
+            items = parser.feed(body) + parser.close()
+            pages.append((parser.fields["meta"], items))
+    return pages * 2
+
+
+def _write(endpoint: str, page: Page, budget: int | None, fmt: str) -> str:
+    meta, items = page
+    writer = _WRITERS[fmt](endpoint, meta, len(items), budget)
+    for record, raw in items:
+        if not writer.add(record, raw):
+            break
+    return writer.text()
+
+
+def _run(
+    endpoint: str, pages: list[Page], budget: int | None, fmt: str, repeat: int
+) -> tuple[float, list[str]]:
+    """Best session time over repeat runs, each from an empty memo."""
+    best = float("inf")
+    for _ in range(repeat):
+        summary_memo.clear()
+        start = time.perf_counter()
+        texts = [_write(endpoint, page, budget, fmt) for page in pages]
+        best = min(best, time.perf_counter() - start)
+    return best, texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--budget", type=int, default=None)
+    parser.add_argument("--format", choices=sorted(_WRITERS), default="summary")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'endpoint':<20} {'pages':>6} {'off ms':>9} {'on ms':>9} "
+        f"{'speedup':>8} {'hit rate':>9}"
+    )
+    memo_chars = config.summary_memo_max_chars or 20_000_000
+    for endpoint in SAMPLE_RECORDS:
+        pages = _session(endpoint, args.limit)
+        config.summary_memo_max_chars = 0
+        off, expected = _run(endpoint, pages, args.budget, args.format, args.repeat)
+        config.summary_memo_max_chars = memo_chars
+        on, texts = _run(endpoint, pages, args.budget, args.format, args.repeat)
+        assert texts == expected
+        print(
+            f"{endpoint:<20} {len(pages):>6} {off * 1000:>9.1f} {on * 1000:>9.1f} "
+            f"{off / on:>7.2f}x {summary_memo.hit_rate:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
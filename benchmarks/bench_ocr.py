@@ -0,0 +1,70 @@
+"""Benchmark OCR profiles on scanned documents.
+
+Runs fda_mcp.documents.fetcher._extract_with_ocr with every profile in
+OCR_PROFILES over synthetic scanned FDA letters (clean and noisy) and
+reports pages per second and character accuracy against the known text.
+The default profile in config.ocr_profile is chosen from these numbers.
+
+Requires tesseract and poppler (pdftoppm, pdfinfo) on PATH.
+
+Usage:
+    uv run python benchmarks/bench_ocr.py [--pages N] [--profile NAME ...]
+"""
+
+import argparse
+import difflib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import build_scanned_pdf  # noqa: E402
+
+from fda_mcp.documents import fetcher  # noqa: E402
+from fda_mcp.documents.ocr import OCR_PROFILES  # noqa: E402
+
+
+def _normalize(text: str) -> str:
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("--- Page"))
+
+
+def char_accuracy(truth: str, text: str) -> float:
+    """Share of ground-truth characters recovered, by sequence alignment."""
+    truth, text = _normalize(truth), _normalize(text)
+    matcher = difflib.SequenceMatcher(None, truth, text, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    return matched / max(1, len(truth))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--profile", action="append", choices=sorted(OCR_PROFILES))
+    args = parser.parse_args()
+
+    if not fetcher.ocr_available():
+        sys.exit("tesseract and poppler are required for this benchmark")
+
+    profiles = args.profile or list(OCR_PROFILES)
+    samples = {"scan_clean": 0.0, "scan_noisy": 0.004}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"{'document':<14} {'profile':<10} {'pages/s':>8} {'accuracy':>9}")
+        for name, noise in samples.items():
+            path = os.path.join(tmpdir, f"{name}.pdf")
+            truth = build_scanned_pdf(path, pages=args.pages, noise=noise)
+            for profile_name in profiles:
+                profile = OCR_PROFILES[profile_name]
+                start = time.perf_counter()
+                text = fetcher._extract_with_ocr(path, profile=profile)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{name:<14} {profile_name:<10} {args.pages / elapsed:>8.2f} "
+                    f"{char_accuracy(truth, text):>9.1%}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark memory held by cached records: decoded dicts vs record models.
+
+Decodes N synthetic records per endpoint from JSON, 1000 at a time, and
+keeps either the decoded dicts or, as the search page cache
+(fda_mcp.openfda.pagecache) does, their fda_mcp.openfda.records models. Reports the traced memory still
+held once all N are in, and the conversion time. Decoding from JSON
+matters: unlike the sample builders' literals, decoded values are
+separate string objects per record, which the models intern.
+
+Usage:
+    uv run python benchmarks/bench_records.py [--records N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import SAMPLE_RECORDS  # noqa: E402
+
+from fda_mcp.openfda.pagecache import compact  # noqa: E402
+from fda_mcp.openfda.records import RECORD_MODELS  # noqa: E402
+
+PAGE = 1000
+
+
+def _pages(endpoint: str, records: int) -> list[str]:
+    make = SAMPLE_RECORDS[endpoint]
+    return [
+        json.dumps([make(i) for i in range(start, min(start + PAGE, records))])
+        for start in range(0, records, PAGE)
+    ]
+
+
+def _held(endpoint: str, pages: list[str], models: bool) -> tuple[int, float]:
+    """Return (bytes held, seconds) after caching every record of pages."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    cache = []
+    for page in pages:
+        records = json.loads(page)
+        if models:
+            records = [compact(endpoint, record) for record in records]
+        cache.extend(records)
+        del records
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del cache
+    return held, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'endpoint':<18} {'dicts MB':>9} {'models MB':>10} {'ratio':>6} "
+        f"{'dicts s':>8} {'models s':>9}"
+    )
+    for endpoint in SAMPLE_RECORDS:
+        if endpoint not in RECORD_MODELS:
+            continue
+        pages = _pages(endpoint, args.records)
+        dicts, dict_time = _held(endpoint, pages, models=False)
+        models, model_time = _held(endpoint, pages, models=True)
+        print(
+            f"{endpoint:<18} {dicts / 1e6:>9.1f} {models / 1e6:>10.1f} "
+            f"{dicts / models:>5.1f}x {dict_time:>8.2f} {model_time:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark server cold-start time.
+
+Imports fda_mcp.server in fresh interpreters and reports the median import
+time, with and without fetcher.warm_up() (FDA_EAGER_LOAD=1). The eager
+figure is roughly what every session paid before the PDF stack was
+deferred. It also lists which heavy modules a plain import pulled in.
+
+Usage:
+    uv run python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pdfplumber", "pdfminer", "PIL.Image", "pytesseract", "pdf2image")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import fda_mcp.server
+if {eager}:
+    from fda_mcp.documents.fetcher import warm_up
+    warm_up()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _run(eager: bool) -> dict:
+    code = _PROBE.format(eager=eager, heavy=HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return json.loads(out.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'median ms':>10} {'min ms':>8}  heavy modules loaded")
+    for label, eager in (("lazy", False), ("eager", True)):
+        _run(eager)  # warm the OS file cache
+        runs = [_run(eager) for _ in range(args.runs)]
+        times = [r["ms"] for r in runs]
+        heavy = ", ".join(runs[-1]["heavy"]) or "-"
+        print(
+            f"{label:<8} {statistics.median(times):>10.1f} {min(times):>8.1f}  {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
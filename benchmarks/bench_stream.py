@@ -0,0 +1,96 @@
+"""Benchmark streamed vs whole-body decoding of search pages.
+
+Serializes a synthetic 1000-record page per endpoint and summarizes it
+two ways: json.loads of the whole body followed by summarize_response, as
+search_fda used to, and the streamed pipeline it uses now (ResultsParser
+fed 64 KB chunks, each record handed to a SummaryWriter and dropped).
+Reports the best time and the peak traced memory for each. Without
+--budget every record is parsed and printed, so the output text is most
+of the streamed peak; with one, streaming also stops parsing once the
+budget is used up.
+
+Usage:
+    uv run python benchmarks/bench_stream.py [--records N] [--chunk BYTES]
+        [--budget CHARS] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import SAMPLE_RECORDS, build_response  # noqa: E402
+
+from fda_mcp.openfda.stream import ResultsParser  # noqa: E402
+from fda_mcp.openfda.summarizer import (  # noqa: E402
+    SummaryWriter,
+    summarize_response,
+)
+
+
+def _whole(endpoint: str, body: str, chunk: int, budget: int | None) -> str:
+    return summarize_response(endpoint, json.loads(body), budget)
+
+
+def _streamed(endpoint: str, body: str, chunk: int, budget: int | None) -> str:
+    parser = ResultsParser()
+    writer = None
+    for start in range(0, len(body) + 1, chunk):
+        records = parser.feed(body[start:start + chunk])
+        if start + chunk > len(body):
+            records += parser.close()
+        if writer is None and "meta" in parser.fields:
+            meta = parser.fields["meta"]
+            count = meta["results"]["limit"]
+            writer = SummaryWriter(endpoint, meta, count, budget)
+        for record in records:
+            if not writer.add(record):
+                return writer.text()
+    return writer.text()
+
+
+def _measure(run, *args, repeat: int) -> tuple[float, int]:
+    """Return (best seconds, peak traced bytes) for run(*args)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    run(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--chunk", type=int, default=65536)
+    parser.add_argument("--budget", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'endpoint':<20} {'body MB':>8} {'whole ms':>9} {'whole MB':>9} "
+        f"{'stream ms':>10} {'stream MB':>10}"
+    )
+    for endpoint in SAMPLE_RECORDS:
+        body = json.dumps(build_response(endpoint, args.records))
+        run_args = (endpoint, body, args.chunk, args.budget)
+        assert _whole(*run_args) == _streamed(*run_args)
+        whole = _measure(_whole, *run_args, repeat=args.repeat)
+        streamed = _measure(_streamed, *run_args, repeat=args.repeat)
+        print(
+            f"{endpoint:<20} {len(body) / 1e6:>8.1f} "
+            f"{whole[0] * 1000:>9.1f} {whole[1] / 1e6:>9.1f} "
+            f"{streamed[0] * 1000:>10.1f} {streamed[1] / 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark response summarization.
+
+Summarizes synthetic 1000-record pages for the endpoints in
+_samples.SAMPLE_RECORDS and reports the time per page, records per second
+and output size. The summarizers are compiled from declarative specs
+(fda_mcp.openfda.summarizer._SUMMARIZERS); this measures the per-record
+cost of the compiled plans. --budget applies an output budget as
+search_fda does; --format table measures search_fda's table output.
+
+Usage:
+    uv run python benchmarks/bench_summarizer.py [--records N] [--repeat N]
+        [--budget CHARS] [--format summary|table]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _samples import SAMPLE_RECORDS, build_response  # noqa: E402
+
+from fda_mcp.openfda.summarizer import summarize_response  # noqa: E402
+from fda_mcp.openfda.tabular import summarize_table  # noqa: E402
+
+_FORMATS = {"summary": summarize_response, "table": summarize_table}
+
+
+def _measure(
+    summarize, endpoint: str, data: dict, repeat: int, budget: int | None
+) -> tuple[float, int]:
+    """Return (best seconds per page, output chars) for one endpoint."""
+    text = summarize(endpoint, data, budget)  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        summarize(endpoint, data, budget)
+        best = min(best, time.perf_counter() - start)
+    return best, len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget", type=int, default=None)
+    parser.add_argument("--format", choices=sorted(_FORMATS), default="summary")
+    args = parser.parse_args()
+    summarize = _FORMATS[args.format]
+
+    print(f"{'endpoint':<20} {'ms/page':>9} {'records/s':>11} {'chars':>10}")
+    for endpoint in SAMPLE_RECORDS:
+        data = build_response(endpoint, args.records)
+        elapsed, chars = _measure(
+            summarize, endpoint, data, args.repeat, args.budget
+        )
+        print(
+            f"{endpoint:<20} {elapsed * 1000:>9.2f} "
+            f"{args.records / elapsed:>11,.0f} {chars:>10,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,97 @@ class Config:
         self.max_concurrent_requests: int = int(
             os.environ.get("OPENFDA_MAX_CONCURRENT", "4")
         )
+        self.search_output_budget: int = int(
+            os.environ.get("FDA_SEARCH_OUTPUT_BUDGET", "60000")
+        )
+        self.summary_memo_max_chars: int = int(
+            os.environ.get("FDA_SUMMARY_MEMO_MAX_CHARS", "20000000")
+        )
+        self.page_cache_max_records: int = int(
+            os.environ.get("FDA_PAGE_CACHE_MAX_RECORDS", "20000")
+        )
+        self.page_cache_ttl: float = float(
+            os.environ.get("FDA_PAGE_CACHE_TTL", "3600")
+        )
+        self.json_backend: str = os.environ.get("FDA_JSON_BACKEND", "auto")
+        self.aggregate_max_records: int = int(
+            os.environ.get("FDA_AGGREGATE_MAX_RECORDS", "10000")
+        )
+        self.aggregate_max_rows: int = int(
+            os.environ.get("FDA_AGGREGATE_MAX_ROWS", "2000000")
+        )
         self.pdf_timeout: float = float(
             os.environ.get("FDA_PDF_TIMEOUT", "60.0")
         )
         self.default_pdf_max_length: int = int(
             os.environ.get("FDA_PDF_MAX_LENGTH", "8000")
         )
+        self.pdf_max_bytes: int = int(
+            os.environ.get("FDA_PDF_MAX_BYTES", str(50 * 1024 * 1024))
+        )
+        self.pdf_chunk_size: int = int(
+            os.environ.get("FDA_PDF_CHUNK_SIZE", str(64 * 1024))
+        )
+        self.pdf_backend: str = os.environ.get("FDA_PDF_BACKEND", "auto")
+        self.pdf_max_concurrent: int = int(
+            os.environ.get("FDA_PDF_MAX_CONCURRENT", "4")
+        )
+        self.doc_max_in_flight: int = int(
+            os.environ.get("FDA_DOC_MAX_IN_FLIGHT", "8")
+        )
+        self.doc_max_per_host: int = int(
+            os.environ.get("FDA_DOC_MAX_PER_HOST", "6")
+        )
+        self.doc_connect_timeout: float = float(
+            os.environ.get("FDA_DOC_CONNECT_TIMEOUT", "10.0")
+        )
+        self.extract_workers: int = int(
+            os.environ.get("FDA_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1)))
+        )
+        self.cpu_jobs_max_concurrent: int = int(
+            os.environ.get("FDA_CPU_JOBS", str(max(1, (os.cpu_count() or 2) // 2)))
+        )
+        self.ocr_profile: str = os.environ.get("FDA_OCR_PROFILE", "fast")
+        self.eager_load: bool = os.environ.get(
+            "FDA_EAGER_LOAD", "0"
+        ).lower() not in ("0", "false", "no")
+        self.cache_dir: str = os.environ.get(
+            "FDA_CACHE_DIR",
+            os.path.join(
+                os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                "fda-mcp",
+            ),
+        )
+        self.blob_store_enabled: bool = os.environ.get(
+            "FDA_BLOB_STORE", "0"
+        ).lower() not in ("0", "false", "no")
+        self.blob_store_max_bytes: int = int(
+            os.environ.get("FDA_BLOB_STORE_MAX_BYTES", str(2 * 1024**3))
+        )
+        self.doc_index_enabled: bool = os.environ.get(
+            "FDA_DOC_INDEX", "1"
+        ).lower() not in ("0", "false", "no")
+        self.missing_document_ttl: float = float(
+            os.environ.get("FDA_MISSING_DOC_TTL", str(90 * 24 * 3600))
+        )
+        self.missing_document_recheck: float = float(
+            os.environ.get("FDA_MISSING_DOC_RECHECK", str(7 * 24 * 3600))
+        )
+        self.resolved_url_max_entries: int = int(
+            os.environ.get("FDA_RESOLVED_URL_MAX_ENTRIES", "100000")
+        )
+        self.doc_cache_max_chars: int = int(
+            os.environ.get("FDA_DOC_CACHE_MAX_CHARS", "20000000")
+        )
+        self.prefetch_documents: int = int(
+            os.environ.get("FDA_PREFETCH_DOCUMENTS", "0")
+        )
+        self.prefetch_concurrency: int = int(
+            os.environ.get("FDA_PREFETCH_CONCURRENCY", "1")
+        )
+        self.batch_pdf_max_length: int = int(
+            os.environ.get("FDA_PDF_BATCH_MAX_LENGTH", "30000")
+        )
 
 
 config = Config()
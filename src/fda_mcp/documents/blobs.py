@@ -0,0 +1,233 @@
+"""Content-addressable on-disk store for downloaded PDFs.
+
+When enabled (config.blob_store_enabled), downloaded PDFs are kept under
+config.cache_dir keyed by the SHA-256 of their bytes, with a URL -> hash
+reference per document. Later extractions (OCR with another profile, table
+extraction) and other server processes sharing the cache directory read
+the local copy instead of downloading again. Identical PDFs published under
+several URLs are stored once.
+
+Layout:
+    blobs/objects/ab/abcdef....pdf   PDF bytes, named by SHA-256
+    blobs/refs/<sha256 of URL>       hex digest of the URL's PDF
+    blobs/tmp/                       downloads in progress
+
+Every file is written to a temporary name and renamed into place, so
+concurrent writers never expose a partial file; when two processes store
+the same PDF the last rename wins with identical bytes.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fda_mcp.config import config
+
+_store: "BlobStore | None" = None
+
+
+class PendingBlob:
+    """A blob being written: a temp file that hashes bytes as they arrive."""
+
+    def __init__(self, directory: str) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".pdf", dir=directory)
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunk: bytes) -> int:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        return self._file.write(chunk)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "PendingBlob":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+    def discard(self) -> None:
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class BlobStore:
+    """SHA-256 keyed PDF files with a URL index and size-based eviction.
+
+    Least recently used blobs (by mtime, refreshed on every lookup) are
+    evicted once the store grows past max_bytes. Blobs pinned by a reader
+    in this process (see pinned) are never evicted. References to evicted
+    blobs are dropped lazily on lookup.
+
+    The store's size is scanned from disk on the first commit and then
+    kept as a running total, so the directory is only scanned again when
+    the total passes max_bytes. Blobs added by other processes sharing the
+    directory are counted at that next scan.
+    """
+
+    def __init__(self, root: str, max_bytes: int | None = None) -> None:
+        self.root = root
+        self._max_bytes = max_bytes
+        self._objects = os.path.join(root, "objects")
+        self._refs = os.path.join(root, "refs")
+        self._tmp = os.path.join(root, "tmp")
+        for directory in (self._objects, self._refs, self._tmp):
+            os.makedirs(directory, exist_ok=True)
+        self._total: int | None = None
+        # Blob paths being read (e.g. by an extraction), with reader counts.
+        self._pins: dict[str, int] = {}
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is None:
+            return config.blob_store_max_bytes
+        return self._max_bytes
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects, digest[:2], f"{digest}.pdf")
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self._refs, hashlib.sha256(url.encode()).hexdigest())
+
+    def lookup(self, url: str) -> str | None:
+        """Path to the stored PDF for a URL, or None if not stored."""
+        try:
+            with open(self._ref_path(url), encoding="ascii") as f:
+                digest = f.read().strip()
+        except OSError:
+            return None
+        path = self._object_path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._remove(self._ref_path(url))
+            return None
+        return path
+
+    @contextmanager
+    def pinned(self, path: str) -> Iterator[str]:
+        """Protect a stored blob from eviction while it is being read."""
+        self._pins[path] = self._pins.get(path, 0) + 1
+        try:
+            yield path
+        finally:
+            self._pins[path] -= 1
+            if not self._pins[path]:
+                del self._pins[path]
+
+    def create(self) -> PendingBlob:
+        """Start writing a new blob; pass it to commit() or discard() it."""
+        return PendingBlob(self._tmp)
+
+    def commit(self, pending: PendingBlob, url: str) -> str:
+        """Move a finished blob into place and point url at it.
+
+        Returns:
+            Path of the stored PDF.
+        """
+        pending.close()
+        digest = pending.digest
+        path = self._object_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        added = 0 if os.path.exists(path) else pending.size
+        os.replace(pending.path, path)
+
+        fd, ref_tmp = tempfile.mkstemp(dir=self._tmp)
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(digest)
+        os.replace(ref_tmp, self._ref_path(url))
+
+        if self._total is None:
+            self.evict(keep=path)
+        else:
+            self._total += added
+            if self._total > self.max_bytes:
+                self.evict(keep=path)
+        return path
+
+    def evict(self, keep: str | None = None) -> int:
+        """Delete least recently used blobs until the store fits max_bytes.
+
+        Args:
+            keep: A blob that must survive (the one just written). Pinned
+                blobs survive too.
+
+        Returns:
+            Number of blobs removed.
+        """
+        blobs = []
+        total = 0
+        for entry in _scan_files(self._objects):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        blobs.sort()
+
+        removed = 0
+        for _, size, path in blobs:
+            if total <= self.max_bytes:
+                break
+            if path == keep or path in self._pins:
+                continue
+            self._remove(path)
+            total -= size
+            removed += 1
+        self._total = total
+        self._sweep_tmp()
+        return removed
+
+    def _sweep_tmp(self, max_age: float = 3600) -> None:
+        """Remove temp files abandoned by crashed writers."""
+        cutoff = time.time() - max_age
+        for entry in _scan_files(self._tmp):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _scan_files(directory: str):
+    """Yield the files under directory, recursively."""
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            yield from _scan_files(entry.path)
+        elif entry.is_file():
+            yield entry
+
+
+def get_blob_store() -> BlobStore | None:
+    """The process-wide blob store, or None when disabled."""
+    global _store
+    if not config.blob_store_enabled:
+        return None
+    if _store is None:
+        _store = BlobStore(os.path.join(config.cache_dir, "blobs"))
+    return _store
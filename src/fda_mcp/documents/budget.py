@@ -0,0 +1,26 @@
+"""Fair splitting of an output budget across documents or sections."""
+
+
+def allocate_budget(sizes: list[int], total: int) -> list[int]:
+    """Split a shared character budget fairly across items.
+
+    Every item gets an equal share; items shorter than their share give the
+    unused remainder back to the longer ones.
+
+    Args:
+        sizes: Full size of each item.
+        total: Total budget to distribute.
+
+    Returns:
+        Allowance per item, in the same order as sizes. Allowances never
+        exceed the item's size and sum to at most total.
+    """
+    allowances = [0] * len(sizes)
+    remaining = total
+    pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    while pending:
+        share = remaining // len(pending)
+        i = pending.pop(0)
+        allowances[i] = min(sizes[i], share)
+        remaining -= allowances[i]
+    return allowances
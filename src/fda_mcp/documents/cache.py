@@ -0,0 +1,79 @@
+"""In-memory cache of extracted decision-document text."""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from fda_mcp.config import config
+
+if TYPE_CHECKING:
+    from fda_mcp.documents.fetcher import ExtractedDocument
+
+
+def document_size(doc: "ExtractedDocument") -> int:
+    """Characters a cached document holds: its text plus any table cells."""
+    size = len(doc.text)
+    for table in doc.tables or ():
+        size += sum(len(cell) + 1 for row in table.rows for cell in row)
+    return size
+
+
+class DocumentCache:
+    """LRU of extracted documents keyed by URL, bounded by total characters.
+
+    Bounding by size (document_size) rather than entry count keeps one huge
+    scanned PMA from costing the same as a two-page 510(k) summary. A
+    document whose tables were extracted after it was cached is put again
+    to re-count it.
+    """
+
+    def __init__(self, max_chars: int | None = None) -> None:
+        self._max_chars = max_chars
+        self._entries: OrderedDict[str, "ExtractedDocument"] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_chars(self) -> int:
+        if self._max_chars is None:
+            return config.doc_cache_max_chars
+        return self._max_chars
+
+    def get(self, url: str) -> "ExtractedDocument | None":
+        doc = self._entries.get(url)
+        if doc is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(url)
+        self.hits += 1
+        return doc
+
+    def put(self, doc: "ExtractedDocument") -> None:
+        if self._entries.pop(doc.url, None) is not None:
+            self._chars -= self._sizes.pop(doc.url)
+        size = document_size(doc)
+        if size > self.max_chars:
+            return
+        self._entries[doc.url] = doc
+        self._sizes[doc.url] = size
+        self._chars += size
+        while self._chars > self.max_chars:
+            url, _ = self._entries.popitem(last=False)
+            self._chars -= self._sizes.pop(url)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+
+
+document_cache = DocumentCache()
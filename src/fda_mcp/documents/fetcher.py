@@ -1,22 +1,126 @@
-"""PDF download and text extraction with OCR fallback."""
+"""PDF download and text extraction with OCR fallback.
 
+The PDF stack (pdfplumber/pdfminer, Pillow, pytesseract, pdf2image) and
+the poppler/tesseract availability probes are loaded on first use, not at
+import, so server sessions that never touch documents don't pay for them.
+Call warm_up() to load everything eagerly.
+"""
+
+import asyncio
 import os
 import shutil
+import subprocess
 import tempfile
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
 
 import httpx
-import pdfplumber
+from mcp.server.fastmcp.exceptions import ToolError
 
 from fda_mcp.config import config
-from fda_mcp.errors import DocumentNotFoundError
+from fda_mcp.documents.blobs import get_blob_store
+from fda_mcp.documents.cache import document_cache
+from fda_mcp.documents.http import DocumentClient, document_client
+from fda_mcp.documents.index import index_document
+from fda_mcp.documents.jobs import Priority, check_cancelled, cpu_jobs
+from fda_mcp.documents.sections import Section, detect_sections
+from fda_mcp.errors import (
+    DocumentNotFoundError,
+    DocumentTooLargeError,
+    InvalidDocumentError,
+)
+
+if TYPE_CHECKING:
+    from fda_mcp.documents.ocr import OCRProfile
+
+# Tool availability, probed on first use (None = not probed yet).
+_PDFTOTEXT_AVAILABLE: bool | None = None
+OCR_AVAILABLE: bool | None = None
+
+
+def pdftotext_available() -> bool:
+    """Whether poppler's pdftotext is on PATH."""
+    global _PDFTOTEXT_AVAILABLE
+    if _PDFTOTEXT_AVAILABLE is None:
+        _PDFTOTEXT_AVAILABLE = shutil.which("pdftotext") is not None
+    return _PDFTOTEXT_AVAILABLE
+
+
+def ocr_available() -> bool:
+    """Whether tesseract and poppler's pdftoppm are on PATH."""
+    global OCR_AVAILABLE
+    if OCR_AVAILABLE is None:
+        OCR_AVAILABLE = (
+            shutil.which("tesseract") is not None
+            and shutil.which("pdftoppm") is not None
+        )
+    return OCR_AVAILABLE
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `fetcher.pdfplumber` working as an attribute without importing
+    # it at module load.
+    if name == "pdfplumber":
+        import pdfplumber
+
+        return pdfplumber
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# A text-extraction backend takes a PDF path and returns (text, page_count).
+ExtractionBackend = Callable[[str], tuple[str, int]]
+
+# Backends in order of preference for "auto" selection. On a sample of
+# text-layer 510(k) summaries (see benchmarks/bench_extraction.py) poppler's
+# pdftotext is several times faster than pdfplumber and keeps the parsed
+# page objects out of the Python heap entirely.
+EXTRACTION_BACKENDS = ("pdftotext", "pdfplumber")
+
+_executor: ThreadPoolExecutor | None = None
+
+# Downloads in progress, keyed by URL, the number of callers awaiting
+# each, the subset started by prefetch, and the subset some caller wants
+# tables from.
+_inflight: dict[str, "asyncio.Future[ExtractedDocument]"] = {}
+_waiters: dict[str, int] = {}
+_speculative: set[str] = set()
+_with_tables: set[str] = set()
+
+
+@dataclass
+class ExtractedDocument:
+    """Full text extracted from one FDA decision document PDF."""
 
-_TESSERACT_AVAILABLE = shutil.which("tesseract") is not None
-_PDFTOPPM_AVAILABLE = shutil.which("pdftoppm") is not None
-OCR_AVAILABLE = _TESSERACT_AVAILABLE and _PDFTOPPM_AVAILABLE
+    url: str
+    text: str
+    page_count: int
+    method: str
+    needs_ocr: bool = False
+    # Section offset table (documents.sections), detected at extraction.
+    sections: list[Section] | None = field(default=None, repr=False)
+    # Tables (documents.tables), extracted on demand.
+    tables: list | None = field(default=None, repr=False)
+    # Passage index for query retrieval, built lazily by documents.retrieval.
+    search_index: Any = field(default=None, repr=False, compare=False)
+
+
+# Content types accepted as a PDF body. accessdata.fda.gov serves an HTML
+# page for some missing documents instead of a 404, so anything else is
+# rejected before the body is downloaded.
+_PDF_CONTENT_TYPES = frozenset({
+    "application/pdf",
+    "application/x-pdf",
+    "application/octet-stream",
+    "binary/octet-stream",
+})
 
 
 def _extract_with_pdfplumber(pdf_path: str) -> tuple[str, int]:
     """Extract text using pdfplumber. Returns (text, page_count)."""
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
         text = ""
         for page in pdf.pages:
@@ -24,74 +128,444 @@ def _extract_with_pdfplumber(pdf_path: str) -> tuple[str, int]:
         return text, len(pdf.pages)
 
 
-def _extract_with_ocr(pdf_path: str, max_pages: int = 20) -> str:
-    """OCR fallback for scanned PDFs. Requires tesseract + poppler."""
+def _extract_with_pdftotext(pdf_path: str) -> tuple[str, int]:
+    """Extract text using poppler's pdftotext. Returns (text, page_count).
+
+    Falls back to pdfplumber if the subprocess fails, e.g. on a PDF that
+    poppler cannot parse.
+    """
+    try:
+        result = subprocess.run(
+            ["pdftotext", "-enc", "UTF-8", pdf_path, "-"],
+            capture_output=True,
+            check=True,
+            timeout=config.pdf_timeout,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return _extract_with_pdfplumber(pdf_path)
+
+    # pdftotext terminates every page with a form feed.
+    pages = result.stdout.decode("utf-8", errors="replace").split("\f")
+    if pages and not pages[-1].strip():
+        pages.pop()
+    text = "".join(page.rstrip("\n") + "\n" for page in pages)
+    return text, len(pages)
+
+
+def _backend_available(name: str) -> bool:
+    """Whether an extraction backend can run on this host."""
+    if name == "pdftotext":
+        return pdftotext_available()
+    return name == "pdfplumber"
+
+
+def select_backend(preferred: str | None = None) -> str:
+    """Resolve the extraction backend name to use.
+
+    Args:
+        preferred: "auto", or one of EXTRACTION_BACKENDS. Defaults to
+            config.pdf_backend. An unavailable backend falls back to the
+            fastest available one.
+
+    Returns:
+        Name of an available backend.
+    """
+    if preferred is None:
+        preferred = config.pdf_backend
+    if preferred != "auto" and _backend_available(preferred):
+        return preferred
+    for name in EXTRACTION_BACKENDS:
+        if _backend_available(name):
+            return name
+    return "pdfplumber"
+
+
+def _get_backend(name: str) -> ExtractionBackend:
+    """Look up the extraction function for a backend name."""
+    if name == "pdftotext":
+        return _extract_with_pdftotext
+    return _extract_with_pdfplumber
+
+
+def _extract_with_ocr(
+    pdf_path: str, max_pages: int = 20, profile: "OCRProfile | None" = None
+) -> str:
+    """OCR fallback for scanned PDFs. Requires tesseract + poppler.
+
+    Pages are rendered and recognised one at a time with the settings of
+    the given OCR profile (config.ocr_profile by default). Runs as a
+    cpu_jobs job and stops between pages once cancelled.
+    """
     import pytesseract
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    from pdf2image.exceptions import PDFInfoNotInstalledError, PDFPageCountError
+
+    from fda_mcp.documents.ocr import (
+        get_profile,
+        parse_page_size,
+        preprocess,
+        render_dpi,
+    )
+
+    if profile is None:
+        profile = get_profile()
+    try:
+        info = pdfinfo_from_path(pdf_path)
+    except (PDFInfoNotInstalledError, PDFPageCountError, OSError, ValueError):
+        info = {}
+    dpi = render_dpi(parse_page_size(info.get("Page size")), profile)
+    pages = min(max_pages, int(info.get("Pages") or max_pages))
 
-    images = convert_from_path(pdf_path, last_page=max_pages)
     text = ""
-    for i, img in enumerate(images):
-        text += f"\n--- Page {i + 1} ---\n"
-        text += pytesseract.image_to_string(img)
+    for number in range(1, pages + 1):
+        check_cancelled()
+        images = convert_from_path(
+            pdf_path, dpi=dpi, first_page=number, last_page=number,
+            grayscale=profile.grayscale,
+        )
+        if not images:
+            break
+        image = preprocess(images[0], profile)
+        text += f"\n--- Page {number} ---\n"
+        text += pytesseract.image_to_string(image, config=profile.tesseract_config)
     return text
 
 
-async def fetch_and_extract_pdf(url: str, max_length: int = 8000) -> str:
-    """Download a PDF from a URL and extract its text content.
+def _check_content_type(url: str, content_type: str | None) -> None:
+    """Raise InvalidDocumentError if the response is clearly not a PDF."""
+    if not content_type:
+        return
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in _PDF_CONTENT_TYPES:
+        raise InvalidDocumentError(url, media_type)
+
 
-    Uses pdfplumber for machine-generated PDFs, falls back to OCR
-    for scanned documents (when tesseract + poppler are available).
+async def _download_pdf(
+    url: str, dest, client: httpx.AsyncClient | DocumentClient | None = None
+) -> None:
+    """Stream a PDF into an open binary file, chunk by chunk.
+
+    Only one chunk is held in memory at a time. The download is aborted as
+    soon as the content type or size rules out a usable PDF.
 
     Args:
         url: URL to the PDF document.
-        max_length: Maximum characters of text to return.
-
-    Returns:
-        Extracted text with metadata header.
+        dest: Binary file object to write the body to.
+        client: Client to download with. Defaults to the shared
+            document_client, which applies the document traffic limits.
 
     Raises:
         DocumentNotFoundError: If the PDF is not found (404).
+        InvalidDocumentError: If the server returns a non-PDF content type.
+        DocumentTooLargeError: If the body exceeds config.pdf_max_bytes.
     """
-    async with httpx.AsyncClient(
-        timeout=config.pdf_timeout, follow_redirects=True
-    ) as client:
-        response = await client.get(url)
+    if client is None:
+        client = document_client
+
+    max_bytes = config.pdf_max_bytes
+    async with client.stream("GET", url) as response:
         if response.status_code == 404:
             raise DocumentNotFoundError(url)
         response.raise_for_status()
+        _check_content_type(url, response.headers.get("content-type"))
+
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise DocumentTooLargeError(url, max_bytes)
+
+        received = 0
+        async for chunk in response.aiter_bytes(config.pdf_chunk_size):
+            received += len(chunk)
+            if received > max_bytes:
+                raise DocumentTooLargeError(url, max_bytes)
+            dest.write(chunk)
+
 
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-        tmp.write(response.content)
-        tmp_path = tmp.name
+@asynccontextmanager
+async def local_pdf(url: str, client: httpx.AsyncClient | None = None):
+    """Provide a local file path holding the PDF at url.
 
+    With the blob store enabled, a stored copy is used when present and a
+    fresh download is added to the store; either way the blob is pinned
+    against eviction until exit. Otherwise the PDF is downloaded to a temp
+    file that is deleted on exit.
+
+    Yields:
+        Path to the PDF on disk.
+    """
+    store = get_blob_store()
+    if store is not None:
+        path = store.lookup(url)
+        if path is None:
+            pending = store.create()
+            try:
+                with pending:
+                    await _download_pdf(url, pending, client)
+                path = store.commit(pending, url)
+            except BaseException:
+                pending.discard()
+                raise
+        with store.pinned(path):
+            yield path
+        return
+
+    tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
     try:
-        text, page_count = _extract_with_pdfplumber(tmp_path)
-
-        extraction_method = "text extraction"
-        if len(text.strip()) < 100 and OCR_AVAILABLE:
-            text = _extract_with_ocr(tmp_path)
-            extraction_method = "OCR (scanned document)"
-        elif len(text.strip()) < 100 and not OCR_AVAILABLE:
-            return (
-                f"Source: {url}\n"
-                f"Pages: {page_count}\n"
-                f"This appears to be a scanned document. "
-                f"Text extraction returned no content.\n"
-                f"Install tesseract-ocr and poppler-utils for OCR support:\n"
-                f"  macOS: brew install tesseract poppler\n"
-                f"  Linux: apt install tesseract-ocr poppler-utils\n"
+        with tmp:
+            await _download_pdf(url, tmp, client)
+        yield tmp.name
+    finally:
+        os.unlink(tmp.name)
+
+
+def warm_up() -> None:
+    """Load the PDF/OCR stack and probe external tools now.
+
+    For long-running servers that would rather pay this at startup than
+    on the first document request (see config.eager_load).
+    """
+    import pdfplumber  # noqa: F401
+
+    from fda_mcp.documents import ocr, tables  # noqa: F401
+
+    pdftotext_available()
+    if ocr_available():
+        import pdf2image  # noqa: F401
+        import pytesseract  # noqa: F401
+        from PIL import Image, ImageOps  # noqa: F401
+    _get_executor()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker pool for blocking PDF extraction, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=config.extract_workers,
+            thread_name_prefix="fda-extract",
+        )
+    return _executor
+
+
+def _extract_file(url: str, pdf_path: str) -> ExtractedDocument:
+    """Extract text from a downloaded PDF. Blocking; runs in the worker pool.
+
+    Returns a needs_ocr document when the PDF has no usable text layer.
+    """
+    backend = select_backend()
+    text, page_count = _get_backend(backend)(pdf_path)
+
+    if len(text.strip()) >= 100:
+        return ExtractedDocument(
+            url, text, page_count, f"text extraction ({backend})",
+            sections=detect_sections(text),
+        )
+    return ExtractedDocument(url, "", page_count, "none", needs_ocr=True)
+
+
+async def _download_and_extract(
+    url: str,
+    client: httpx.AsyncClient | None,
+    priority: Priority = Priority.INTERACTIVE,
+    tables: bool = False,
+) -> ExtractedDocument:
+    """Download a PDF (see local_pdf) and extract it in the worker pool.
+
+    Scanned documents are OCRed as a cpu_jobs job at the given priority.
+    With tables (or once a caller joining the download asks for them, see
+    _with_tables), the document's tables are extracted from the same file
+    before it is released.
+    """
+    async with local_pdf(url, client) as pdf_path:
+        loop = asyncio.get_running_loop()
+        doc = await loop.run_in_executor(
+            _get_executor(), _extract_file, url, pdf_path
+        )
+        if doc.needs_ocr and ocr_available():
+            text = await cpu_jobs.run(
+                ("ocr", url), _extract_with_ocr, pdf_path, priority=priority
             )
+            doc = ExtractedDocument(
+                url, text, doc.page_count, "OCR (scanned document)",
+                sections=detect_sections(text),
+            )
+        await loop.run_in_executor(_get_executor(), index_document, doc)
+        if tables or url in _with_tables:
+            from fda_mcp.documents.tables import extract_tables_from_file
+
+            await extract_tables_from_file(doc, pdf_path)
+    document_cache.put(doc)
+    return doc
+
+
+async def extract_document(
+    url: str,
+    client: httpx.AsyncClient | None = None,
+    speculative: bool = False,
+    tables: bool = False,
+) -> ExtractedDocument:
+    """Download a PDF and extract its full text, using the document cache.
+
+    The body is streamed straight to disk and extracted from the file in
+    place, so memory use is bounded by the chunk size, not the PDF size.
+    Extraction runs in the worker pool to keep the event loop responsive.
+    Concurrent requests for the same URL share one download, which is
+    cancelled (along with any queued OCR job) once every caller awaiting
+    it has been cancelled.
+
+    Args:
+        url: URL to the PDF document.
+        client: Optional HTTP client (see _download_pdf).
+        speculative: True for prefetches. A speculative download can be
+            cancelled with cancel_speculative until a real request joins it.
+        tables: Also extract the document's tables (documents.tables) while
+            the downloaded PDF is at hand, so they need no second download.
+            Joining a download started without tables upgrades it, unless
+            its text extraction has already finished.
+
+    Raises:
+        DocumentNotFoundError: If the PDF is not found (404).
+        InvalidDocumentError: If the server returns a non-PDF content type.
+        DocumentTooLargeError: If the PDF exceeds config.pdf_max_bytes.
+    """
+    cached = document_cache.get(url)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(url)
+    if tables:
+        _with_tables.add(url)
+    if task is None:
+        priority = Priority.PREFETCH if speculative else Priority.INTERACTIVE
+        task = asyncio.ensure_future(
+            _download_and_extract(url, client, priority, tables)
+        )
+        _inflight[url] = task
+        task.add_done_callback(lambda _: _download_done(url))
+        if speculative:
+            _speculative.add(url)
+    elif not speculative:
+        # A real request now depends on this download; keep it alive and
+        # move its OCR job (if queued) ahead of other prefetches.
+        _speculative.discard(url)
+        cpu_jobs.promote(("ocr", url))
+
+    # Shielded so a cancelled caller doesn't abort a download others share;
+    # the last caller to leave cancels it.
+    _waiters[url] = _waiters.get(url, 0) + 1
+    try:
+        return await asyncio.shield(task)
     finally:
-        os.unlink(tmp_path)
+        _waiters[url] -= 1
+        if not _waiters[url]:
+            del _waiters[url]
+            if not task.done():
+                task.cancel()
+
+
+def _download_done(url: str) -> None:
+    _inflight.pop(url, None)
+    _with_tables.discard(url)
+
+
+def cancel_speculative(urls: list[str]) -> int:
+    """Cancel in-flight prefetch downloads that no real request has joined.
+
+    Returns:
+        Number of downloads cancelled.
+    """
+    cancelled = 0
+    for url in urls:
+        task = _inflight.get(url)
+        if url in _speculative and task is not None and not task.done():
+            task.cancel()
+            cancelled += 1
+        _speculative.discard(url)
+    return cancelled
 
-    truncated = len(text) > max_length
-    text = text[:max_length]
 
-    header = f"Source: {url}\nPages: {page_count}\nExtraction: {extraction_method}\n"
+def format_document(doc: ExtractedDocument, max_length: int) -> str:
+    """Render an extracted document with its metadata header.
+
+    Args:
+        doc: The extracted document.
+        max_length: Maximum characters of document text to include.
+
+    Returns:
+        Metadata header, a blank line, then at most max_length characters.
+    """
+    if doc.needs_ocr:
+        return (
+            f"Source: {doc.url}\n"
+            f"Pages: {doc.page_count}\n"
+            f"This appears to be a scanned document. "
+            f"Text extraction returned no content.\n"
+            f"Install tesseract-ocr and poppler-utils for OCR support:\n"
+            f"  macOS: brew install tesseract poppler\n"
+            f"  Linux: apt install tesseract-ocr poppler-utils\n"
+        )
+
+    truncated = len(doc.text) > max_length
+    text = doc.text[:max_length]
+
+    header = (
+        f"Source: {doc.url}\nPages: {doc.page_count}\n"
+        f"Extraction: {doc.method}\n"
+    )
     if truncated:
         header += (
             f"[Truncated to {max_length} chars. Full document is longer. "
             f"Call again with a larger max_length to see more.]\n"
         )
     return header + "\n" + text
+
+
+async def fetch_and_extract_pdf(url: str, max_length: int = 8000) -> str:
+    """Download a PDF from a URL and extract its text content.
+
+    Uses the selected text-extraction backend (pdftotext or pdfplumber) for
+    machine-generated PDFs, falls back to OCR for scanned documents
+    (when tesseract + poppler are available).
+
+    Args:
+        url: URL to the PDF document.
+        max_length: Maximum characters of text to return.
+
+    Returns:
+        Extracted text with metadata header.
+
+    Raises:
+        DocumentNotFoundError: If the PDF is not found (404).
+        InvalidDocumentError: If the server returns a non-PDF content type.
+        DocumentTooLargeError: If the PDF exceeds config.pdf_max_bytes.
+    """
+    doc = await extract_document(url)
+    return format_document(doc, max_length)
+
+
+async def extract_documents(
+    urls: list[str],
+) -> list[ExtractedDocument | Exception]:
+    """Download and extract several PDFs concurrently.
+
+    Downloads go through the shared document_client and at most
+    config.pdf_max_concurrent from one batch run at once; extraction runs
+    in the worker pool. Failures are isolated per document.
+
+    Args:
+        urls: PDF URLs to fetch.
+
+    Returns:
+        One entry per URL, in order: the ExtractedDocument, or the
+        ToolError / httpx.HTTPError that document failed with.
+    """
+    semaphore = asyncio.Semaphore(config.pdf_max_concurrent)
+
+    async def _one(url: str) -> ExtractedDocument | Exception:
+        async with semaphore:
+            try:
+                return await extract_document(url)
+            except (ToolError, httpx.HTTPError) as exc:
+                return exc
+
+    return list(await asyncio.gather(*(_one(url) for url in urls)))
@@ -0,0 +1,110 @@
+"""Long-lived HTTP client for FDA document servers (accessdata.fda.gov).
+
+PDF downloads are large and slow, and URL probes come in bursts of one
+request per candidate location. All of it goes through one pooled client,
+separate from the openFDA API client, so keep-alive connections are reused
+across requests. Two limits apply to every request: at most
+config.doc_max_in_flight overall and config.doc_max_per_host per host. A
+bulk document pull therefore can't exhaust sockets needed for
+api.fda.gov queries, and API bursts don't stall downloads.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+
+from fda_mcp.config import config
+
+
+async def _close_stale(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a client left over from another event loop.
+
+    A loop still running (in another thread) closes its own client; one
+    that has stopped can't, so the client is closed from the current loop.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # Transports of a closed loop can refuse to close; their sockets
+        # are released when the client is collected.
+        pass
+
+
+class DocumentClient:
+    """Shared, connection-pooled client with in-flight and per-host caps.
+
+    The underlying httpx client and semaphores belong to the event loop
+    they were created on. If a different loop uses them, they are
+    recreated and the old client is closed, releasing its connections.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: asyncio.Semaphore | None = None
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                await _close_stale(self._client, self._loop)
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    config.pdf_timeout, connect=config.doc_connect_timeout
+                ),
+                limits=httpx.Limits(
+                    max_connections=config.doc_max_in_flight,
+                    max_keepalive_connections=config.doc_max_in_flight,
+                ),
+                follow_redirects=True,
+            )
+            self._in_flight = asyncio.Semaphore(config.doc_max_in_flight)
+            self._hosts = {}
+        return self._client
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold an in-flight slot and a slot for url's host."""
+        client = await self._get_client()
+        host = urlsplit(url).hostname or ""
+        host_limit = self._hosts.get(host)
+        if host_limit is None:
+            host_limit = self._hosts[host] = asyncio.Semaphore(config.doc_max_per_host)
+        async with self._in_flight, host_limit:
+            yield client
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        async with self._slot(url) as client:
+            return await client.head(url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        async with self._slot(url) as client:
+            return await client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """Stream a response; the slots are held until the body is consumed."""
+        async with self._slot(url) as client:
+            async with client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+document_client = DocumentClient()
@@ -0,0 +1,207 @@
+"""Persistent full-text index over every decision document ever extracted.
+
+Extracted 510(k), De Novo and PMA texts are added to a SQLite FTS5 table
+under config.cache_dir as they are fetched, so later searches ("which
+summaries cite predicate K123456") run locally in milliseconds with no
+network access.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mcp.server.fastmcp.exceptions import ToolError
+
+from fda_mcp.config import config
+from fda_mcp.documents.urls import parse_document_url
+
+if TYPE_CHECKING:
+    from fda_mcp.documents.fetcher import ExtractedDocument
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    url UNINDEXED,
+    document_type UNINDEXED,
+    submission_number,
+    supplement_number UNINDEXED,
+    text,
+    tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS document_meta (
+    url TEXT PRIMARY KEY,
+    page_count INTEGER,
+    method TEXT,
+    indexed_at REAL,
+    doc_rowid INTEGER
+);
+"""
+
+# Indexes created before document_meta recorded each document's FTS rowid.
+# The rowids are filled in once, so re-indexing deletes by rowid instead of
+# scanning the UNINDEXED url column.
+_MIGRATE_ROWID = """
+ALTER TABLE document_meta ADD COLUMN doc_rowid INTEGER;
+UPDATE document_meta SET doc_rowid = (
+    SELECT rowid FROM documents WHERE documents.url = document_meta.url
+);
+"""
+
+
+@dataclass
+class IndexHit:
+    """One document matching a full-text query."""
+
+    url: str
+    document_type: str
+    submission_number: str
+    supplement_number: str | None
+    snippet: str
+    score: float
+
+
+class DocumentIndex:
+    """SQLite FTS5 index of extracted decision-document text.
+
+    One connection is shared across threads behind a lock; writes come
+    from the extraction worker pool and reads from tool calls.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(document_meta)")
+            }
+            if "doc_rowid" not in columns:
+                with conn:
+                    conn.executescript(_MIGRATE_ROWID)
+            self._conn = conn
+        return self._conn
+
+    def add(self, doc: "ExtractedDocument") -> bool:
+        """Index (or re-index) a document.
+
+        Returns:
+            False if the document has no text or is not a recognizable
+            decision-document URL, True otherwise.
+        """
+        identifier = parse_document_url(doc.url)
+        if identifier is None or not doc.text.strip():
+            return False
+        document_type, number, supplement = identifier
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute(
+                    "SELECT doc_rowid FROM document_meta WHERE url = ?", (doc.url,)
+                ).fetchone()
+                if row is not None and row[0] is not None:
+                    conn.execute("DELETE FROM documents WHERE rowid = ?", row)
+                rowid = conn.execute(
+                    "INSERT INTO documents VALUES (?, ?, ?, ?, ?)",
+                    (doc.url, document_type, number, supplement, doc.text),
+                ).lastrowid
+                conn.execute(
+                    "INSERT OR REPLACE INTO document_meta "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (doc.url, doc.page_count, doc.method, time.time(), rowid),
+                )
+        return True
+
+    def count(self) -> int:
+        """Number of indexed documents."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*) FROM document_meta"
+            ).fetchone()
+        return row[0]
+
+    def search(
+        self,
+        query: str,
+        document_type: str | None = None,
+        limit: int = 10,
+    ) -> list[IndexHit]:
+        """Full-text search across indexed documents, best match first.
+
+        Args:
+            query: FTS5 query. Phrases in double quotes, AND/OR/NOT and
+                prefix* are supported. Text that is not valid FTS5 syntax
+                is searched as plain terms.
+            document_type: Restrict to one document type.
+            limit: Maximum number of documents to return.
+
+        Raises:
+            ToolError: If the query contains no searchable terms.
+        """
+        try:
+            return self._search(query, document_type, limit)
+        except sqlite3.OperationalError:
+            terms = [t for t in query.replace('"', " ").split() if t]
+            if not terms:
+                raise ToolError("query must contain at least one search term.")
+            plain = " ".join(f'"{t}"' for t in terms)
+            return self._search(plain, document_type, limit)
+
+    def _search(
+        self, query: str, document_type: str | None, limit: int
+    ) -> list[IndexHit]:
+        sql = (
+            "SELECT url, document_type, submission_number, supplement_number, "
+            "snippet(documents, 4, '[', ']', ' … ', 24), bm25(documents) "
+            "FROM documents WHERE documents MATCH ?"
+        )
+        params: list = [query]
+        if document_type:
+            sql += " AND document_type = ?"
+            params.append(document_type)
+        sql += " ORDER BY bm25(documents) LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            IndexHit(url, dtype, number, supplement, snippet, -score)
+            for url, dtype, number, supplement, snippet, score in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_index: DocumentIndex | None = None
+
+
+def get_document_index() -> DocumentIndex:
+    """Document index under config.cache_dir, created on first use."""
+    global _index
+    if _index is None:
+        _index = DocumentIndex(os.path.join(config.cache_dir, "documents.db"))
+    return _index
+
+
+def index_document(doc: "ExtractedDocument") -> None:
+    """Add a freshly extracted document to the index if indexing is on.
+
+    Indexing is best-effort: a locked or unwritable database never fails
+    the fetch that produced the document.
+    """
+    if not config.doc_index_enabled:
+        return
+    try:
+        get_document_index().add(doc)
+    except sqlite3.Error:
+        pass
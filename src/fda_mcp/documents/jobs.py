@@ -0,0 +1,220 @@
+"""Scheduler for CPU-heavy document jobs (OCR, table extraction).
+
+tesseract and pdf2image each saturate a core per page, so a few scanned
+PMAs requested at once can starve the rest of the host. Every heavy job
+goes through one JobScheduler, which runs at most
+config.cpu_jobs_max_concurrent of them at a time, starts interactive jobs
+before prefetch jobs, and runs identical jobs (same key) only once.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Hashable
+
+from fda_mcp.config import config
+
+
+class Priority(IntEnum):
+    """Job priority classes; lower values run first."""
+
+    INTERACTIVE = 0
+    PREFETCH = 1
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once every caller has gone away."""
+
+
+_current = threading.local()
+
+
+def check_cancelled() -> None:
+    """Abort the calling job if it has been cancelled.
+
+    Long-running job functions call this between pages. Outside a
+    scheduled job it does nothing.
+    """
+    event = getattr(_current, "cancelled", None)
+    if event is not None and event.is_set():
+        raise JobCancelled()
+
+
+@dataclass
+class _Job:
+    key: Hashable
+    fn: Callable[..., Any]
+    args: tuple
+    priority: int
+    future: asyncio.Future
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    waiters: int = 0
+    started: bool = False
+    # The job's live heap entry, [priority, seq, job]; see JobScheduler._push.
+    entry: list | None = None
+
+
+@dataclass
+class JobStats:
+    """Point-in-time scheduler metrics."""
+
+    queued: dict[str, int]
+    running: int
+    completed: int
+    deduplicated: int
+    cancelled: int
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self.queued.values())
+
+
+class JobScheduler:
+    """Priority queue in front of a fixed pool of CPU job slots.
+
+    Jobs are awaited through run(). A job whose callers are all cancelled
+    is dropped if it hasn't started, or asked to stop at its next
+    check_cancelled() if it has.
+
+    Heap entries are deleted lazily: promoting or cancelling a queued job
+    clears the job out of its entry, and _dispatch skips cleared entries.
+    """
+
+    def __init__(self, max_concurrent: int | None = None) -> None:
+        self._max_concurrent = max_concurrent
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: list[list] = []
+        self._jobs: dict[Hashable, _Job] = {}
+        self._seq = itertools.count()
+        self._running = 0
+        self.completed = 0
+        self.deduplicated = 0
+        self.cancelled = 0
+
+    @property
+    def max_concurrent(self) -> int:
+        if self._max_concurrent is None:
+            return max(1, config.cpu_jobs_max_concurrent)
+        return self._max_concurrent
+
+    def stats(self) -> JobStats:
+        queued = {p.name.lower(): 0 for p in Priority}
+        for job in self._jobs.values():
+            if not job.started:
+                queued[Priority(job.priority).name.lower()] += 1
+        return JobStats(
+            queued, self._running, self.completed, self.deduplicated, self.cancelled
+        )
+
+    async def run(
+        self,
+        key: Hashable,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Any:
+        """Run fn(*args) in a job slot and return its result.
+
+        Args:
+            key: Identity of the job. A call with the key of a queued or
+                running job waits for that job instead of starting another.
+            fn: Blocking function to run in a worker thread.
+            priority: Joining a queued job with a higher priority promotes it.
+
+        Raises:
+            Whatever fn raises, or asyncio.CancelledError.
+        """
+        job = self._jobs.get(key)
+        if job is None:
+            job = _Job(key, fn, args, priority, asyncio.get_running_loop().create_future())
+            self._jobs[key] = job
+            self._push(job)
+        else:
+            self.deduplicated += 1
+            if priority < job.priority:
+                self.promote(key, priority)
+
+        job.waiters += 1
+        try:
+            return await asyncio.shield(job.future)
+        finally:
+            job.waiters -= 1
+            if job.waiters == 0 and not job.future.done():
+                self._cancel(job)
+            self._dispatch()
+
+    def promote(self, key: Hashable, priority: Priority = Priority.INTERACTIVE) -> bool:
+        """Raise the priority of a queued job. Returns True if it moved."""
+        job = self._jobs.get(key)
+        if job is None or job.started or priority >= job.priority:
+            return False
+        job.priority = priority
+        self._push(job)
+        return True
+
+    def _push(self, job: _Job) -> None:
+        """Queue a job, replacing its previous heap entry if it has one."""
+        self._unqueue(job)
+        job.entry = [job.priority, next(self._seq), job]
+        heapq.heappush(self._queue, job.entry)
+        self._dispatch()
+
+    @staticmethod
+    def _unqueue(job: _Job) -> None:
+        if job.entry is not None:
+            job.entry[2] = None
+            job.entry = None
+
+    def _cancel(self, job: _Job) -> None:
+        self.cancelled += 1
+        self._unqueue(job)
+        job.cancelled.set()
+        job.future.cancel()
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+
+    def _dispatch(self) -> None:
+        while self._queue and self._running < self.max_concurrent:
+            job = heapq.heappop(self._queue)[2]
+            if job is None or job.future.done():
+                continue
+            job.entry = None
+            job.started = True
+            self._running += 1
+            loop = job.future.get_loop()
+            work = loop.run_in_executor(self._get_executor(), self._call, job)
+            work.add_done_callback(lambda w, job=job: self._finish(job, w))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent, thread_name_prefix="fda-cpu"
+            )
+        return self._executor
+
+    @staticmethod
+    def _call(job: _Job) -> Any:
+        _current.cancelled = job.cancelled
+        try:
+            return job.fn(*job.args)
+        finally:
+            _current.cancelled = None
+
+    def _finish(self, job: _Job, work: asyncio.Future) -> None:
+        self._running -= 1
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if not job.future.done():
+            self.completed += 1
+            if work.exception() is not None:
+                job.future.set_exception(work.exception())
+            else:
+                job.future.set_result(work.result())
+        self._dispatch()
+
+
+cpu_jobs = JobScheduler()
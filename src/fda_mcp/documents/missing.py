@@ -0,0 +1,154 @@
+"""Persistent registry of decision documents known not to exist.
+
+Agents often ask for documents FDA never published (exempt or pre-1996
+510(k)s, supplements without a letter). Once every candidate location has
+404'd, the document key is recorded here for config.missing_document_ttl
+seconds, so repeat requests fail without touching the network.
+
+Entries live in SQLite under config.cache_dir (shared by server
+processes). An in-memory Bloom filter sits in front of the table: most
+lookups are for documents that are *not* known missing, and the filter
+answers those without a database query. Entries older than
+config.missing_document_recheck are still honoured but flagged for
+re-verification, since FDA does occasionally post old documents late.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from fda_mcp.config import config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS missing_documents (
+    key TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+_registry: "MissingRegistry | None" = None
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no deletion)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class MissingRegistry:
+    """Document keys confirmed missing, with a Bloom filter front.
+
+    Expired entries are purged and the filter is built from the table on
+    first use. The filter only grows; keys removed from the table are
+    sorted out by the database lookup behind it, and keys added by another
+    process are simply probed again here.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._bloom: BloomFilter | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute(
+                "DELETE FROM missing_documents WHERE checked_at < ?",
+                (time.time() - config.missing_document_ttl,),
+            )
+            conn.commit()
+            keys = [row[0] for row in conn.execute("SELECT key FROM missing_documents")]
+            self._bloom = BloomFilter(max(100_000, 2 * len(keys)))
+            for key in keys:
+                self._bloom.add(key)
+            self._conn = conn
+        return self._conn
+
+    def _checked_at(self, key: str) -> float | None:
+        with self._lock:
+            conn = self._connect()
+            if key not in self._bloom:
+                return None
+            row = conn.execute(
+                "SELECT checked_at FROM missing_documents WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_missing(self, key: str) -> bool:
+        """Whether the document was confirmed missing within the TTL."""
+        checked_at = self._checked_at(key)
+        if checked_at is None:
+            return False
+        return time.time() - checked_at <= config.missing_document_ttl
+
+    def needs_recheck(self, key: str) -> bool:
+        """Whether a missing entry is old enough to be verified again."""
+        checked_at = self._checked_at(key)
+        return (
+            checked_at is not None
+            and time.time() - checked_at > config.missing_document_recheck
+        )
+
+    def add(self, key: str) -> None:
+        """Record (or re-confirm) a document as missing."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO missing_documents (key, first_seen, checked_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET checked_at = excluded.checked_at",
+                (key, now, now),
+            )
+            conn.commit()
+            self._bloom.add(key)
+
+    def remove(self, key: str) -> None:
+        """Drop a key whose document has turned up."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM missing_documents WHERE key = ?", (key,))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._bloom = None
+
+
+def get_missing_registry() -> MissingRegistry:
+    """Known-missing registry under config.cache_dir, created on first use."""
+    global _registry
+    if _registry is None:
+        _registry = MissingRegistry(os.path.join(config.cache_dir, "missing.db"))
+    return _registry
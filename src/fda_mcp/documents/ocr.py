@@ -0,0 +1,126 @@
+"""OCR profiles: render and tesseract settings for scanned documents.
+
+Most OCR time goes to rendering pages and to tesseract's layout analysis.
+Both scale with pixel count. A profile picks the render DPI, the image
+preprocessing and the tesseract modes. "fast" is tuned for the typed,
+single-column letters that make up most scanned decision documents.
+"accurate" is for dense or degraded scans. See benchmarks/bench_ocr.py
+for the trade-off on sample documents.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from fda_mcp.config import config
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+@dataclass(frozen=True)
+class OCRProfile:
+    """Settings for one OCR pass."""
+
+    name: str
+    # Render resolution. Lowered per document so that the longest page
+    # side stays within max_side_px (oversized drawings and foldouts).
+    dpi: int
+    max_side_px: int
+    grayscale: bool
+    # Threshold (0-255) for black/white binarization, or None to keep grey.
+    binarize_threshold: int | None
+    # Crop to the inked area before OCR (drops scanner borders and margins).
+    crop: bool
+    # tesseract page segmentation mode and OCR engine mode.
+    psm: int
+    oem: int
+
+    @property
+    def tesseract_config(self) -> str:
+        return f"--psm {self.psm} --oem {self.oem}"
+
+
+OCR_PROFILES: dict[str, OCRProfile] = {
+    "fast": OCRProfile(
+        "fast", dpi=150, max_side_px=2000, grayscale=True,
+        binarize_threshold=160, crop=True, psm=6, oem=1,
+    ),
+    "accurate": OCRProfile(
+        "accurate", dpi=300, max_side_px=4200, grayscale=True,
+        binarize_threshold=None, crop=True, psm=3, oem=1,
+    ),
+}
+
+
+def get_profile(name: str | None = None) -> OCRProfile:
+    """Look up an OCR profile by name (defaults to config.ocr_profile).
+
+    Unknown names fall back to "fast".
+    """
+    if name is None:
+        name = config.ocr_profile
+    return OCR_PROFILES.get(name, OCR_PROFILES["fast"])
+
+
+_PAGE_SIZE_RE = re.compile(r"([\d.]+)\s*x\s*([\d.]+)\s*pts")
+
+
+def parse_page_size(value: str | None) -> tuple[float, float] | None:
+    """Parse pdfinfo's "Page size" field ("612 x 792 pts (letter)")."""
+    match = _PAGE_SIZE_RE.search(value or "")
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def render_dpi(page_size_pts: tuple[float, float] | None, profile: OCRProfile) -> int:
+    """DPI to render at, adapted down for pages larger than max_side_px.
+
+    Args:
+        page_size_pts: (width, height) of the first page in PDF points,
+            or None when unknown.
+    """
+    if not page_size_pts:
+        return profile.dpi
+    longest_inches = max(page_size_pts) / 72
+    if longest_inches <= 0:
+        return profile.dpi
+    return max(72, min(profile.dpi, int(profile.max_side_px / longest_inches)))
+
+
+def _ink_bbox(image: "Image.Image", factor: int = 8) -> tuple[int, int, int, int] | None:
+    """Bounding box of the inked area, ignoring isolated specks.
+
+    The page is box-downsampled first, so lone noise pixels average out
+    while lines of text stay dark.
+    """
+    from PIL import ImageOps
+
+    gray = image if image.mode == "L" else image.convert("L")
+    small = ImageOps.invert(gray.reduce(factor)).point(lambda v: 255 if v > 32 else 0)
+    box = small.getbbox()
+    if box is None:
+        return None
+    return tuple(v * factor for v in box)
+
+
+def preprocess(image: "Image.Image", profile: OCRProfile) -> "Image.Image":
+    """Apply the profile's colour reduction, binarization and cropping."""
+    if profile.grayscale and image.mode != "L":
+        image = image.convert("L")
+    if profile.binarize_threshold is not None:
+        threshold = profile.binarize_threshold
+        image = image.point(lambda v: 255 if v > threshold else 0)
+    if profile.crop:
+        box = _ink_bbox(image)
+        if box is not None:
+            pad = 10
+            left, top, right, bottom = box
+            image = image.crop((
+                max(0, left - pad),
+                max(0, top - pad),
+                min(image.width, right + pad),
+                min(image.height, bottom + pad),
+            ))
+    return image
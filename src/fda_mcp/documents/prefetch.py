@@ -0,0 +1,137 @@
+"""Speculative prefetch of decision documents named in search results.
+
+After search_fda returns device/510k or device/pma records, the agent's
+next call is usually get_decision_document for one of them. When
+config.prefetch_documents is above zero, the top submissions are
+downloaded and extracted in the background so that call is served from the
+document cache.
+"""
+
+import asyncio
+
+import httpx
+from mcp.server.fastmcp.exceptions import ToolError
+
+from fda_mcp.config import config
+from fda_mcp.documents.fetcher import cancel_speculative, extract_document
+from fda_mcp.documents.resolver import known_missing, resolve_document_url
+
+DocumentSpec = tuple[str, str, str | None]
+
+
+def submissions_from_results(
+    endpoint: str, results: list[dict], top_n: int
+) -> list[DocumentSpec]:
+    """Pick the decision documents referenced by search results.
+
+    Args:
+        endpoint: API path the results came from.
+        results: Raw result records, in display order.
+        top_n: Maximum number of documents to return.
+
+    Returns:
+        (document_type, submission_number, supplement_number) tuples,
+        without duplicates. Empty for endpoints without decision documents.
+    """
+    specs: list[DocumentSpec] = []
+    for record in results:
+        if len(specs) >= top_n:
+            break
+        spec: DocumentSpec | None = None
+        if endpoint == "device/510k":
+            number = str(record.get("k_number") or "").upper()
+            if number.startswith("DEN"):
+                spec = ("denovo_decision", number, None)
+            elif number.startswith("K"):
+                spec = ("510k_summary", number, None)
+        elif endpoint == "device/pma":
+            number = str(record.get("pma_number") or "").upper()
+            supplement = str(record.get("supplement_number") or "").strip()
+            if number.startswith("P"):
+                if supplement:
+                    spec = ("pma_supplement", number, supplement)
+                else:
+                    spec = ("pma_approval", number, None)
+        if spec is not None and spec not in specs:
+            specs.append(spec)
+    return specs
+
+
+class DocumentPrefetcher:
+    """Low-priority background downloader that fills the document cache.
+
+    At most config.prefetch_concurrency prefetches run at once, so they
+    take one slot of the shared download and extraction capacity instead
+    of competing with real requests. Scheduling a new set of documents
+    cancels the previous set, since the agent has moved on.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[asyncio.Task, DocumentSpec] = {}
+        self._urls: list[str] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of prefetches queued or running."""
+        return sum(not task.done() for task in self._tasks)
+
+    def schedule(self, specs: list[DocumentSpec]) -> int:
+        """Queue background fetches for specs, replacing any earlier batch.
+
+        Returns:
+            Number of prefetches queued.
+        """
+        self.cancel()
+        self._semaphore = asyncio.Semaphore(config.prefetch_concurrency)
+        for spec in specs:
+            task = asyncio.ensure_future(self._prefetch(spec))
+            self._tasks[task] = spec
+            task.add_done_callback(lambda t: self._tasks.pop(t, None))
+        return len(specs)
+
+    async def schedule_from_results(self, endpoint: str, results: list[dict]) -> int:
+        """Queue prefetches for a search_fda page if prefetch is enabled."""
+        if config.prefetch_documents <= 0:
+            return 0
+        candidates = submissions_from_results(
+            endpoint, results, config.prefetch_documents
+        )
+        missing = await known_missing(candidates)
+        specs = [spec for spec, gone in zip(candidates, missing) if not gone]
+        if not specs:
+            return 0
+        return self.schedule(specs)
+
+    def cancel(self) -> int:
+        """Cancel every queued or running prefetch.
+
+        Downloads that a real get_decision_document call has since joined
+        keep running.
+
+        Returns:
+            Number of prefetch tasks cancelled.
+        """
+        cancelled = 0
+        for task in list(self._tasks):
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+        self._tasks.clear()
+        cancel_speculative(self._urls)
+        self._urls = []
+        return cancelled
+
+    async def _prefetch(self, spec: DocumentSpec) -> None:
+        async with self._semaphore:
+            try:
+                url = await resolve_document_url(*spec)
+                self._urls.append(url)
+                await extract_document(url, speculative=True)
+            except (ToolError, httpx.HTTPError):
+                # Missing or unreadable documents surface when actually
+                # requested; a prefetch has no one to report to.
+                pass
+
+
+document_prefetcher = DocumentPrefetcher()
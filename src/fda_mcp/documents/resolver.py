@@ -0,0 +1,309 @@
+"""Decision-document URL resolution across FDA's historical PDF layouts.
+
+build_document_url gives the most likely location, but many older
+submissions live elsewhere (see candidate_document_urls). The resolver
+probes every candidate concurrently, takes the first hit in candidate
+order, and remembers the outcome on disk. The most recent winning URLs
+are kept here (FDA_RESOLVED_URL_MAX_ENTRIES). Misses go in the
+known-missing registry (documents.missing).
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+
+from fda_mcp.config import config
+from fda_mcp.documents.http import DocumentClient, document_client
+from fda_mcp.documents.missing import MissingRegistry, get_missing_registry
+from fda_mcp.documents.urls import candidate_document_urls
+from fda_mcp.errors import DocumentNotFoundError
+from fda_mcp.jsoncodec import codec
+
+try:
+    import fcntl
+except ImportError:  # Windows: the thread lock still serializes this process
+    fcntl = None
+
+# Servers that reject HEAD are probed with a one-byte ranged GET instead.
+_HEAD_UNSUPPORTED = {403, 405, 501}
+
+# Background re-verifications of known-missing documents, by key.
+_rechecks: dict[str, asyncio.Task] = {}
+
+
+class ResolvedURLCache:
+    """Persistent document-key -> URL map.
+
+    Stored as one JSON file shared by server processes. Every change takes
+    an exclusive lock (a thread lock plus flock on a sidecar lock file),
+    re-reads the file, applies itself on top, and rewrites the file
+    atomically (write to a temp file, then rename). Entries added or
+    forgotten by other processes therefore survive, and readers never see a
+    partial file. A key not found in memory is looked up in the file again
+    before the caller probes the network.
+
+    At most max_entries URLs are kept; the oldest resolutions are dropped
+    first. Methods do blocking file I/O: call them via asyncio.to_thread
+    from async code.
+    """
+
+    def __init__(self, path: str, max_entries: int | None = None) -> None:
+        self.path = path
+        self.max_entries = (
+            config.resolved_url_max_entries if max_entries is None else max_entries
+        )
+        self._resolved: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, str]:
+        try:
+            with open(self.path, "rb") as f:
+                data = codec.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return dict(data.get("resolved", {}))
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access to the file across threads and processes."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(f"{self.path}.lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+
+    def _update(self, key: str, url: str | None) -> None:
+        """Set (or with url None, drop) one entry in the file."""
+        with self._locked():
+            resolved = self._read()
+            # Re-setting a key moves it to the end of the eviction order.
+            resolved.pop(key, None)
+            if url is not None:
+                resolved[key] = url
+                for stale in list(resolved)[: max(0, len(resolved) - self.max_entries)]:
+                    del resolved[stale]
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(self.path),
+                prefix=".resolved_urls.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                f.write(codec.dumps({"resolved": resolved}))
+            os.replace(f.name, self.path)
+            self._resolved = resolved
+
+    def get(self, key: str) -> str | None:
+        """Cached URL for a document key, if one was resolved before."""
+        url = self._resolved.get(key)
+        if url is None:
+            self._resolved = self._read()
+            url = self._resolved.get(key)
+        return url
+
+    def set_resolved(self, key: str, url: str) -> None:
+        self._update(key, url)
+
+    def forget(self, key: str) -> None:
+        """Drop a resolved URL that turned out to be stale."""
+        self._update(key, None)
+
+
+_cache: ResolvedURLCache | None = None
+
+
+def _get_cache() -> ResolvedURLCache:
+    """Resolved-URL cache under config.cache_dir, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ResolvedURLCache(
+            os.path.join(config.cache_dir, "resolved_urls.json")
+        )
+    return _cache
+
+
+def document_key(
+    document_type: str,
+    submission_number: str,
+    supplement_number: str | None = None,
+) -> str:
+    """Normalized cache key for a document identifier."""
+    key = f"{document_type}:{submission_number.strip().upper()}"
+    if supplement_number:
+        key += f":S{supplement_number.strip().zfill(3)}"
+    return key
+
+
+async def _probe(
+    client: httpx.AsyncClient | DocumentClient, url: str
+) -> tuple[str, bool | None]:
+    """Check whether a PDF exists at url.
+
+    Returns:
+        (url, found) where found is True if the PDF exists, False if it is
+        definitely missing, and None if the probe was inconclusive
+        (network error or unexpected status).
+    """
+    try:
+        response = await client.head(url)
+        if response.status_code in _HEAD_UNSUPPORTED:
+            response = await client.get(url, headers={"Range": "bytes=0-0"})
+    except httpx.HTTPError:
+        return url, None
+    if response.status_code in (200, 206):
+        content_type = response.headers.get("content-type", "")
+        return url, not content_type.startswith("text/html")
+    if response.status_code in (404, 410):
+        return url, False
+    return url, None
+
+
+async def _first_hit(
+    client: httpx.AsyncClient | DocumentClient, urls: list[str]
+) -> tuple[str | None, bool]:
+    """Probe urls concurrently.
+
+    A document can exist at more than one layout, so the winner is the
+    first URL in candidate order that exists. It is returned as soon as
+    every URL before it has failed, without waiting for later probes.
+
+    Returns:
+        (url, conclusive): the first URL found (None if none was), and
+        whether every probe gave a definite answer.
+    """
+    tasks = [asyncio.ensure_future(_probe(client, url)) for url in urls]
+    found: dict[str, bool | None] = {}
+    settled = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            url, hit = await next_done
+            found[url] = hit
+            while settled < len(urls) and urls[settled] in found:
+                if found[urls[settled]]:
+                    return urls[settled], True
+                settled += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None, None not in found.values()
+
+
+async def resolve_document_url(
+    document_type: str,
+    submission_number: str,
+    supplement_number: str | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> str:
+    """Find the URL a decision document actually lives at.
+
+    Args:
+        document_type: Same values as build_document_url.
+        submission_number: FDA identifier (K######, DEN######, P######).
+        supplement_number: Supplement number for PMA supplements.
+        client: HTTP client to probe with. Defaults to the shared
+            document_client.
+
+    Returns:
+        URL of the document PDF.
+
+    Raises:
+        InvalidIdentifierError: If identifier format is invalid.
+        DocumentNotFoundError: If no candidate location has the document.
+    """
+    candidates = candidate_document_urls(
+        document_type, submission_number, supplement_number
+    )
+    key = document_key(document_type, submission_number, supplement_number)
+    cache = _get_cache()
+
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached:
+        return cached
+    registry = get_missing_registry()
+    missing, stale = await asyncio.to_thread(_missing_state, registry, key)
+    if missing:
+        if stale:
+            _schedule_recheck(key, candidates)
+        raise DocumentNotFoundError(candidates[0], len(candidates) - 1)
+
+    url, conclusive = await _probe_candidates(candidates, client)
+    if url is not None:
+        await asyncio.to_thread(cache.set_resolved, key, url)
+        return url
+    if conclusive:
+        await asyncio.to_thread(registry.add, key)
+        raise DocumentNotFoundError(candidates[0], len(candidates) - 1)
+    # Some probes failed outright: fall back to the primary location and
+    # let the download report the real error.
+    return candidates[0]
+
+
+async def _probe_candidates(
+    candidates: list[str], client: httpx.AsyncClient | None
+) -> tuple[str | None, bool]:
+    """_first_hit with the shared document_client when none is given."""
+    return await _first_hit(client or document_client, candidates)
+
+
+def _schedule_recheck(key: str, candidates: list[str]) -> None:
+    """Re-probe a stale known-missing document in the background.
+
+    The current request still fails fast; the outcome applies from the next
+    request on.
+    """
+    if key in _rechecks:
+        return
+    task = asyncio.ensure_future(_recheck(key, candidates))
+    _rechecks[key] = task
+    task.add_done_callback(lambda _: _rechecks.pop(key, None))
+
+
+async def _recheck(key: str, candidates: list[str]) -> None:
+    url, conclusive = await _probe_candidates(candidates, None)
+    registry = get_missing_registry()
+    if url is not None:
+        await asyncio.to_thread(registry.remove, key)
+        await asyncio.to_thread(_get_cache().set_resolved, key, url)
+    elif conclusive:
+        await asyncio.to_thread(registry.add, key)
+
+
+def _missing_state(registry: MissingRegistry, key: str) -> tuple[bool, bool]:
+    """(is_missing, needs_recheck) for a key. Blocking; run in a thread."""
+    if not registry.is_missing(key):
+        return False, False
+    return True, registry.needs_recheck(key)
+
+
+async def known_missing(
+    documents: list[tuple[str, str, str | None]],
+) -> list[bool]:
+    """Which documents are in the known-missing registry (no network).
+
+    Args:
+        documents: (document_type, submission_number, supplement_number)
+            tuples.
+
+    Returns:
+        One flag per document, looked up together in a worker thread.
+    """
+    keys = [document_key(*document) for document in documents]
+    registry = get_missing_registry()
+    return await asyncio.to_thread(lambda: [registry.is_missing(key) for key in keys])
+
+
+async def forget_document_url(
+    document_type: str,
+    submission_number: str,
+    supplement_number: str | None = None,
+) -> None:
+    """Forget a cached location, e.g. after the download itself 404'd."""
+    await asyncio.to_thread(
+        _get_cache().forget,
+        document_key(document_type, submission_number, supplement_number),
+    )
@@ -0,0 +1,194 @@
+"""BM25 passage retrieval inside long decision documents.
+
+SSEDs and PMA approvals run to hundreds of thousands of characters and the
+answer (clinical results, predicate device, indications) is rarely in the
+first few pages. The extracted text is split into passages once, indexed
+with Okapi BM25, and a query returns the best passages that fit the
+character budget.
+"""
+
+import asyncio
+import math
+import re
+from collections import Counter
+
+from fda_mcp.documents.fetcher import (
+    ExtractedDocument,
+    _get_executor,
+    format_document,
+)
+
+PASSAGE_CHARS = 800
+
+# BM25 parameters (standard Okapi defaults).
+_K1 = 1.5
+_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or that the "
+    "this to was were which with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens with common stopwords removed."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def split_passages(text: str, size: int = PASSAGE_CHARS) -> list[tuple[int, int]]:
+    """Split text into consecutive passages of roughly size characters.
+
+    Passages end on a line break (or failing that, a space) in their second
+    half, so sentences and table rows are rarely cut.
+
+    Returns:
+        (start, end) character offsets covering the whole text.
+    """
+    spans = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + size, length)
+        if end < length:
+            cut = text.rfind("\n", start + size // 2, end)
+            if cut == -1:
+                cut = text.rfind(" ", start + size // 2, end)
+            if cut != -1:
+                end = cut + 1
+        spans.append((start, end))
+        start = end
+    return spans
+
+
+class BM25Index:
+    """Okapi BM25 index over the passages of one document."""
+
+    def __init__(self, text: str, passage_chars: int = PASSAGE_CHARS) -> None:
+        self.spans = split_passages(text, passage_chars)
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        for i, (start, end) in enumerate(self.spans):
+            counts = Counter(tokenize(text[start:end]))
+            self._lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append((i, tf))
+        total = sum(self._lengths)
+        self._avg_length = total / len(self._lengths) if self._lengths else 0.0
+
+    def search(self, query: str) -> list[tuple[float, int]]:
+        """Score passages against a query.
+
+        Returns:
+            (score, passage_index) pairs with a positive score, best first.
+        """
+        n = len(self.spans)
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for i, tf in postings:
+                norm = _K1 * (1 - _B + _B * self._lengths[i] / self._avg_length)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+        return sorted(
+            ((score, i) for i, score in scores.items()), key=lambda p: (-p[0], p[1])
+        )
+
+
+def get_index(doc: ExtractedDocument) -> BM25Index:
+    """The document's passage index, built on first use and kept with it."""
+    if doc.search_index is None:
+        doc.search_index = BM25Index(doc.text)
+    return doc.search_index
+
+
+def format_passages(doc: ExtractedDocument, query: str, max_length: int) -> str:
+    """Render the passages of a document that best match a query.
+
+    Passages are picked best-first until max_length characters are used,
+    then shown in document order with adjacent passages merged.
+
+    Args:
+        doc: The extracted document.
+        query: Free-text query, e.g. "predicate device".
+        max_length: Maximum characters of passage text to include.
+
+    Returns:
+        Metadata header followed by the selected passages, or the start of
+        the document when nothing matches.
+    """
+    if doc.needs_ocr:
+        return format_document(doc, max_length)
+
+    index = get_index(doc)
+    ranked = index.search(query)
+    if not ranked:
+        return (
+            f"[No passages matched query '{query}'; "
+            f"showing the start of the document.]\n"
+            + format_document(doc, max_length)
+        )
+
+    chosen: list[int] = []
+    used = 0
+    for _, i in ranked:
+        start, end = index.spans[i]
+        if used + (end - start) > max_length:
+            continue
+        chosen.append(i)
+        used += end - start
+    if not chosen:
+        # Even the best passage is over budget: show its first part.
+        chosen = [ranked[0][1]]
+
+    merged: list[list[int]] = []
+    for i in sorted(chosen):
+        start, end = index.spans[i]
+        if merged and merged[-1][1] == start:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    blocks = []
+    remaining = max_length
+    for start, end in merged:
+        if end - start > remaining:
+            start = _window_start(doc.text, query, start, end, remaining)
+            end = start + remaining
+        remaining -= end - start
+        text = doc.text[start:end].strip()
+        blocks.append(f"[Chars {start}-{end}]\n{text}")
+
+    header = (
+        f"Source: {doc.url}\nPages: {doc.page_count}\n"
+        f"Extraction: {doc.method}\n"
+        f"Query: {query} — {len(chosen)} of {len(index.spans)} passages, "
+        f"ranked by relevance and shown in document order.\n"
+    )
+    return header + "\n" + "\n\n".join(blocks)
+
+
+def _window_start(text: str, query: str, start: int, end: int, width: int) -> int:
+    """Start of a width-char window in text[start:end] around the first hit."""
+    terms = tokenize(query)
+    if terms:
+        pattern = re.compile(
+            "|".join(re.escape(t) for t in terms), re.IGNORECASE
+        )
+        match = pattern.search(text, start, end)
+        if match:
+            return max(start, min(match.start() - width // 4, end - width))
+    return start
+
+
+async def search_document(
+    doc: ExtractedDocument, query: str, max_length: int
+) -> str:
+    """format_passages in the worker pool; indexing a long SSED is CPU-bound."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), format_passages, doc, query, max_length
+    )
@@ -0,0 +1,184 @@
+"""Section segmentation for 510(k), De Novo and PMA decision documents.
+
+FDA decision documents follow predictable outlines (Indications for Use,
+Predicate Device, Substantial Equivalence, Performance Data, Clinical
+Studies, ...). Headings are detected once per document and stored as an
+offset table with the cached text, so a caller can ask for just the
+sections it needs instead of paging through boilerplate.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from fda_mcp.documents.budget import allocate_budget
+
+if TYPE_CHECKING:
+    from fda_mcp.documents.fetcher import ExtractedDocument
+
+SectionName = Literal[
+    "indications",
+    "device_description",
+    "predicate",
+    "substantial_equivalence",
+    "performance_data",
+    "clinical",
+    "contraindications",
+    "warnings",
+    "adverse_effects",
+    "benefit_risk",
+    "conclusion",
+]
+
+# Heading patterns per canonical section, matched at the start of a line
+# after optional outline numbering ("5.", "IV.", "A)", "Section 3:").
+_HEADINGS: dict[str, str] = {
+    "indications": r"(?:statement of )?indications? for use|intended use",
+    "device_description": r"(?:description of (?:the )?device|device description)",
+    "predicate": r"(?:identification of )?(?:the )?(?:legally marketed )?predicate devices?",
+    "substantial_equivalence": (
+        r"(?:summary of )?substantial equivalence|"
+        r"comparison (?:of|with|to) (?:the )?(?:technological characteristics|predicate)|"
+        r"technological characteristics"
+    ),
+    "performance_data": (
+        r"(?:summary of )?(?:non-?clinical |bench |pre-?clinical )?"
+        r"performance (?:data|testing|tests)|"
+        r"non-?clinical (?:tests|testing|studies|data)|"
+        r"(?:summary of )?(?:pre-?clinical|laboratory) studies"
+    ),
+    "clinical": r"(?:summary of )?(?:primary )?clinical (?:studies|study|data|testing|performance|evidence)",
+    "contraindications": r"contraindications?",
+    "warnings": r"warnings(?: and precautions)?|precautions",
+    "adverse_effects": r"(?:potential )?adverse (?:effects|events)(?: of the device on health)?",
+    "benefit_risk": r"(?:probable )?benefit[- /]risk|risk[- /]benefit",
+    "conclusion": r"(?:overall )?conclusions?(?: drawn from)?",
+}
+
+# "2.", "4.1", "IV" or "b)". Single letters need their delimiter, or a
+# wrapped line starting with the article "a" would pass for numbering.
+_NUMBERING = (
+    r"(?:(?:section\s+)?"
+    r"(?:(?:[0-9]{1,2}(?:\.[0-9]{1,2})*|[ivxlc]{1,5})[.):]?|[a-h][.)])\s+)?"
+)
+_HEADING_RE = re.compile(
+    r"^\s*" + _NUMBERING + r"(?P<title>"
+    + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _HEADINGS.items())
+    + r")\b(?P<rest>[^\n]*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Table-of-contents entries end in dot leaders or a bare page number.
+_TOC_RE = re.compile(r"(?:\.{3,}|\s{2,})\s*\d+\s*$")
+
+_MAX_HEADING_CHARS = 90
+
+
+def _is_heading(line: str, title: str, rest: str) -> bool:
+    """Whether a line that starts with a heading phrase is really a heading.
+
+    Accepts bare headings ("Predicate Device"), inline ones ("Predicate
+    Device: K123456") and short qualifiers ("... with the Predicate"), but
+    not sentences that merely begin with the phrase, nor prose wrapped onto
+    a new line ("intended use as the predicate"), which starts lowercase.
+    """
+    if _TOC_RE.search(line) or title[0].islower():
+        return False
+    rest = rest.strip()
+    if not rest or rest in (":", ".") or rest[0] in ":-\u2013\u2014":
+        return True
+    if len(line) > _MAX_HEADING_CHARS:
+        return False
+    return line.isupper() or (len(rest) <= 30 and not rest.endswith("."))
+
+
+@dataclass(frozen=True)
+class Section:
+    """One detected section: canonical name, heading text and offsets."""
+
+    name: str
+    title: str
+    start: int
+    end: int
+
+
+def detect_sections(text: str) -> list[Section]:
+    """Find section headings and return the document's offset table.
+
+    Each section runs from its heading to the next detected heading (or
+    the end of the document). A canonical section can occur more than once,
+    e.g. a standalone Indications for Use form plus the summary's own
+    section.
+    """
+    starts: list[tuple[int, str, str]] = []
+    for match in _HEADING_RE.finditer(text):
+        line = match.group(0).strip()
+        if not _is_heading(line, match.group("title"), match.group("rest")):
+            continue
+        name = next(n for n in _HEADINGS if match.group(n))
+        starts.append((match.start(), name, line[:_MAX_HEADING_CHARS]))
+
+    sections = []
+    for i, (start, name, title) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        sections.append(Section(name, title, start, end))
+    return sections
+
+
+def get_sections(doc: "ExtractedDocument") -> list[Section]:
+    """The document's section table, detected on first use if needed."""
+    if doc.sections is None:
+        doc.sections = detect_sections(doc.text)
+    return doc.sections
+
+
+def format_sections(
+    doc: "ExtractedDocument", names: list[str], max_length: int
+) -> str:
+    """Render only the requested sections of a document.
+
+    Args:
+        doc: The extracted document.
+        names: Canonical section names (see SectionName).
+        max_length: Maximum characters of section text, shared fairly
+            across the selected sections.
+
+    Returns:
+        Metadata header and the selected sections in document order, or
+        the start of the document when none of them were found.
+    """
+    from fda_mcp.documents.fetcher import format_document
+
+    if doc.needs_ocr:
+        return format_document(doc, max_length)
+
+    table = get_sections(doc)
+    found = {s.name for s in table}
+    selected = [s for s in table if s.name in names]
+    missing = [n for n in names if n not in found]
+
+    if not selected:
+        available = ", ".join(sorted(found)) or "none detected"
+        return (
+            f"[Requested sections not found: {', '.join(names)}. "
+            f"Sections detected: {available}. "
+            f"Showing the start of the document.]\n"
+            + format_document(doc, max_length)
+        )
+
+    allowances = allocate_budget([s.end - s.start for s in selected], max_length)
+    header = (
+        f"Source: {doc.url}\nPages: {doc.page_count}\n"
+        f"Extraction: {doc.method}\n"
+        f"Sections: {', '.join(dict.fromkeys(s.name for s in selected))}\n"
+    )
+    if missing:
+        header += f"[Not found in this document: {', '.join(missing)}]\n"
+
+    blocks = []
+    for section, allowance in zip(selected, allowances):
+        body = doc.text[section.start:section.start + allowance].strip()
+        note = ""
+        if allowance < section.end - section.start:
+            note = " [truncated]"
+        blocks.append(f"## {section.title} (chars {section.start}-{section.end}){note}\n{body}")
+    return header + "\n" + "\n\n".join(blocks)
@@ -0,0 +1,147 @@
+"""Table extraction for decision documents.
+
+Performance data and clinical endpoints in SSEDs live in tables that
+page.extract_text() flattens into unreadable runs. pdfplumber's table
+finder is slow, so it runs per page in the extraction worker pool, and the
+structured result is cached on the document next to its text.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from fda_mcp.documents.cache import document_cache
+from fda_mcp.documents.fetcher import ExtractedDocument, local_pdf
+from fda_mcp.documents.jobs import check_cancelled, cpu_jobs
+
+
+@dataclass
+class ExtractedTable:
+    """One table: 1-based page number and rows of cell text."""
+
+    page: int
+    rows: list[list[str]]
+
+
+def __getattr__(name: str) -> Any:
+    # pdfplumber is imported on first use (see documents.fetcher).
+    if name == "pdfplumber":
+        import pdfplumber
+
+        return pdfplumber
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _clean_cell(cell: str | None) -> str:
+    """Collapse whitespace (including in-cell line breaks) for TSV output."""
+    return " ".join((cell or "").split())
+
+
+def _extract_tables_from_pages(
+    pdf_path: str, page_numbers: list[int]
+) -> list[ExtractedTable]:
+    """Run the table finder on some pages. Blocking; runs as a cpu_jobs job."""
+    import pdfplumber
+
+    tables = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for number in page_numbers:
+            check_cancelled()
+            for raw in pdf.pages[number - 1].extract_tables():
+                rows = [[_clean_cell(c) for c in row] for row in raw]
+                rows = [row for row in rows if any(row)]
+                if rows:
+                    tables.append(ExtractedTable(number, rows))
+    return tables
+
+
+async def extract_tables(doc: ExtractedDocument) -> list[ExtractedTable]:
+    """Extract (or return cached) tables for a document.
+
+    Tables are normally extracted during the document's download (see
+    extract_document's tables argument). For a document extracted without
+    them, the PDF comes from the blob store when enabled, else it is
+    downloaded again.
+    """
+    if doc.tables is not None:
+        return doc.tables
+    async with local_pdf(doc.url) as pdf_path:
+        return await extract_tables_from_file(doc, pdf_path)
+
+
+async def extract_tables_from_file(
+    doc: ExtractedDocument, pdf_path: str
+) -> list[ExtractedTable]:
+    """Extract a document's tables from its PDF on disk and cache them.
+
+    The pages are split into up to config.cpu_jobs_max_concurrent
+    cpu_jobs jobs.
+    """
+    jobs = max(1, min(cpu_jobs.max_concurrent, doc.page_count))
+    pages = list(range(1, doc.page_count + 1))
+    results = await asyncio.gather(*(
+        cpu_jobs.run(
+            ("tables", doc.url, i, jobs),
+            _extract_tables_from_pages, pdf_path, pages[i::jobs],
+        )
+        for i in range(jobs)
+    ))
+
+    tables = sorted(
+        (table for chunk in results for table in chunk), key=lambda t: t.page
+    )
+    doc.tables = tables
+    if doc.url in document_cache:
+        document_cache.put(doc)  # re-count its size with the tables
+    return tables
+
+
+def format_tables(
+    doc: ExtractedDocument, tables: list[ExtractedTable], max_length: int
+) -> str:
+    """Render tables as compact TSV, in page order, within max_length.
+
+    Tables that don't fit are counted rather than cut mid-row, except the
+    first, which is truncated by rows so something is always returned.
+    """
+    header = (
+        f"Source: {doc.url}\nPages: {doc.page_count}\n"
+        f"Tables: {len(tables)} found (tab-separated, one row per line)\n"
+    )
+    if not tables:
+        note = "No tables were detected in this document."
+        if doc.needs_ocr or doc.method.startswith("OCR"):
+            note += " Tables cannot be extracted from scanned documents."
+        return header + "\n" + note
+
+    blocks = []
+    used = 0
+    shown = 0
+    for i, table in enumerate(tables, start=1):
+        title = f"# Table {i} (page {table.page}, {len(table.rows)} rows)"
+        lines = ["\t".join(row) for row in table.rows]
+        block = "\n".join([title, *lines])
+        if used + len(block) > max_length:
+            if blocks:
+                break
+            kept = []
+            size = len(title)
+            for line in lines:
+                if size + len(line) + 1 > max_length:
+                    break
+                kept.append(line)
+                size += len(line) + 1
+            block = "\n".join(
+                [title, *kept, f"[{len(lines) - len(kept)} more rows truncated]"]
+            )
+        blocks.append(block)
+        used += len(block) + 2
+        shown += 1
+
+    body = "\n\n".join(blocks)
+    if shown < len(tables):
+        body += (
+            f"\n\n[{len(tables) - shown} more tables omitted. "
+            f"Call again with a larger max_length to see them.]"
+        )
+    return header + "\n" + body
@@ -1,9 +1,25 @@
 """URL pattern construction for FDA decision documents."""
 
 import re
+from typing import Literal
 
 from fda_mcp.errors import InvalidIdentifierError
 
+DocumentType = Literal[
+    "510k_summary",
+    "denovo_decision",
+    "pma_approval",
+    "pma_ssed",
+    "pma_supplement",
+]
+
+_DOCS_BASE = "https://www.accessdata.fda.gov/cdrh_docs"
+
+_DOC_FILENAME_RE = re.compile(
+    r"/(K\d{6,7}|DEN\d{6,7}|P\d{6,7})(?:S(\d{3}))?([AB])?\.pdf$",
+    re.IGNORECASE,
+)
+
 
 def build_document_url(
     document_type: str,
@@ -73,6 +89,88 @@ def build_document_url(
     raise InvalidIdentifierError(document_type, "valid document_type")
 
 
+def candidate_document_urls(
+    document_type: str,
+    submission_number: str,
+    supplement_number: str | None = None,
+) -> list[str]:
+    """All plausible URLs for a document, most likely first.
+
+    FDA has stored decision PDFs under several layouts over the years:
+    cdrh_docs/reviews/ for recent 510(k) and De Novo summaries,
+    cdrh_docs/pdfN/ (year without a leading zero, e.g. pdf3 for 2003) for
+    most 510(k)s and PMAs, and a flat cdrh_docs/pdf/ for submissions before
+    2002. Older PMA files also use a lowercase letter suffix.
+
+    Args:
+        document_type: Same values as build_document_url.
+        submission_number: FDA identifier (K######, DEN######, P######).
+        supplement_number: Supplement number for PMA supplements.
+
+    Returns:
+        Candidate URLs without duplicates. The first entry is always
+        build_document_url's result.
+
+    Raises:
+        InvalidIdentifierError: If identifier format is invalid.
+    """
+    primary = build_document_url(document_type, submission_number, supplement_number)
+    submission_number = submission_number.strip().upper()
+
+    yy = re.sub(r"^\D+", "", submission_number)[:2]
+    dirs = [f"pdf{yy}", *_year_dirs(yy)]
+
+    if document_type in ("510k_summary", "denovo_decision"):
+        names = [f"{submission_number}.pdf"]
+    else:
+        stem = submission_number
+        if document_type == "pma_supplement":
+            stem += f"S{supplement_number.strip().zfill(3)}"
+        suffix = "B" if document_type == "pma_ssed" else "A"
+        names = [f"{stem}{suffix}.pdf", f"{stem}{suffix.lower()}.pdf"]
+
+    candidates = [primary]
+    for directory in dirs:
+        for name in names:
+            url = f"{_DOCS_BASE}/{directory}/{name}"
+            if url not in candidates:
+                candidates.append(url)
+    return candidates
+
+
+def parse_document_url(url: str) -> tuple[str, str, str | None] | None:
+    """Recover the identifier from a decision-document URL.
+
+    The inverse of build_document_url / candidate_document_urls.
+
+    Returns:
+        (document_type, submission_number, supplement_number), or None if
+        the URL does not look like an FDA decision document.
+    """
+    match = _DOC_FILENAME_RE.search(url)
+    if match is None:
+        return None
+    number, supplement, suffix = match.groups()
+    number = number.upper()
+    if number.startswith("K"):
+        return "510k_summary", number, None
+    if number.startswith("DEN"):
+        return "denovo_decision", number, None
+    if supplement:
+        return "pma_supplement", number, supplement
+    if suffix and suffix.upper() == "B":
+        return "pma_ssed", number, None
+    return "pma_approval", number, None
+
+
+def _year_dirs(yy: str) -> list[str]:
+    """cdrh_docs/pdf* directories used for a 2-digit submission year."""
+    year = int(yy)
+    if year >= 76 or year < 2:
+        return ["pdf"]
+    return [f"pdf{year}"]
+
+
 def _extract_pma_year(pma_number: str) -> str:
     """Extract 2-digit year from PMA number.
 
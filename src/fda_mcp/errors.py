@@ -1,5 +1,7 @@
 """Custom error types for the FDA MCP server."""
 
+import difflib
+
 from mcp.server.fastmcp.exceptions import ToolError
 
 
@@ -55,13 +57,36 @@ class InvalidSearchError(OpenFDAError):
 class DocumentNotFoundError(ToolError):
     """FDA decision document not found."""
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, alternatives: int = 0) -> None:
+        checked = ""
+        if alternatives:
+            checked = f" (also checked {alternatives} alternative locations)"
         super().__init__(
-            f"Document not found at {url}. "
+            f"Document not found at {url}{checked}. "
             "Verify the submission number is correct."
         )
 
 
+class DocumentTooLargeError(ToolError):
+    """FDA decision document exceeds the configured download size cap."""
+
+    def __init__(self, url: str, max_bytes: int) -> None:
+        super().__init__(
+            f"Document at {url} exceeds the {max_bytes:,}-byte download limit. "
+            "Raise FDA_PDF_MAX_BYTES to allow larger documents."
+        )
+
+
+class InvalidDocumentError(ToolError):
+    """FDA server returned something other than a PDF."""
+
+    def __init__(self, url: str, content_type: str) -> None:
+        super().__init__(
+            f"Expected a PDF at {url} but the server returned '{content_type}'. "
+            "The document may have moved or the submission number may be wrong."
+        )
+
+
 class InvalidIdentifierError(ToolError):
     """Invalid FDA submission identifier format."""
 
@@ -69,3 +94,32 @@ class InvalidIdentifierError(ToolError):
         super().__init__(
             f"Invalid identifier '{identifier}'. Expected format: {expected_format}"
         )
+
+
+class UnknownFieldError(ToolError):
+    """Projected field is not defined for the endpoint."""
+
+    def __init__(self, endpoint: str, fields: list[str], known: list[str]) -> None:
+        lines = [f"Unknown field(s) for {endpoint}: {', '.join(fields)}."]
+        hints = []
+        for field in fields:
+            match = difflib.get_close_matches(field, known, n=1)
+            if match:
+                hints.append(f"{field} -> {match[0]}")
+        if hints:
+            lines.append(f"Did you mean: {'; '.join(hints)}?")
+        lines.append(
+            f'Use list_searchable_fields("{endpoint}", category="all") '
+            "for valid field names."
+        )
+        super().__init__(" ".join(lines))
+
+
+class MissingDependencyError(ToolError):
+    """An optional package a tool needs is not installed."""
+
+    def __init__(self, package: str, extra: str, feature: str) -> None:
+        super().__init__(
+            f"{feature} needs the optional package '{package}'. "
+            f'Install it with: pip install "fda-mcp[{extra}]"'
+        )
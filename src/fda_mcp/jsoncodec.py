@@ -0,0 +1,93 @@
+"""Pluggable JSON codec for API responses and on-disk caches.
+
+Decoding whole openFDA responses (1000-row count results) is a large
+share of tool latency with the stdlib json module. When orjson or
+msgspec is installed (`pip install "fda-mcp[fast]"`), it is used instead. The backend is picked once, at import, from config.json_backend.
+"auto" takes the first one available in JSON_BACKENDS.
+
+Every backend decodes bytes or str and encodes to UTF-8 bytes. Input an
+accelerated decoder rejects but the stdlib accepts (NaN, Infinity) is
+decoded with the stdlib instead, so switching backends never turns a
+valid response into an error. See benchmarks/bench_json.py.
+"""
+
+import importlib.util
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fda_mcp.config import config
+
+# In order of preference for "auto".
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Decode and encode functions of one JSON backend."""
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _with_fallback(loads: Callable[[bytes | str], Any]) -> Callable[[bytes | str], Any]:
+    def decode(data: bytes | str) -> Any:
+        try:
+            return loads(data)
+        except ValueError:
+            return json.loads(data)
+
+    return decode
+
+
+def backend_available(name: str) -> bool:
+    """Whether a JSON backend can be imported on this host."""
+    if name == "json":
+        return True
+    return name in JSON_BACKENDS and importlib.util.find_spec(name) is not None
+
+
+def _load_backend(name: str) -> JSONCodec:
+    if name == "orjson":
+        import orjson
+
+        return JSONCodec("orjson", _with_fallback(orjson.loads), orjson.dumps)
+    if name == "msgspec":
+        import msgspec
+
+        def msgspec_loads(data: bytes | str) -> Any:
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+        return JSONCodec(
+            "msgspec", _with_fallback(msgspec_loads), msgspec.json.encode
+        )
+    return JSONCodec("json", json.loads, _stdlib_dumps)
+
+
+def select_codec(preferred: str | None = None) -> JSONCodec:
+    """Resolve the JSON codec to use.
+
+    Args:
+        preferred: "auto", or one of JSON_BACKENDS. Defaults to
+            config.json_backend. An unavailable backend falls back to the
+            fastest available one.
+    """
+    if preferred is None:
+        preferred = config.json_backend
+    if preferred != "auto" and backend_available(preferred):
+        return _load_backend(preferred)
+    for name in JSON_BACKENDS:
+        if backend_available(name):
+            return _load_backend(name)
+    return _load_backend("json")
+
+
+codec = select_codec()
@@ -1,6 +1,9 @@
 """Async HTTP client for the OpenFDA API with rate limiting."""
 
 import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import httpx
 
@@ -11,6 +14,13 @@ from fda_mcp.errors import (
     OpenFDAError,
     RateLimitError,
 )
+from fda_mcp.jsoncodec import codec
+from fda_mcp.openfda.stream import ResultsParser
+
+
+# Largest page openFDA returns, and the largest skip it accepts.
+MAX_PAGE_SIZE = 1000
+MAX_SKIP = 25000
 
 
 class OpenFDAClient:
@@ -49,6 +59,72 @@ class OpenFDAClient:
             InvalidSearchError: Bad query syntax (HTTP 400)
             OpenFDAError: Other API errors
         """
+        params = self._params(search, count, limit, skip, sort)
+        async with self._send(endpoint, params) as response:
+            return codec.loads(await response.aread())
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        endpoint: str,
+        search: str | None = None,
+        limit: int | None = None,
+        skip: int | None = None,
+        sort: str | None = None,
+    ) -> AsyncIterator["ResultPage"]:
+        """Query an endpoint and parse its records as the body arrives.
+
+        Takes the same arguments as query() (except count) and raises the
+        same errors. The page's meta is read on entry; iterate over the
+        page for the records. Leaving the block early closes the response
+        without reading the rest of the body.
+        """
+        params = self._params(search, None, limit, skip, sort)
+        async with self._send(endpoint, params) as response:
+            page = ResultPage(response)
+            await page.open()
+            yield page
+
+    async def paginate(
+        self,
+        endpoint: str,
+        search: str | None = None,
+        max_records: int = 1000,
+        sort: str | None = None,
+    ) -> AsyncIterator["ResultPage"]:
+        """Stream consecutive pages of a search, up to max_records records.
+
+        Each page is yielded open, as by stream(); read its records before
+        asking for the next page. Stops at the last matching record or at
+        openFDA's deepest skip (MAX_SKIP). A search matching nothing
+        raises NotFoundError, like stream().
+        """
+        skip = 0
+        while skip < max_records and skip <= MAX_SKIP:
+            limit = min(MAX_PAGE_SIZE, max_records - skip)
+            try:
+                async with self.stream(endpoint, search, limit, skip, sort) as page:
+                    yield page
+                    total = (page.meta.get("results") or {}).get("total")
+                    count = page.count
+            except NotFoundError:
+                # Records can disappear between pages; none left is not an
+                # error once some were returned.
+                if skip:
+                    return
+                raise
+            skip += limit
+            if count < limit or (isinstance(total, int) and skip >= total):
+                return
+
+    @staticmethod
+    def _params(
+        search: str | None,
+        count: str | None,
+        limit: int | None,
+        skip: int | None,
+        sort: str | None,
+    ) -> dict[str, str]:
         params: dict[str, str] = {}
         if config.api_key:
             params["api_key"] = config.api_key
@@ -62,7 +138,13 @@ class OpenFDAClient:
             params["skip"] = str(skip)
         if sort:
             params["sort"] = sort
+        return params
 
+    @asynccontextmanager
+    async def _send(
+        self, endpoint: str, params: dict[str, str]
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a request; yields the response with its body unread."""
         url = f"{self.BASE_URL}/{endpoint}.json"
 
         async with self._semaphore:
@@ -70,7 +152,9 @@ class OpenFDAClient:
                 timeout=config.request_timeout
             ) as client:
                 try:
-                    response = await client.get(url, params=params)
+                    async with client.stream("GET", url, params=params) as response:
+                        await self._check_status(response, endpoint)
+                        yield response
                 except httpx.TimeoutException:
                     raise OpenFDAError(
                         f"Request timed out after {config.request_timeout}s. "
@@ -82,24 +166,106 @@ class OpenFDAClient:
                         "Check your network connection."
                     )
 
-                if response.status_code == 404:
-                    raise NotFoundError(endpoint=endpoint)
-                if response.status_code == 429:
-                    raise RateLimitError()
-                if response.status_code == 400:
-                    body = response.json() if response.content else {}
-                    detail = ""
-                    if "error" in body:
-                        detail = body["error"].get("message", "")
-                    raise InvalidSearchError(detail)
-                if response.status_code >= 500:
-                    raise OpenFDAError(
-                        f"OpenFDA server error (HTTP {response.status_code}). "
-                        "The FDA API may be temporarily unavailable. "
-                        "Try again shortly."
-                    )
-                response.raise_for_status()
-                return response.json()
+    @staticmethod
+    async def _check_status(response: httpx.Response, endpoint: str) -> None:
+        if response.status_code == 404:
+            raise NotFoundError(endpoint=endpoint)
+        if response.status_code == 429:
+            raise RateLimitError()
+        if response.status_code == 400:
+            await response.aread()
+            body = codec.loads(response.content) if response.content else {}
+            detail = ""
+            if "error" in body:
+                detail = body["error"].get("message", "")
+            raise InvalidSearchError(detail)
+        if response.status_code >= 500:
+            raise OpenFDAError(
+                f"OpenFDA server error (HTTP {response.status_code}). "
+                "The FDA API may be temporarily unavailable. "
+                "Try again shortly."
+            )
+        response.raise_for_status()
+
+
+class ResultPage:
+    """Records of one search page, parsed from the body as it arrives.
+
+    After open(), `meta` holds the page's meta block and `count` the
+    number of records it announces (min(limit, total - skip)). If the
+    meta block comes after the results, or doesn't give that number, the
+    records are parsed up front and counted instead.
+
+    Iterating over the page gives the records; items() also gives the
+    JSON text of each.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self.meta: dict = {}
+        self.count = 0
+        self._chunks = response.aiter_text()
+        self._parser = ResultsParser(keep_text=True)
+        self._records: deque[tuple[dict, str]] = deque()
+        self._eof = False
+
+    async def open(self) -> None:
+        """Read up to the meta block."""
+        fields = self._parser.fields
+        while "meta" not in fields and await self._read():
+            pass
+        meta = fields.get("meta")
+        self.meta = meta if isinstance(meta, dict) else {}
+        count = self._announced_count()
+        if count is None:
+            while await self._read():
+                pass
+            count = len(self._records)
+        self.count = count
+
+    def _announced_count(self) -> int | None:
+        results = self.meta.get("results") or {}
+        try:
+            limit = int(results["limit"])
+            total = int(results["total"])
+            skip = int(results.get("skip", 0))
+        except (KeyError, TypeError, ValueError):
+            return None
+        return max(0, min(limit, total - skip))
+
+    async def _read(self) -> bool:
+        """Parse the next chunk of the body; False once it is all read."""
+        if self._eof:
+            return False
+        try:
+            chunk = await anext(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                self._records.extend(self._parser.close())
+                return False
+            self._records.extend(self._parser.feed(chunk))
+        except ValueError:
+            raise OpenFDAError(
+                "OpenFDA returned a malformed response. Try again shortly."
+            )
+        return True
+
+    def __aiter__(self) -> "ResultPage":
+        return self
+
+    async def __anext__(self) -> dict:
+        return (await self._next())[0]
+
+    async def items(self) -> AsyncIterator[tuple[dict, str]]:
+        """The records with the JSON text each was parsed from."""
+        while self._records or await self._read():
+            while self._records:
+                yield self._records.popleft()
+
+    async def _next(self) -> tuple[dict, str]:
+        while not self._records:
+            if not await self._read():
+                raise StopAsyncIteration
+        return self._records.popleft()
 
 
 openfda_client = OpenFDAClient()
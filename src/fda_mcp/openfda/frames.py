@@ -0,0 +1,447 @@
+"""Columnar frames of fetched records for local group-by.
+
+openFDA count queries aggregate a single field over exact terms. The
+aggregate_records tool fetches the matching records instead (see
+OpenFDAClient.paginate) and groups them here. It can group by several
+fields at once, by numbers cut into bands (age groups from
+patient.patientonsetage), and across nested arrays (drug x reaction).
+
+FrameBuilder turns each record into rows as soon as it is parsed. A field
+path that crosses a list gives one row per list item ("exploding" it).
+Fields under the same list stay aligned item by item, and fields under
+different lists give every combination. Rows go into compact arrays.
+Strings are dictionary-encoded: each row holds an int32 code, and each
+distinct string is stored once. Numbers are stored as float64, NaN when
+missing. Frame.group_by then runs vectorized with NumPy. Numbers with a
+unit field beside them (patient.patientonsetage and its
+patientonsetageunit) are converted to one unit first; see UNIT_FIELDS.
+
+NumPy is an optional dependency (pip install "fda-mcp[frames]").
+require_numpy raises MissingDependencyError without it.
+"""
+
+import importlib.util
+import itertools
+import math
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from fda_mcp.errors import MissingDependencyError
+from fda_mcp.openfda.tabular import collect_values
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Group label for rows where a key field is absent.
+MISSING = "(missing)"
+
+AGGREGATES = ("records", "rows", "sum", "mean", "min", "max")
+
+# FAERS age unit codes (patient.patientonsetageunit) -> years.
+AGE_UNITS = {
+    "800": 10.0,  # decade
+    "801": 1.0,  # year
+    "802": 1 / 12,  # month
+    "803": 7 / 365.25,  # week
+    "804": 1 / 365.25,  # day
+    "805": 1 / 8766,  # hour
+}
+
+# Numeric fields reported in a unit given by another field: the unit
+# field's path and its code -> scale table. Values are multiplied by the
+# scale; without a unit the value is taken as is (in FAERS, years), and
+# with an unknown code it is treated as missing.
+UNIT_FIELDS: dict[str, tuple[str, dict[str, float]]] = {
+    "patient.patientonsetage": ("patient.patientonsetageunit", AGE_UNITS),
+}
+
+
+def numpy_available() -> bool:
+    """Whether NumPy can be imported on this host."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def require_numpy() -> Any:
+    """Import NumPy, or raise MissingDependencyError."""
+    if not numpy_available():
+        raise MissingDependencyError("numpy", "frames", "Local aggregation")
+    import numpy
+
+    return numpy
+
+
+class GroupKey:
+    """A field to group by, cut into bands when edges are given.
+
+    With edges [18, 45, 65], values fall into "<18", "18-45", "45-65"
+    and "65+". Each band includes its lower edge.
+    """
+
+    __slots__ = ("path", "edges")
+
+    def __init__(self, path: str, edges: list[float] | None = None) -> None:
+        self.path = path
+        self.edges = tuple(sorted(edges)) if edges else None
+
+    def labels(self) -> list[str]:
+        """Band labels in order, for banded keys."""
+        edges = self.edges or ()
+        return [
+            f"<{edges[0]:g}",
+            *(f"{lo:g}-{hi:g}" for lo, hi in zip(edges, edges[1:])),
+            f"{edges[-1]:g}+",
+        ]
+
+
+def _split(record: dict, keys: tuple[str, ...]) -> tuple[tuple[str, ...] | None, Any]:
+    """The path up to its first list, and that list.
+
+    Returns (None, value) for paths that cross no list, value being the
+    leaf (None if absent).
+    """
+    value: Any = record
+    for i, key in enumerate(keys):
+        if isinstance(value, list):
+            return keys[:i], value
+        if not isinstance(value, dict):
+            return None, None
+        value = value.get(key)
+    if isinstance(value, list):
+        return keys, value
+    return None, value
+
+
+Part = tuple[list[int], list[tuple]]
+
+
+def _parts(record: dict, paths: list[tuple[str, ...]]) -> list[Part]:
+    """A record's rows per list: path indexes and their (value, item) pairs.
+
+    The item index numbers a path's values within the record, so a row
+    repeated only because of another path's list can be told apart. The
+    record's rows are every combination of one row from each part (see
+    _cross); each part holds only as many rows as its own list.
+    """
+    fixed: dict[int, list[tuple[Any, int]]] = {}
+    lists: dict[tuple[str, ...], tuple[list, list[int]]] = {}
+    for j, keys in enumerate(paths):
+        prefix, node = _split(record, keys)
+        if prefix is None:
+            fixed[j] = [(node, 0)]
+        else:
+            lists.setdefault(prefix, (node, []))[1].append(j)
+
+    # Rows of each list: its items, each exploded over the values of the
+    # paths below it.
+    parts: list[Part] = []
+    for prefix, (node, columns) in lists.items():
+        rows: list[tuple] = []
+        seen = dict.fromkeys(columns, 0)
+        for item in node:
+            values = []
+            for j in columns:
+                leaves: list[Any] = []
+                collect_values(item, paths[j][len(prefix):], leaves)
+                start = seen[j]
+                seen[j] += len(leaves)
+                values.append(
+                    [(leaf, start + k) for k, leaf in enumerate(leaves)]
+                    or [(None, 0)]
+                )
+            rows.extend(itertools.product(*values))
+        parts.append((columns, rows or [((None, 0),) * len(columns)]))
+    for j, value in fixed.items():
+        parts.append(([j], [(pair,) for pair in value]))
+    return parts
+
+
+def _row_count(parts: list[Part]) -> int:
+    return math.prod(len(rows) for _, rows in parts)
+
+
+def _cross(parts: list[Part], width: int) -> list[tuple]:
+    """Rows of a record from its parts: per path, a (value, item) pair."""
+    out = []
+    for combination in itertools.product(*(rows for _, rows in parts)):
+        row: list[Any] = [None] * width
+        for (columns, _), values in zip(parts, combination):
+            for j, pair in zip(columns, values):
+                row[j] = pair
+        out.append(tuple(row))
+    return out
+
+
+def _text(value: Any) -> str | None:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    return None
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _scale(record: dict, unit: tuple[tuple[str, ...], dict[str, float]] | None) -> float:
+    """Factor converting a record's value to UNIT_FIELDS' common unit."""
+    if unit is None:
+        return 1.0
+    keys, scales = unit
+    _, code = _split(record, keys)
+    if code is None:
+        return 1.0
+    return scales.get(_text(code) or "", math.nan)
+
+
+class FrameBuilder:
+    """Accumulates records into columns; frame() returns the Frame.
+
+    Args:
+        strings: Field paths stored as dictionary-encoded strings.
+        numbers: Field paths stored as numbers.
+        max_rows: Stop accepting records once this many rows are held.
+    """
+
+    def __init__(
+        self,
+        strings: list[str],
+        numbers: list[str],
+        max_rows: int | None = None,
+    ) -> None:
+        self.strings = list(dict.fromkeys(strings))
+        self.numbers = list(dict.fromkeys(numbers))
+        self.max_rows = max_rows
+        self.paths = list(dict.fromkeys(self.strings + self.numbers))
+        self._keys = [tuple(path.split(".")) for path in self.paths]
+        self._string_slots = [self.paths.index(path) for path in self.strings]
+        self._number_slots = [self.paths.index(path) for path in self.numbers]
+        self._units = [
+            (tuple(UNIT_FIELDS[path][0].split(".")), UNIT_FIELDS[path][1])
+            if path in UNIT_FIELDS
+            else None
+            for path in self.numbers
+        ]
+        self._codes = {path: array("i") for path in self.strings}
+        self._lookup: dict[str, dict[str, int]] = {path: {} for path in self.strings}
+        self._values = {path: array("d") for path in self.numbers}
+        self._items = {path: array("i") for path in self.numbers}
+        self._record = array("i")
+        self.records = 0
+        self.rows = 0
+        self.full = False
+
+    def add(self, record: dict) -> bool:
+        """Add a record's rows; False once max_rows is reached."""
+        if self.full:
+            return False
+        # Rows are counted before they are built: crossing long lists (a
+        # report's drugs x reactions) can make far more than max_rows.
+        parts = _parts(record, self._keys)
+        count = _row_count(parts)
+        if self.max_rows is not None and self.rows + count > self.max_rows:
+            self.full = True
+            return False
+        rows = _cross(parts, len(self._keys))
+        index = self.records
+        self.records += 1
+        self.rows += len(rows)
+        self._record.extend([index] * len(rows))
+        for path, slot in zip(self.strings, self._string_slots):
+            codes = self._codes[path]
+            lookup = self._lookup[path]
+            for row in rows:
+                text = _text(row[slot][0])
+                if text is None:
+                    codes.append(-1)
+                    continue
+                code = lookup.get(text)
+                if code is None:
+                    code = lookup[text] = len(lookup)
+                codes.append(code)
+        for path, slot, unit in zip(self.numbers, self._number_slots, self._units):
+            values = self._values[path]
+            items = self._items[path]
+            scale = _scale(record, unit)
+            for row in rows:
+                value, item = row[slot]
+                values.append(_number(value) * scale)
+                items.append(item)
+        return True
+
+    def frame(self) -> "Frame":
+        np = require_numpy()
+        return Frame(
+            codes={
+                path: np.frombuffer(codes, dtype=np.int32)
+                for path, codes in self._codes.items()
+            },
+            categories={path: list(lookup) for path, lookup in self._lookup.items()},
+            numbers={
+                path: np.frombuffer(values, dtype=np.float64)
+                for path, values in self._values.items()
+            },
+            items={
+                path: np.frombuffer(items, dtype=np.int32)
+                for path, items in self._items.items()
+            },
+            record=np.frombuffer(self._record, dtype=np.int32),
+            records=self.records,
+        )
+
+
+class Grouping:
+    """Result of Frame.group_by, one entry per group.
+
+    labels holds a tuple of key labels per group. values is the
+    aggregate, rows the number of rows, and records the number of
+    distinct records in each group.
+    """
+
+    __slots__ = ("labels", "values", "rows", "records")
+
+    def __init__(
+        self,
+        labels: list[tuple[str, ...]],
+        values: "np.ndarray",
+        rows: "np.ndarray",
+        records: "np.ndarray",
+    ) -> None:
+        self.labels = labels
+        self.values = values
+        self.rows = rows
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def top(self, limit: int) -> list[int]:
+        """Group indexes by descending value (NaN last), then label."""
+        order = sorted(
+            range(len(self.labels)),
+            key=lambda i: (
+                math.isnan(self.values[i]),
+                -self.values[i] if not math.isnan(self.values[i]) else 0,
+                self.labels[i],
+            ),
+        )
+        return order[:limit]
+
+
+class Frame:
+    """Columns of exploded rows built by FrameBuilder.
+
+    codes and categories hold the dictionary-encoded string columns (code
+    -1 when missing); numbers the numeric columns (NaN when missing),
+    with items numbering each row's value within its record; record the
+    index of the record each row came from.
+    """
+
+    def __init__(
+        self,
+        codes: dict[str, "np.ndarray"],
+        categories: dict[str, list[str]],
+        numbers: dict[str, "np.ndarray"],
+        items: dict[str, "np.ndarray"],
+        record: "np.ndarray",
+        records: int,
+    ) -> None:
+        self.codes = codes
+        self.categories = categories
+        self.numbers = numbers
+        self.items = items
+        self.record = record
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.record)
+
+    def key_codes(self, key: GroupKey) -> tuple["np.ndarray", list[str]]:
+        """Group codes per row for a key, and the label of each code."""
+        np = require_numpy()
+        if key.edges is None:
+            codes = self.codes[key.path]
+            labels = [*self.categories[key.path], MISSING]
+            return np.where(codes < 0, len(labels) - 1, codes), labels
+        values = self.numbers[key.path]
+        labels = [*key.labels(), MISSING]
+        codes = np.searchsorted(np.asarray(key.edges), values, side="right")
+        return np.where(np.isnan(values), len(labels) - 1, codes), labels
+
+    def group_by(
+        self,
+        keys: list[GroupKey],
+        aggregate: str = "records",
+        value: str | None = None,
+    ) -> Grouping:
+        """Group rows by the keys' values and aggregate each group.
+
+        Args:
+            keys: Fields to group by (at least one).
+            aggregate: "records" (distinct records), "rows" (exploded
+                rows), or "sum", "mean", "min", "max" of value. Value
+                aggregates count each value once per record, however
+                many rows other keys' lists repeat it on, and skip
+                missing values.
+            value: Numeric field for the value aggregates.
+        """
+        np = require_numpy()
+        if not len(self):
+            empty = np.zeros(0)
+            return Grouping([], empty, empty, empty)
+        columns = []
+        labels = []
+        for key in keys:
+            codes, names = self.key_codes(key)
+            columns.append(codes)
+            labels.append(names)
+        unique, inverse = np.unique(
+            np.stack(columns, axis=1), axis=0, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        groups = len(unique)
+        group_labels = [
+            tuple(names[code] for names, code in zip(labels, row))
+            for row in unique.tolist()
+        ]
+
+        rows = np.bincount(inverse, minlength=groups)
+        pairs = np.unique(np.stack([inverse, self.record], axis=1), axis=0)
+        records = np.bincount(pairs[:, 0], minlength=groups)
+        if aggregate == "records":
+            return Grouping(group_labels, records.astype(float), rows, records)
+        if aggregate == "rows":
+            return Grouping(group_labels, rows.astype(float), rows, records)
+
+        numbers = self.numbers[value]
+        # One row per (group, record, value item), so that values aren't
+        # counted again on rows repeated by the other keys' lists.
+        _, first = np.unique(
+            np.stack([inverse, self.record, self.items[value]], axis=1),
+            axis=0,
+            return_index=True,
+        )
+        present = first[~np.isnan(numbers[first])]
+        group = inverse[present]
+        numbers = numbers[present]
+        counts = np.bincount(group, minlength=groups)
+        if aggregate in ("sum", "mean"):
+            result = np.bincount(group, weights=numbers, minlength=groups)
+            if aggregate == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = result / counts
+        elif aggregate == "min":
+            result = np.full(groups, np.inf)
+            np.minimum.at(result, group, numbers)
+        elif aggregate == "max":
+            result = np.full(groups, -np.inf)
+            np.maximum.at(result, group, numbers)
+        else:
+            raise ValueError(f"Unknown aggregate {aggregate!r}")
+        result = np.where(counts > 0, result, np.nan)
+        return Grouping(group_labels, result, rows, records)
@@ -0,0 +1,101 @@
+"""Bounded JSON preview for records without a summary spec.
+
+The generic summarizer shows a record as indented JSON cut to a few
+thousand characters. Serializing the whole record first and slicing
+wastes most of the work on large nested records (label sections, GSRS
+substance trees). json_preview walks the record depth-first instead and
+stops as soon as the preview is full, so its cost follows the output size.
+Long arrays show their first items and a count of the rest.
+
+Up to the cut and apart from elided arrays, the text is identical to
+json.dumps(value, indent=2, default=str).
+"""
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+# Array items shown before the rest are summarized as a count.
+PREVIEW_ITEMS = 10
+
+
+class _Full(Exception):
+    """The preview has reached max_chars."""
+
+
+def json_preview(value: Any, max_chars: int, max_items: int = PREVIEW_ITEMS) -> str:
+    """Indented JSON for value, stopped at max_chars characters.
+
+    Args:
+        value: JSON-like data (dicts, lists, scalars). Other objects are
+            shown as strings.
+        max_chars: Length of the preview; longer output is cut off.
+        max_items: Items shown per array. Longer arrays end with a
+            "... N more items" string.
+    """
+    parts: list[str] = []
+    left = max_chars
+
+    def write(text: str) -> None:
+        nonlocal left
+        if len(text) >= left:
+            parts.append(text[:left])
+            left = 0
+            raise _Full
+        parts.append(text)
+        left -= len(text)
+
+    def string(text: str) -> str:
+        # Escaping never shortens text, so encoding a prefix of `left`
+        # characters is enough for whatever part of it can still be shown.
+        return encode_basestring_ascii(text[:left])
+
+    def scalar(value: Any) -> str:
+        if isinstance(value, str):
+            return string(value)
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return json.dumps(value)
+        return string(str(value))
+
+    def walk(value: Any, indent: str) -> None:
+        if isinstance(value, dict):
+            if not value:
+                write("{}")
+                return
+            inner = indent + "  "
+            separator = "{\n" + inner
+            for key, item in value.items():
+                key = key if isinstance(key, str) else json.dumps(key, default=str)
+                write(f"{separator}{string(key)}: ")
+                separator = ",\n" + inner
+                walk(item, inner)
+            write("\n" + indent + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                write("[]")
+                return
+            inner = indent + "  "
+            separator = "[\n" + inner
+            for item in value[:max_items]:
+                write(separator)
+                separator = ",\n" + inner
+                walk(item, inner)
+            if len(value) > max_items:
+                write(f'{separator}"... {len(value) - max_items} more items"')
+            write("\n" + indent + "]")
+        else:
+            write(scalar(value))
+
+    try:
+        walk(value, "")
+    except _Full:
+        pass
+    return "".join(parts)
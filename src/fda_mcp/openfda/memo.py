@@ -0,0 +1,130 @@
+"""Memo of rendered record summaries across pages and queries.
+
+Paging with overlapping skips, re-sorting, and repeating a query all hand
+the same records (one safetyreportid, k_number or recall_number) to the
+summarizers again. The page writers (summarizer.PageWriter) keep each
+record's full, unbudgeted rendering here, keyed by endpoint, record ID,
+a fingerprint of the record's content, and output format. A record seen
+before is then copied instead of rendered, and its memoized text is also
+used under a budget whenever it fits the record's share unchanged. Under
+a budget, a record seen for the first time is only memoized when its
+fitted rendering needed no cuts.
+
+The fingerprint is the hash of the JSON text the record was parsed from
+(see OpenFDAClient.stream), which costs next to nothing to compute.
+Records given as decoded dicts alone are not memoized: encoding them
+again to fingerprint them takes longer than the compiled plans take to
+render them (benchmarks/bench_memo.py). `hits` and `misses` count
+lookups.
+"""
+
+from collections import OrderedDict
+from typing import Hashable
+
+from fda_mcp.config import config
+
+# Top-level field that identifies a record, per endpoint. Records of other
+# endpoints, or without the field, are not memoized.
+RECORD_IDS: dict[str, str] = {
+    "drug/event": "safetyreportid",
+    "drug/label": "id",
+    "drug/ndc": "product_id",
+    "drug/enforcement": "recall_number",
+    "drug/drugsfda": "application_number",
+    "device/event": "mdr_report_key",
+    "device/510k": "k_number",
+    "device/pma": "pma_number",
+    "device/classification": "product_code",
+    "device/enforcement": "recall_number",
+    "device/recall": "product_res_number",
+    "device/udi": "public_device_record_key",
+    "food/event": "report_number",
+    "food/enforcement": "recall_number",
+    "other/substance": "unii",
+    "other/unii": "unii",
+}
+
+MemoKey = tuple[str, str, int, Hashable]
+
+
+def memo_key(
+    endpoint: str, fmt: Hashable, record: dict, raw: str
+) -> MemoKey | None:
+    """Key of a record's rendering in `fmt`, or None if not memoizable.
+
+    Args:
+        endpoint: The API path the record came from.
+        fmt: Output format ("summary", "table").
+        record: The decoded record.
+        raw: The JSON text it was decoded from.
+    """
+    id_field = RECORD_IDS.get(endpoint)
+    if id_field is None:
+        return None
+    record_id = record.get(id_field)
+    if not isinstance(record_id, str):
+        return None
+    return (endpoint, record_id, hash(raw), fmt)
+
+
+class SummaryMemo:
+    """LRU of rendered records, bounded by total characters."""
+
+    def __init__(self, max_chars: int | None = None) -> None:
+        self._max_chars = max_chars
+        self._entries: OrderedDict[MemoKey, str] = OrderedDict()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_chars(self) -> int:
+        if self._max_chars is None:
+            return config.summary_memo_max_chars
+        return self._max_chars
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_chars > 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: MemoKey) -> str | None:
+        text = self._entries.get(key)
+        if text is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def put(self, key: MemoKey, text: str) -> None:
+        size = len(text)
+        if size > self.max_chars:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._chars -= len(old)
+        self._entries[key] = text
+        self._chars += size
+        while self._chars > self.max_chars:
+            _, evicted = self._entries.popitem(last=False)
+            self._chars -= len(evicted)
+
+    def __contains__(self, key: MemoKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+
+
+summary_memo = SummaryMemo()
@@ -0,0 +1,143 @@
+"""Cache of search pages from the most-queried endpoints.
+
+search_fda is often called again with the same query: for the table after
+the summary, with another max_length, or to come back to earlier results.
+Pages of the endpoints with record models (records.RECORD_MODELS) are kept
+here, keyed by endpoint, search, limit, skip and sort, so such a repeat is
+answered without another request to openFDA. Records are held as their
+compact models, which keep only the fields the summaries and tables print;
+projections (`fields`) need the whole record and always go to openFDA.
+
+Only pages read to the end are cached. Entries expire `ttl` seconds after
+they were stored, and the least recently used pages are dropped once the
+cache holds more than `max_records` records. `hits` and `misses` count
+lookups.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Iterator
+
+from fda_mcp.config import config
+from fda_mcp.openfda.records import RECORD_MODELS, RecordModel, to_model
+
+# (endpoint, search, limit, skip, sort)
+PageKey = tuple[str, str | None, int | None, int | None, str | None]
+
+
+def compact(endpoint: str, record: dict) -> RecordModel | dict:
+    """The record's model, or the record itself if it has none."""
+    model = to_model(endpoint, record)
+    return record if model is None else model
+
+
+class CachedPage:
+    """A cached page: its meta, announced count and records."""
+
+    __slots__ = ("meta", "count", "records", "expires")
+
+    def __init__(
+        self,
+        meta: dict,
+        count: int,
+        records: list[RecordModel | dict],
+        expires: float,
+    ) -> None:
+        self.meta = meta
+        self.count = count
+        self.records = records
+        self.expires = expires
+
+    def __iter__(self) -> Iterator[dict]:
+        for record in self.records:
+            yield record if isinstance(record, dict) else record.as_record()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class PageCache:
+    """LRU of search pages, bounded by total records and by age."""
+
+    def __init__(
+        self, max_records: int | None = None, ttl: float | None = None
+    ) -> None:
+        self._max_records = max_records
+        self._ttl = ttl
+        self._entries: OrderedDict[PageKey, CachedPage] = OrderedDict()
+        self._records = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_records(self) -> int:
+        if self._max_records is None:
+            return config.page_cache_max_records
+        return self._max_records
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is None:
+            return config.page_cache_ttl
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_records > 0 and self.ttl > 0
+
+    def caches(self, endpoint: str) -> bool:
+        """Whether pages of the endpoint are cached."""
+        return self.enabled and endpoint in RECORD_MODELS
+
+    def get(self, key: PageKey) -> CachedPage | None:
+        """The unexpired page at key; lookups for other endpoints aren't counted."""
+        if not self.caches(key[0]):
+            return None
+        page = self._entries.get(key)
+        if page is not None and page.expires <= time.monotonic():
+            self._drop(key)
+            page = None
+        if page is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return page
+
+    def put(
+        self,
+        key: PageKey,
+        meta: dict,
+        count: int,
+        records: list[RecordModel | dict],
+    ) -> None:
+        """Cache a page read to the end; records as given by compact()."""
+        if not self.caches(key[0]) or len(records) > self.max_records:
+            return
+        self._drop(key)
+        self._entries[key] = CachedPage(
+            meta, count, records, time.monotonic() + self.ttl
+        )
+        self._records += len(records)
+        while self._records > self.max_records:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: PageKey) -> None:
+        page = self._entries.pop(key, None)
+        if page is not None:
+            self._records -= len(page)
+
+    def __contains__(self, key: PageKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._records = 0
+        self.hits = 0
+        self.misses = 0
+
+
+page_cache = PageCache()
@@ -0,0 +1,404 @@
+"""Compact record models for the most-queried endpoints.
+
+A decoded openFDA record is a tree of dicts with every key and value
+stored per record: about 3 KB for a typical drug/event report, most of it
+dict overhead and copies of the same few strings ("Class II", "Ongoing",
+MedDRA reaction terms). The page cache (pagecache) holds search results
+of these endpoints as models instead: one `__slots__` object per record
+or nested item, only the fields the summaries and tables print, and
+values from closed code lists interned so every record shares one copy.
+Free text (names, narratives, dates) is kept per record.
+
+Each model is built with from_record() and turned back into the openFDA
+shape, restricted to its fields, with as_record(); the summaries and
+table rows of that dict are the same as those of the original record.
+Null values are kept as NULL. Records a model can't reproduce that way
+(say, an object where a list of objects is expected) get no model; see
+to_model(). See
+benchmarks/bench_records.py for memory use.
+"""
+
+import sys
+from typing import Any
+
+
+class _Unfit(Exception):
+    """The record has a shape its model does not reproduce."""
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Null:
+    """An explicit null, which the summaries print unlike a missing field."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NULL"
+
+
+NULL = _Null()
+
+
+def _get(record: dict, key: str) -> Any:
+    """record[key]: None if absent, NULL if null."""
+    value = record.get(key)
+    if value is None and key in record:
+        return NULL
+    return value
+
+
+def _objects(record: dict, key: str) -> list[dict]:
+    """The items of a list of objects at key; anything else is unfit."""
+    value = _get(record, key)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(
+        isinstance(item, dict) for item in value
+    ):
+        raise _Unfit(key)
+    return value
+
+
+def _put(record: dict, key: str, value: Any) -> dict:
+    """Set key unless value is None, so summarizer defaults still apply."""
+    if value is NULL:
+        record[key] = None
+    elif value is not None:
+        record[key] = value
+    return record
+
+
+class RecordModel:
+    """Base for slotted record models: equality and repr from the slots."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record: dict) -> "RecordModel":
+        raise NotImplementedError
+
+    def as_record(self) -> dict:
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({values})"
+
+
+class DrugEventDrug(RecordModel):
+    """One patient.drug[] item of a drug/event report."""
+
+    __slots__ = ("medicinalproduct", "drugcharacterization")
+
+    def __init__(
+        self, medicinalproduct: str | None, drugcharacterization: str | None
+    ) -> None:
+        self.medicinalproduct = medicinalproduct
+        self.drugcharacterization = drugcharacterization
+
+    @classmethod
+    def from_record(cls, record: dict) -> "DrugEventDrug":
+        return cls(
+            _get(record, "medicinalproduct"),
+            _intern(_get(record, "drugcharacterization")),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        _put(record, "medicinalproduct", self.medicinalproduct)
+        _put(record, "drugcharacterization", self.drugcharacterization)
+        return record
+
+
+class DrugEvent(RecordModel):
+    """A drug/event (FAERS) report.
+
+    `reactions` holds the patient.reaction[] MedDRA terms, which come
+    from a controlled vocabulary and are interned like the codes.
+    """
+
+    __slots__ = (
+        "safetyreportid", "receiptdate", "serious", "seriousnessdeath",
+        "reactions", "drugs",
+    )
+
+    def __init__(
+        self,
+        safetyreportid: str | None,
+        receiptdate: str | None = None,
+        serious: str | None = None,
+        seriousnessdeath: str | None = None,
+        reactions: tuple[str | None, ...] = (),
+        drugs: tuple[DrugEventDrug, ...] = (),
+    ) -> None:
+        self.safetyreportid = safetyreportid
+        self.receiptdate = receiptdate
+        self.serious = serious
+        self.seriousnessdeath = seriousnessdeath
+        self.reactions = reactions
+        self.drugs = drugs
+
+    @classmethod
+    def from_record(cls, record: dict) -> "DrugEvent":
+        patient = _get(record, "patient")
+        if patient is None:
+            patient = {}
+        elif not isinstance(patient, dict):
+            raise _Unfit("patient")
+        return cls(
+            _get(record, "safetyreportid"),
+            _get(record, "receiptdate"),
+            _intern(_get(record, "serious")),
+            _intern(_get(record, "seriousnessdeath")),
+            tuple(
+                _intern(_get(reaction, "reactionmeddrapt"))
+                for reaction in _objects(patient, "reaction")
+            ),
+            tuple(
+                DrugEventDrug.from_record(drug)
+                for drug in _objects(patient, "drug")
+            ),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        _put(record, "safetyreportid", self.safetyreportid)
+        _put(record, "receiptdate", self.receiptdate)
+        _put(record, "serious", self.serious)
+        _put(record, "seriousnessdeath", self.seriousnessdeath)
+        patient: dict = {}
+        if self.reactions:
+            patient["reaction"] = [
+                _put({}, "reactionmeddrapt", term) for term in self.reactions
+            ]
+        if self.drugs:
+            patient["drug"] = [drug.as_record() for drug in self.drugs]
+        if patient:
+            record["patient"] = patient
+        return record
+
+
+class DeviceEventDevice(RecordModel):
+    """One device[] item of a device/event (MAUDE) report."""
+
+    __slots__ = ("generic_name", "brand_name", "manufacturer_d_name")
+
+    def __init__(
+        self,
+        generic_name: str | None,
+        brand_name: str | None,
+        manufacturer_d_name: str | None,
+    ) -> None:
+        self.generic_name = generic_name
+        self.brand_name = brand_name
+        self.manufacturer_d_name = manufacturer_d_name
+
+    @classmethod
+    def from_record(cls, record: dict) -> "DeviceEventDevice":
+        return cls(
+            _get(record, "generic_name"),
+            _get(record, "brand_name"),
+            _get(record, "manufacturer_d_name"),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        _put(record, "generic_name", self.generic_name)
+        _put(record, "brand_name", self.brand_name)
+        _put(record, "manufacturer_d_name", self.manufacturer_d_name)
+        return record
+
+
+class DeviceEvent(RecordModel):
+    """A device/event (MAUDE) report.
+
+    `narratives` holds the mdr_text[] texts and `outcomes` the patients'
+    sequence_number_outcome values, flattened.
+    """
+
+    __slots__ = (
+        "mdr_report_key", "date_received", "event_type", "devices",
+        "narratives", "outcomes",
+    )
+
+    def __init__(
+        self,
+        mdr_report_key: str | None,
+        date_received: str | None = None,
+        event_type: str | None = None,
+        devices: tuple[DeviceEventDevice, ...] = (),
+        narratives: tuple[str | None, ...] = (),
+        outcomes: tuple[str, ...] = (),
+    ) -> None:
+        self.mdr_report_key = mdr_report_key
+        self.date_received = date_received
+        self.event_type = event_type
+        self.devices = devices
+        self.narratives = narratives
+        self.outcomes = outcomes
+
+    @classmethod
+    def from_record(cls, record: dict) -> "DeviceEvent":
+        outcomes: list[str] = []
+        for patient in _objects(record, "patient"):
+            values = _get(patient, "sequence_number_outcome")
+            if values is None:
+                continue
+            if not isinstance(values, list):
+                raise _Unfit("sequence_number_outcome")
+            outcomes.extend(_intern(value) for value in values)
+        return cls(
+            _get(record, "mdr_report_key"),
+            _get(record, "date_received"),
+            _intern(_get(record, "event_type")),
+            tuple(
+                DeviceEventDevice.from_record(device)
+                for device in _objects(record, "device")
+            ),
+            tuple(_get(text, "text") for text in _objects(record, "mdr_text")),
+            tuple(outcomes),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        _put(record, "mdr_report_key", self.mdr_report_key)
+        _put(record, "date_received", self.date_received)
+        _put(record, "event_type", self.event_type)
+        if self.devices:
+            record["device"] = [device.as_record() for device in self.devices]
+        if self.narratives:
+            record["mdr_text"] = [_put({}, "text", text) for text in self.narratives]
+        if self.outcomes:
+            record["patient"] = [{"sequence_number_outcome": list(self.outcomes)}]
+        return record
+
+
+class Device510k(RecordModel):
+    """A device/510k premarket notification."""
+
+    __slots__ = (
+        "k_number", "device_name", "applicant", "decision_description",
+        "decision_date", "product_code", "review_panel",
+    )
+
+    def __init__(
+        self,
+        k_number: str | None,
+        device_name: str | None = None,
+        applicant: str | None = None,
+        decision_description: str | None = None,
+        decision_date: str | None = None,
+        product_code: str | None = None,
+        review_panel: str | None = None,
+    ) -> None:
+        self.k_number = k_number
+        self.device_name = device_name
+        self.applicant = applicant
+        self.decision_description = decision_description
+        self.decision_date = decision_date
+        self.product_code = product_code
+        self.review_panel = review_panel
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Device510k":
+        return cls(
+            _get(record, "k_number"),
+            _get(record, "device_name"),
+            _get(record, "applicant"),
+            _intern(_get(record, "decision_description")),
+            _get(record, "decision_date"),
+            _get(record, "product_code"),
+            _intern(_get(record, "review_panel")),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        for name in self.__slots__:
+            _put(record, name, getattr(self, name))
+        return record
+
+
+class Enforcement(RecordModel):
+    """A drug, device or food enforcement (recall) report."""
+
+    __slots__ = (
+        "recall_number", "classification", "status", "recalling_firm",
+        "product_description", "reason_for_recall", "distribution_pattern",
+        "report_date",
+    )
+
+    def __init__(
+        self,
+        recall_number: str | None,
+        classification: str | None = None,
+        status: str | None = None,
+        recalling_firm: str | None = None,
+        product_description: str | None = None,
+        reason_for_recall: str | None = None,
+        distribution_pattern: str | None = None,
+        report_date: str | None = None,
+    ) -> None:
+        self.recall_number = recall_number
+        self.classification = classification
+        self.status = status
+        self.recalling_firm = recalling_firm
+        self.product_description = product_description
+        self.reason_for_recall = reason_for_recall
+        self.distribution_pattern = distribution_pattern
+        self.report_date = report_date
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Enforcement":
+        return cls(
+            _get(record, "recall_number"),
+            _intern(_get(record, "classification")),
+            _intern(_get(record, "status")),
+            _get(record, "recalling_firm"),
+            _get(record, "product_description"),
+            _get(record, "reason_for_recall"),
+            _get(record, "distribution_pattern"),
+            _get(record, "report_date"),
+        )
+
+    def as_record(self) -> dict:
+        record: dict = {}
+        for name in self.__slots__:
+            _put(record, name, getattr(self, name))
+        return record
+
+
+RECORD_MODELS: dict[str, type[RecordModel]] = {
+    "drug/event": DrugEvent,
+    "drug/enforcement": Enforcement,
+    "device/event": DeviceEvent,
+    "device/510k": Device510k,
+    "device/enforcement": Enforcement,
+    "food/enforcement": Enforcement,
+}
+
+
+def to_model(endpoint: str, record: dict) -> RecordModel | None:
+    """The compact model of a record.
+
+    None if the endpoint has no model, or the record has a shape its
+    model does not reproduce.
+    """
+    model = RECORD_MODELS.get(endpoint)
+    if model is None or not isinstance(record, dict):
+        return None
+    try:
+        return model.from_record(record)
+    except _Unfit:
+        return None
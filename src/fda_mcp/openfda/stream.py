@@ -0,0 +1,181 @@
+"""Incremental parsing of openFDA search responses.
+
+A search page is one JSON object, {"meta": {...}, "results": [...]}, and
+a 1000-record drug/event or drug/label page decodes to tens of MB of
+dicts. ResultsParser is fed the body as it arrives and hands back each
+results[] item as soon as its closing bracket is in, so callers can
+summarize a record and drop it before the next one is parsed. Other
+top-level values (meta) are decoded whole into `fields`.
+
+Items are decoded with the stdlib decoder as soon as they may be
+complete. A decode that fails on a partial item is retried only once the
+buffered part has doubled, so the wasted work stays below twice the
+item's size however the body is split into chunks.
+
+This path stays on the stdlib rather than the configured codec
+(fda_mcp.jsoncodec): orjson and msgspec have no raw_decode, so each item's
+span would first have to be delimited in Python. A bracket-matching scan
+(strings skipped by regex) then orjson.loads of the span measured 2-7x
+slower than raw_decode alone on the benchmarks/_samples pages.
+"""
+
+import json
+import re
+from typing import Any
+
+_KEY_RE = re.compile(r'\s*("[^"\\]*(?:\\.[^"\\]*)*")\s*:', re.DOTALL)
+_WS_RE = re.compile(r"[ \t\n\r]*")
+
+_decoder = json.JSONDecoder()
+
+
+class ResultsParser:
+    """Push parser for a response body, yielding results[] items.
+
+    feed() returns the items completed by each chunk, and close() any
+    still held back at the end of the body. Top-level values other than
+    results are stored in `fields` once complete; `done` is set when the
+    closing brace has been read. Malformed input is only reported by
+    close(), since until then it can't be told from input that is merely
+    incomplete.
+
+    With keep_text, items are returned as (item, text) pairs, text being
+    the JSON the item was decoded from.
+    """
+
+    def __init__(self, keep_text: bool = False) -> None:
+        self.keep_text = keep_text
+        self.fields: dict[str, Any] = {}
+        self.done = False
+        # Text being parsed and the position in it; between feeds, the
+        # unparsed input is kept in _chunks.
+        self._buf = ""
+        self._pos = 0
+        self._chunks: list[str] = []
+        self._size = 0
+        # "start", "key", "value", "items" or "end".
+        self._state = "start"
+        self._key = ""
+        # Unparsed length at which to retry decoding a partial value.
+        self._retry_at = 0
+
+    def feed(self, text: str) -> list[Any]:
+        """Add the next chunk of the body; returns the completed items."""
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size < self._retry_at:
+            return []
+        self._buf = "".join(self._chunks)
+        self._pos = 0
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        rest = self._buf[self._pos:]
+        self._retry_at -= self._pos
+        self._buf, self._pos = "", 0
+        self._chunks, self._size = [rest], len(rest)
+        return items
+
+    def close(self) -> list[Any]:
+        """Finish parsing at the end of the body; returns the last items.
+
+        Raises:
+            ValueError: The body was incomplete or not valid JSON.
+        """
+        self._retry_at = 0
+        items = self.feed("")
+        if not self.done:
+            raise ValueError("Response body is incomplete or not valid JSON")
+        return items
+
+    def _step(self, items: list[Any]) -> bool:
+        """Parse one token or value; False when more input is needed."""
+        buf = self._buf
+        pos = _WS_RE.match(buf, self._pos).end()
+        if pos == len(buf):
+            self._pos = pos
+            return False
+        char = buf[pos]
+        state = self._state
+
+        if state == "start":
+            if char != "{":
+                raise ValueError("Response body is not a JSON object")
+            self._pos = pos + 1
+            self._state = "key"
+            return True
+
+        if state == "key":
+            if char == ",":
+                self._pos = pos + 1
+                return True
+            if char == "}":
+                self._pos = pos + 1
+                self._state = "end"
+                self.done = True
+                return False
+            match = _KEY_RE.match(buf, pos)
+            if match is None:
+                self._pos = pos
+                return False
+            self._key = json.loads(match.group(1))
+            self._pos = match.end()
+            self._state = "value"
+            return True
+
+        if state == "value":
+            if self._key == "results" and char == "[":
+                self._pos = pos + 1
+                self._state = "items"
+                return True
+            value, end = self._value(pos)
+            if end is None:
+                return False
+            self.fields[self._key] = value
+            self._pos = end
+            self._state = "key"
+            return True
+
+        if state == "items":
+            if char == ",":
+                self._pos = pos + 1
+                return True
+            if char == "]":
+                self._pos = pos + 1
+                self._state = "key"
+                return True
+            value, end = self._value(pos)
+            if end is None:
+                return False
+            items.append((value, buf[pos:end]) if self.keep_text else value)
+            self._pos = end
+            return True
+
+        return False
+
+    def _value(self, pos: int) -> tuple[Any, int | None]:
+        """Decode the value at pos, or (None, None) if it isn't complete."""
+        self._pos = pos
+        buf = self._buf
+        if buf[pos] in "{[":
+            if len(buf) < self._retry_at:
+                return None, None
+            try:
+                value, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                self._retry_at = pos + 2 * (len(buf) - pos)
+                return None, None
+            self._retry_at = 0
+            return value, end
+        # Scalars are short: retry the decode until a delimiter follows,
+        # so that a number split across chunks ("-25." + "5") isn't read
+        # in part.
+        try:
+            value, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            return None, None
+        following = _WS_RE.match(buf, end).end()
+        if following == len(buf) or buf[following] not in ",]}":
+            return None, None
+        return value, end
+
@@ -0,0 +1,169 @@
+"""Tabular search output: field projection and compact tables.
+
+search_fda's table format prints the endpoint's usual summary fields as a
+tab-separated table: a header row naming each field once, then one line
+per record (see summarizer.compile_table). With the `fields` option the
+templates are skipped altogether: only the requested dotted paths are
+pulled out of each record. Paths that pass through lists
+(patient.drug.openfda.brand_name) collect the distinct values found under
+every list item.
+
+Tables follow the same output budget as summarize_response. Each row gets
+an even share of what's left, its longest cells are cut first, and rows
+that still don't fit are counted rather than shown.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from fda_mcp.openfda.summarizer import (
+    TRUNCATED,
+    PageWriter,
+    SummaryWriter,
+    table_plan,
+    water_level,
+)
+
+LIST_SEPARATOR = ", "
+
+
+def _clean(text: str) -> str:
+    """Replace tabs and line breaks so a cell stays on one line."""
+    # Chained replace is several times faster than translate or split/join
+    # here, since most cells contain none of these characters.
+    return text.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
+def collect_values(value: Any, keys: tuple[str, ...], out: list[Any]) -> None:
+    """Append the leaf values at keys under value, descending into lists."""
+    for i, key in enumerate(keys):
+        if isinstance(value, list):
+            for item in value:
+                collect_values(item, keys[i:], out)
+            return
+        if not isinstance(value, dict):
+            return
+        value = value.get(key)
+    if isinstance(value, list):
+        out.extend(value)
+    elif value is not None:
+        out.append(value)
+
+
+@lru_cache(maxsize=256)
+def compile_projection(fields: tuple[str, ...]) -> Callable[[dict], list[str]]:
+    """Build a record -> row function for the given dotted field paths.
+
+    Each cell holds the field's value, or its distinct values joined with
+    ", " when the path crosses lists. Missing fields give empty cells.
+    """
+    paths = [tuple(field.split(".")) for field in fields]
+    plain = [path[0] if len(path) == 1 else None for path in paths]
+
+    def row(record: dict) -> list[str]:
+        cells = []
+        for path, key in zip(paths, plain):
+            if key is not None:
+                value = record.get(key)
+                if value is None:
+                    cells.append("")
+                    continue
+                if not isinstance(value, list):
+                    cells.append(str(value))
+                    continue
+                values = value
+            else:
+                values = []
+                collect_values(record, path, values)
+            cells.append(LIST_SEPARATOR.join(dict.fromkeys(map(str, values))))
+        return cells
+
+    return row
+
+
+class TableWriter(PageWriter):
+    """Page written as a header row and one tab-separated line per record.
+
+    Under a budget, the longest cells of a row are cut first to fit its
+    share.
+    """
+
+    separator = "\n"
+
+    def __init__(
+        self,
+        columns: list[str],
+        row: Callable[[dict], list[str]],
+        meta: dict,
+        count: int,
+        budget: int | None = None,
+    ) -> None:
+        super().__init__(meta, count, budget)
+        self.row = row
+        self.tabs = len(columns) - 1
+        self.reserve("\t".join(_clean(column) for column in columns))
+
+    def render(
+        self, record: dict, share: int | None, limit: int | None
+    ) -> str | None:
+        cells = self.row(record)
+        if share is None:
+            line = "\t".join(cells)
+            # Clean cell by cell only when some cell needs it.
+            if line.count("\t") != self.tabs or "\n" in line or "\r" in line:
+                line = "\t".join([_clean(cell) for cell in cells])
+            return line
+
+        lengths = [len(cell) for cell in cells]
+        level = water_level(lengths, share - self.tabs)
+        caps = lengths if level is None else [min(n, level) for n in lengths]
+        size = self.tabs + sum(
+            cap + (len(TRUNCATED) if n > cap else 0) for n, cap in zip(lengths, caps)
+        )
+        if size > limit:
+            return None
+        return "\t".join([
+            _clean(cell) if n <= cap else _clean(cell[:cap]) + TRUNCATED
+            for cell, n, cap in zip(cells, lengths, caps)
+        ])
+
+
+def table_writer(
+    endpoint: str, meta: dict, count: int, budget: int | None = None
+) -> PageWriter:
+    """Writer for the endpoint's summary fields as a table.
+
+    Endpoints without summary specs get the usual summaries instead.
+    """
+    plan = table_plan(endpoint)
+    if plan is None:
+        return SummaryWriter(endpoint, meta, count, budget)
+    columns, row = plan
+    writer = TableWriter(columns, row, meta, count, budget)
+    writer.memo = (endpoint, "table")
+    return writer
+
+
+def projection_writer(
+    fields: list[str], meta: dict, count: int, budget: int | None = None
+) -> TableWriter:
+    """Writer for a table of the requested fields."""
+    return TableWriter(fields, compile_projection(tuple(fields)), meta, count, budget)
+
+
+def summarize_table(endpoint: str, data: dict, budget: int | None = None) -> str:
+    """Summarize a search response as a table of the endpoint's summary fields."""
+    results = data.get("results", [])
+    writer = table_writer(endpoint, data.get("meta", {}), len(results), budget)
+    writer.extend(results)
+    return writer.text()
+
+
+def summarize_projection(
+    data: dict, fields: list[str], budget: int | None = None
+) -> str:
+    """Summarize a search response as a table of the requested fields."""
+    results = data.get("results", [])
+    writer = projection_writer(fields, data.get("meta", {}), len(results), budget)
+    writer.extend(results)
+    return writer.text()
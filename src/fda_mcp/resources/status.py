@@ -0,0 +1,24 @@
+"""Server status resource — CPU job queue metrics."""
+
+from fda_mcp.server import mcp
+from fda_mcp.documents.jobs import cpu_jobs
+
+
+def get_job_status_text() -> str:
+    """Current CPU job queue metrics as text."""
+    stats = cpu_jobs.stats()
+    queued = ", ".join(f"{name} {count}" for name, count in stats.queued.items())
+    return (
+        "# CPU Job Queue (OCR, table extraction)\n\n"
+        f"- Running: {stats.running} of {cpu_jobs.max_concurrent} slots\n"
+        f"- Queued: {stats.queue_depth} ({queued})\n"
+        f"- Completed: {stats.completed}\n"
+        f"- Joined an identical job: {stats.deduplicated}\n"
+        f"- Cancelled: {stats.cancelled}"
+    )
+
+
+@mcp.resource("fda://status/jobs")
+async def get_job_status() -> str:
+    """OCR and table-extraction job queue: running, queued by priority, totals."""
+    return get_job_status_text()
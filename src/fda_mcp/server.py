@@ -8,7 +8,10 @@ FDA MCP provides access to all 21 OpenFDA API endpoints plus FDA decision docume
 WORKFLOW:
 1. If unsure which fields to search, call list_searchable_fields first.
 2. Use search_fda to find individual records. Use count_records for aggregation/statistics.
+   For breakdowns by several fields, age bands, or drug x reaction, use aggregate_records.
 3. For device regulatory documents (510k summaries, PMA approvals), use get_decision_document.
+   For several documents at once (e.g. a predicate chain), use get_decision_documents.
+   To search text across documents fetched earlier, use search_decision_documents.
 
 QUERY SYNTAX (for the "search" parameter):
 - AND: field1:value1+AND+field2:value2
@@ -45,13 +48,22 @@ mcp = FastMCP("fda-mcp", instructions=SERVER_INSTRUCTIONS)
 # after `mcp` is defined above.
 import fda_mcp.tools.search  # noqa: E402, F401
 import fda_mcp.tools.count  # noqa: E402, F401
+import fda_mcp.tools.aggregate  # noqa: E402, F401
 import fda_mcp.tools.fields  # noqa: E402, F401
 import fda_mcp.tools.decision_documents  # noqa: E402, F401
+import fda_mcp.tools.document_search  # noqa: E402, F401
 import fda_mcp.resources.query_syntax  # noqa: E402, F401
 import fda_mcp.resources.endpoints_resource  # noqa: E402, F401
 import fda_mcp.resources.field_definitions  # noqa: E402, F401
+import fda_mcp.resources.status  # noqa: E402, F401
 
 
 def main() -> None:
     """Run the MCP server on stdio transport."""
+    from fda_mcp.config import config
+
+    if config.eager_load:
+        from fda_mcp.documents.fetcher import warm_up
+
+        warm_up()
     mcp.run(transport="stdio")
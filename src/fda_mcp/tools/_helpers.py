@@ -14,3 +14,4 @@ def clamp_limit(limit: int, max_limit: int) -> tuple[int, str | None]:
             f"(maximum allowed).]"
         )
     return limit, None
+
@@ -0,0 +1,188 @@
+"""aggregate_records tool — local group-by over fetched records."""
+
+from contextlib import aclosing
+from typing import Literal
+
+from mcp.server.fastmcp.exceptions import ToolError
+
+from fda_mcp.config import config
+from fda_mcp.errors import UnknownFieldError
+from fda_mcp.server import mcp
+from fda_mcp.openfda.client import MAX_PAGE_SIZE, MAX_SKIP, openfda_client
+from fda_mcp.openfda.endpoints import OpenFDAEndpoint
+from fda_mcp.openfda.frames import FrameBuilder, GroupKey, require_numpy
+from fda_mcp.tools._helpers import clamp_limit
+
+AggregateType = Literal["records", "rows", "sum", "mean", "min", "max"]
+
+_VALUE_AGGREGATES = ("sum", "mean", "min", "max")
+
+
+def _field(field: str) -> str:
+    """Field path as stored in records (count_records' .exact dropped)."""
+    return field.removesuffix(".exact")
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return ""
+    if value == int(value):
+        return f"{int(value):,}"
+    return f"{value:,.2f}"
+
+
+@mcp.tool()
+async def aggregate_records(
+    endpoint: str,
+    group_by: list[str],
+    search: str | None = None,
+    bins: dict[str, list[float]] | None = None,
+    aggregate: AggregateType = "records",
+    value_field: str | None = None,
+    max_records: int = 1000,
+    limit: int = 25,
+) -> str:
+    """Group fetched records by several fields, age bands or nested lists.
+    Fetches matching records page by page and aggregates them locally.
+
+    When to use: Breakdowns count_records cannot do: more than one field
+    (drug x reaction), numbers in bands (age groups), or sums and means of
+    a numeric field. For a single exact field, count_records is faster and
+    counts every matching record.
+
+    Fields inside lists (patient.drug, patient.reaction) give one row per
+    list item. Fields under the same list stay paired item by item; fields
+    under different lists give every combination. Missing values are
+    grouped as "(missing)".
+
+    Args:
+        endpoint: One of the 21 OpenFDA endpoint paths (e.g., "drug/event").
+        group_by: Field paths to group by (1-4), without .exact.
+        search: Optional search filter selecting the records to fetch.
+        bins: Band edges for numeric group_by fields, e.g.
+            {"patient.patientonsetage": [18, 45, 65]} groups ages into
+            <18, 18-45, 45-65 and 65+. Ages are converted to years using
+            patient.patientonsetageunit (decades, months, weeks, days,
+            hours), for bins and value_field alike.
+        aggregate: "records" counts distinct records per group (default),
+            "rows" counts exploded rows, and "sum", "mean", "min", "max"
+            aggregate value_field.
+        value_field: Numeric field for sum/mean/min/max.
+        max_records: Records to fetch (default 1000, max set by
+            FDA_AGGREGATE_MAX_RECORDS).
+        limit: Number of top groups to return (default 25, max 1000).
+
+    Examples:
+        Reactions per drug:
+          endpoint="drug/event",
+          group_by=["patient.drug.medicinalproduct", "patient.reaction.reactionmeddrapt"],
+          search='patient.drug.openfda.brand_name:"ASPIRIN"'
+        Age bands by sex:
+          endpoint="drug/event",
+          group_by=["patient.patientonsetage", "patient.patientsex"],
+          bins={"patient.patientonsetage": [18, 45, 65]}
+    """
+    valid_paths = {ep.value for ep in OpenFDAEndpoint}
+    if endpoint not in valid_paths:
+        raise ToolError(
+            f"Unknown endpoint '{endpoint}'. "
+            f"Valid endpoints: {', '.join(sorted(valid_paths))}"
+        )
+    group_by = list(dict.fromkeys(map(_field, group_by)))
+    if not 1 <= len(group_by) <= 4:
+        raise ToolError("group_by takes 1 to 4 fields.")
+    bins = {_field(field): edges for field, edges in (bins or {}).items()}
+    stray = [field for field in bins if field not in group_by]
+    if stray:
+        raise ToolError(
+            f"bins given for fields not in group_by: {', '.join(stray)}"
+        )
+    empty = [field for field, edges in bins.items() if not edges]
+    if empty:
+        raise ToolError(
+            f"bins need at least one edge: {', '.join(empty)}. Leave a field "
+            f"out of bins to group by its exact values."
+        )
+    if aggregate in _VALUE_AGGREGATES:
+        if not value_field:
+            raise ToolError(f"aggregate='{aggregate}' needs a value_field.")
+        value_field = _field(value_field)
+    else:
+        value_field = None
+
+    # Imported here: field_definitions imports the server, which imports
+    # this module.
+    from fda_mcp.resources.field_definitions import get_fields
+
+    known = get_fields(endpoint, "all")
+    requested = group_by + ([value_field] if value_field else [])
+    unknown = [field for field in requested if field not in known]
+    if unknown:
+        raise UnknownFieldError(endpoint, unknown, list(known))
+
+    require_numpy()
+
+    max_allowed = min(config.aggregate_max_records, MAX_SKIP + MAX_PAGE_SIZE)
+    max_records, records_note = clamp_limit(max_records, max_allowed)
+    limit, limit_note = clamp_limit(limit, 1000)
+
+    numbers = [field for field in group_by if field in bins]
+    if value_field:
+        numbers.append(value_field)
+    builder = FrameBuilder(
+        strings=[field for field in group_by if field not in bins],
+        numbers=numbers,
+        max_rows=config.aggregate_max_rows,
+    )
+    total = None
+    async with aclosing(
+        openfda_client.paginate(endpoint, search, max_records)
+    ) as pages:
+        async for page in pages:
+            if total is None:
+                total = (page.meta.get("results") or {}).get("total")
+            async for record in page:
+                if not builder.add(record):
+                    break
+            if builder.full:
+                break
+
+    frame = builder.frame()
+    keys = [GroupKey(field, bins.get(field)) for field in group_by]
+    grouping = frame.group_by(keys, aggregate, value_field)
+    top = grouping.top(limit)
+
+    header = (
+        f"Grouped {frame.records:,} of "
+        f"{total if isinstance(total, int) else frame.records:,} matching "
+        f"{endpoint} records ({len(frame):,} rows) into {len(grouping):,} "
+        f"groups; showing the top {len(top):,}."
+    )
+    notes = [note for note in (records_note, limit_note) if note]
+    if builder.full:
+        notes.append(
+            f"[Note: stopped after {frame.records:,} records: exploding "
+            f"nested lists reached {config.aggregate_max_rows:,} rows. Group "
+            f"by fewer list fields or narrow the search.]"
+        )
+    elif isinstance(total, int) and total > frame.records:
+        notes.append(
+            f"[Note: only the first {frame.records:,} matching records were "
+            f"aggregated. Raise max_records (up to {max_allowed:,}) or narrow "
+            f"the search to cover more.]"
+        )
+
+    value_column = "records" if aggregate == "records" else (
+        "rows" if aggregate == "rows" else f"{aggregate}({value_field})"
+    )
+    columns = [*group_by, value_column]
+    if aggregate != "records":
+        columns.append("records")
+    lines = ["\t".join(columns)]
+    for i in top:
+        cells = [*grouping.labels[i], _format_value(float(grouping.values[i]))]
+        if aggregate != "records":
+            cells.append(f"{int(grouping.records[i]):,}")
+        lines.append("\t".join(cell.replace("\t", " ") for cell in cells))
+
+    return "\n".join([header, *notes, "", *lines])
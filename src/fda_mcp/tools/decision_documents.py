@@ -1,25 +1,51 @@
 """get_decision_document tool — FDA regulatory decision document retrieval."""
 
-from typing import Literal
+import asyncio
+
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import BaseModel
 
 from fda_mcp.server import mcp
-from fda_mcp.documents.urls import build_document_url
-from fda_mcp.documents.fetcher import fetch_and_extract_pdf
+from fda_mcp.documents.budget import allocate_budget
+from fda_mcp.documents.resolver import (
+    forget_document_url,
+    known_missing,
+    resolve_document_url,
+)
+from fda_mcp.documents.fetcher import (
+    ExtractedDocument,
+    extract_document,
+    extract_documents,
+    fetch_and_extract_pdf,
+    format_document,
+)
+from fda_mcp.documents.retrieval import search_document
+from fda_mcp.documents.sections import SectionName, format_sections
+from fda_mcp.documents.tables import extract_tables, format_tables
+from fda_mcp.documents.urls import DocumentType
 from fda_mcp.config import config
+from fda_mcp.errors import DocumentNotFoundError
+
+MAX_BATCH_DOCUMENTS = 30
+
+
+class DocumentRequest(BaseModel):
+    """One document in a get_decision_documents batch."""
+
+    document_type: DocumentType
+    submission_number: str
+    supplement_number: str | None = None
 
 
 @mcp.tool()
 async def get_decision_document(
-    document_type: Literal[
-        "510k_summary",
-        "denovo_decision",
-        "pma_approval",
-        "pma_ssed",
-        "pma_supplement",
-    ],
+    document_type: DocumentType,
     submission_number: str,
     supplement_number: str | None = None,
     max_length: int | None = None,
+    query: str | None = None,
+    sections: list[SectionName] | None = None,
+    tables: bool = False,
 ) -> str:
     """Fetch FDA regulatory decision documents (not available via OpenFDA API).
     Downloads the PDF from FDA servers and extracts text content.
@@ -37,14 +63,138 @@ async def get_decision_document(
         supplement_number: Required for pma_supplement only (e.g., "013").
         max_length: Max text characters to return (default 8000).
             Increase for longer documents.
+        query: Optional search terms (e.g., "predicate device",
+            "clinical study results"). Returns only the most relevant
+            passages from anywhere in the document instead of its start.
+        sections: Optional list of sections to return instead of the
+            document start: indications, device_description, predicate,
+            substantial_equivalence, performance_data, clinical,
+            contraindications, warnings, adverse_effects, benefit_risk,
+            conclusion.
+        tables: If true, return the document's tables (performance data,
+            clinical endpoints) as tab-separated rows instead of its text.
+            Slower on first call; results are cached.
+        Only one of query, sections and tables can be used per call.
 
     Examples:
         document_type="510k_summary", submission_number="K213456"
+        document_type="pma_ssed", submission_number="P200001",
+          query="primary effectiveness endpoint results"
+        document_type="510k_summary", submission_number="K213456",
+          sections=["predicate", "indications"]
+        document_type="pma_ssed", submission_number="P200001", tables=True
         document_type="pma_approval", submission_number="P200001"
         document_type="pma_supplement", submission_number="P200001", supplement_number="013"
     """
     if max_length is None:
         max_length = config.default_pdf_max_length
+    if sum(map(bool, (query, sections, tables))) > 1:
+        raise ToolError("Use only one of query, sections or tables per call.")
+
+    url = await resolve_document_url(
+        document_type, submission_number, supplement_number
+    )
+    try:
+        if query:
+            doc = await extract_document(url)
+            return await search_document(doc, query, max_length)
+        if sections:
+            doc = await extract_document(url)
+            return format_sections(doc, list(sections), max_length)
+        if tables:
+            doc = await extract_document(url, tables=True)
+            found = await extract_tables(doc)
+            return format_tables(doc, found, max_length)
+        return await fetch_and_extract_pdf(url, max_length=max_length)
+    except DocumentNotFoundError:
+        await forget_document_url(document_type, submission_number, supplement_number)
+        raise
+
+
+@mcp.tool()
+async def get_decision_documents(
+    documents: list[DocumentRequest],
+    max_length: int | None = None,
+) -> str:
+    """Fetch several FDA decision documents at once (e.g. a predicate chain).
+    Downloads the PDFs concurrently and returns an excerpt of each.
+
+    When to use: Comparing or reviewing multiple submissions, such as a
+    510(k) and its predicates. Prefer this over repeated
+    get_decision_document calls. A failure on one document does not affect
+    the others.
+
+    Args:
+        documents: Up to 30 documents, each with document_type,
+            submission_number and (for pma_supplement) supplement_number.
+            Same formats as get_decision_document.
+        max_length: Total text characters shared across all documents
+            (default 30000). Short documents leave their unused share to
+            longer ones.
+
+    Examples:
+        documents=[{"document_type": "510k_summary", "submission_number": "K213456"},
+                   {"document_type": "510k_summary", "submission_number": "K193012"}]
+    """
+    if not documents:
+        raise ToolError("documents must contain at least one document.")
+    if len(documents) > MAX_BATCH_DOCUMENTS:
+        raise ToolError(
+            f"Too many documents ({len(documents)}). "
+            f"Request at most {MAX_BATCH_DOCUMENTS} per call."
+        )
+    if max_length is None:
+        max_length = config.batch_pdf_max_length
+
+    # Known-missing documents fail in resolve_document_url from the local
+    # registry, without a probe or a download slot; count them for the summary.
+    missing = await known_missing(
+        [
+            (doc.document_type, doc.submission_number, doc.supplement_number)
+            for doc in documents
+        ]
+    )
+
+    async def _resolve(doc: DocumentRequest) -> str | ToolError:
+        try:
+            return await resolve_document_url(
+                doc.document_type, doc.submission_number, doc.supplement_number
+            )
+        except ToolError as exc:
+            return exc
+
+    resolved = await asyncio.gather(*(_resolve(doc) for doc in documents))
+    urls = [url for url in resolved if isinstance(url, str)]
+    fetched = iter(await extract_documents(urls))
+    results = [next(fetched) if isinstance(r, str) else r for r in resolved]
+
+    for doc, result in zip(documents, results):
+        if isinstance(result, DocumentNotFoundError):
+            await forget_document_url(
+                doc.document_type, doc.submission_number, doc.supplement_number
+            )
+
+    sizes = [len(r.text) if isinstance(r, ExtractedDocument) else 0 for r in results]
+    allowances = allocate_budget(sizes, max_length)
+
+    retrieved = sum(isinstance(r, ExtractedDocument) for r in results)
+    summary = (
+        f"Documents: {len(documents)} requested, {retrieved} retrieved, "
+        f"{len(documents) - retrieved} failed"
+    )
+    if any(missing):
+        summary += f" ({sum(missing)} known missing)"
+    lines = [summary]
+    for i, (doc, result, allowance) in enumerate(
+        zip(documents, results, allowances), start=1
+    ):
+        label = f"{doc.document_type} {doc.submission_number.strip().upper()}"
+        if doc.supplement_number:
+            label += f" S{doc.supplement_number.strip().zfill(3)}"
+        lines.append(f"\n=== [{i}] {label} ===")
+        if isinstance(result, ExtractedDocument):
+            lines.append(format_document(result, allowance))
+        else:
+            lines.append(f"Error: {result}")
 
-    url = build_document_url(document_type, submission_number, supplement_number)
-    return await fetch_and_extract_pdf(url, max_length=max_length)
+    return "\n".join(lines)
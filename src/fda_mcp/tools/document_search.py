@@ -0,0 +1,61 @@
+"""search_decision_documents tool — full-text search over cached documents."""
+
+from fda_mcp.server import mcp
+from fda_mcp.documents.index import get_document_index
+from fda_mcp.documents.urls import DocumentType
+from fda_mcp.tools._helpers import clamp_limit
+
+
+@mcp.tool()
+async def search_decision_documents(
+    query: str,
+    document_type: DocumentType | None = None,
+    limit: int = 10,
+) -> str:
+    """Full-text search across every FDA decision document fetched so far.
+    Runs locally against an on-disk index — no network, results in milliseconds.
+
+    When to use: Finding which previously retrieved 510(k) summaries,
+    De Novo decisions or PMA documents mention a device, predicate, test
+    standard or phrase. Only documents already fetched with
+    get_decision_document / get_decision_documents are searchable.
+
+    Args:
+        query: Search terms. Use double quotes for phrases, AND/OR/NOT to
+            combine, and a trailing * for prefixes.
+        document_type: Optional filter (e.g., "510k_summary").
+        limit: Max documents to return (default 10, max 50).
+
+    Examples:
+        Summaries citing a predicate: query="K123456"
+        Phrase search: query='"pulse oximeter" AND "ISO 80601"',
+          document_type="510k_summary"
+    """
+    limit, note = clamp_limit(limit, 50)
+
+    index = get_document_index()
+    total = index.count()
+    if total == 0:
+        return (
+            "No decision documents have been indexed yet. "
+            "Fetch documents with get_decision_document first; "
+            "they are indexed automatically."
+        )
+
+    hits = index.search(query, document_type=document_type, limit=limit)
+    lines = []
+    if note:
+        lines.append(note + "\n")
+    lines.append(f"Matches: {len(hits)} (searched {total} indexed documents)")
+    for i, hit in enumerate(hits, start=1):
+        label = f"{hit.document_type} {hit.submission_number}"
+        if hit.supplement_number:
+            label += f" S{hit.supplement_number}"
+        lines.append(f"\n[{i}] {label} — {hit.url}")
+        lines.append(f"  {' '.join(hit.snippet.split())}")
+    if not hits:
+        lines.append(
+            "No indexed document matched. Try fewer or broader terms, "
+            "or fetch more documents first."
+        )
+    return "\n".join(lines)
@@ -4,9 +4,14 @@ from typing import Literal
 
 from mcp.server.fastmcp.exceptions import ToolError
 
+from fda_mcp.config import config
+from fda_mcp.errors import UnknownFieldError
 from fda_mcp.server import mcp
+from fda_mcp.documents.prefetch import document_prefetcher
 from fda_mcp.openfda.client import openfda_client
-from fda_mcp.openfda.summarizer import summarize_response
+from fda_mcp.openfda.pagecache import compact, page_cache
+from fda_mcp.openfda.summarizer import PageWriter, SummaryWriter
+from fda_mcp.openfda.tabular import projection_writer, table_writer
 from fda_mcp.tools._helpers import clamp_limit
 
 DatasetType = Literal[
@@ -48,6 +53,10 @@ _DATASET_TO_ENDPOINT: dict[str, str] = {
 }
 
 
+# Smallest budget honoured: enough for a header and a few short records.
+_MIN_OUTPUT_BUDGET = 1000
+
+
 @mcp.tool()
 async def search_fda(
     dataset: DatasetType,
@@ -55,6 +64,9 @@ async def search_fda(
     limit: int = 10,
     skip: int = 0,
     sort: str | None = None,
+    max_length: int | None = None,
+    fields: list[str] | None = None,
+    format: Literal["summary", "table"] = "summary",
 ) -> str:
     """Search any of the 21 OpenFDA datasets. Returns individual records.
 
@@ -100,6 +112,19 @@ async def search_fda(
         limit: Max results to return (default 10, max 100).
         skip: Number of results to skip for pagination.
         sort: Sort field and direction (e.g., "report_date:desc").
+        max_length: Approximate max characters to return, shared fairly
+            across records (default 60000, about 15k tokens). Long text
+            such as label sections and narratives is shortened first;
+            records that still don't fit are counted, not shown.
+        fields: Return only these fields, as a tab-separated table with
+            one row per record (e.g. ["k_number", "decision_date"]).
+            Names come from list_searchable_fields(category="all"); values
+            under lists are joined with ", ". Omit for the full summary.
+        format: "summary" (default) prints each record as labelled lines.
+            "table" prints the same fields as a tab-separated table: the
+            labels once in a header row, then one line per record. Much
+            more compact at high limits. Output with `fields` is always a
+            table.
 
     Examples:
         Drug adverse events:
@@ -114,6 +139,9 @@ async def search_fda(
           dataset="food_recalls", search='classification:"Class I"'
         Device classification lookup:
           dataset="device_classification", search='device_name:"oximeter"+AND+device_class:2'
+        Only clearance numbers and dates:
+          dataset="device_510k", search='product_code:"DQA"', limit=100,
+          fields=["k_number", "decision_date"]
     """
     endpoint = _DATASET_TO_ENDPOINT.get(dataset)
     if endpoint is None:
@@ -122,16 +150,74 @@ async def search_fda(
             f"Valid datasets: {', '.join(sorted(_DATASET_TO_ENDPOINT.keys()))}"
         )
 
+    if fields:
+        # Imported here: field_definitions imports the server, which
+        # imports this module.
+        from fda_mcp.resources.field_definitions import get_fields
+
+        fields = list(dict.fromkeys(fields))
+        known = get_fields(endpoint, "all")
+        unknown = [field for field in fields if field not in known]
+        if unknown:
+            raise UnknownFieldError(endpoint, unknown, list(known))
+
     limit, note = clamp_limit(limit, 100)
 
-    result = await openfda_client.query(
-        endpoint=endpoint,
-        search=search,
-        limit=limit,
-        skip=skip,
-        sort=sort,
-    )
-    response = summarize_response(endpoint, result)
+    if max_length is None:
+        max_length = config.search_output_budget
+    budget = max(max_length, _MIN_OUTPUT_BUDGET) if max_length > 0 else None
+
+    # Records are summarized as they are parsed and then dropped; only the
+    # first few are kept for document prefetch. Pages of the endpoints with
+    # record models go to the page cache as models once read to the end.
+    # Projections need whole records, so they don't read cached pages.
+    prefetch: list[dict] = []
+    key = (endpoint, search, limit, skip, sort)
+    cached = None if fields else page_cache.get(key)
+    if cached is not None:
+        writer = _page_writer(endpoint, fields, format, cached.meta, cached.count, budget)
+        for record in cached:
+            if len(prefetch) < config.prefetch_documents:
+                prefetch.append(record)
+            if not writer.add(record):
+                break
+    else:
+        async with openfda_client.stream(
+            endpoint=endpoint,
+            search=search,
+            limit=limit,
+            skip=skip,
+            sort=sort,
+        ) as page:
+            writer = _page_writer(endpoint, fields, format, page.meta, page.count, budget)
+            records = [] if page_cache.caches(endpoint) else None
+            async for record, raw in page.items():
+                if len(prefetch) < config.prefetch_documents:
+                    prefetch.append(record)
+                if records is not None:
+                    records.append(compact(endpoint, record))
+                if not writer.add(record, raw):
+                    break
+            else:
+                if records is not None:
+                    page_cache.put(key, page.meta, page.count, records)
+    response = writer.text()
+    await document_prefetcher.schedule_from_results(endpoint, prefetch)
     if note:
         response = note + "\n\n" + response
     return response
+
+
+def _page_writer(
+    endpoint: str,
+    fields: list[str] | None,
+    format: str,
+    meta: dict,
+    count: int,
+    budget: int | None,
+) -> PageWriter:
+    if fields:
+        return projection_writer(fields, meta, count, budget)
+    if format == "table":
+        return table_writer(endpoint, meta, count, budget)
+    return SummaryWriter(endpoint, meta, count, budget)
@@ -350,6 +350,36 @@ SAMPLE_RESPONSES: dict[str, dict] = {
 }
 
 
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    """Point on-disk caches at a per-test directory and empty memory caches."""
+    from fda_mcp.config import config
+    from fda_mcp.documents.cache import document_cache
+    from fda_mcp.openfda.memo import summary_memo
+    from fda_mcp.openfda.pagecache import page_cache
+
+    monkeypatch.setattr(config, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr("fda_mcp.documents.resolver._cache", None)
+    monkeypatch.setattr("fda_mcp.documents.index._index", None)
+    monkeypatch.setattr("fda_mcp.documents.blobs._store", None)
+    monkeypatch.setattr("fda_mcp.documents.missing._registry", None)
+    document_cache.clear()
+    summary_memo.clear()
+    page_cache.clear()
+    yield
+    document_cache.clear()
+    summary_memo.clear()
+    page_cache.clear()
+    from fda_mcp.documents import index
+
+    if index._index is not None:
+        index._index.close()
+    from fda_mcp.documents import missing
+
+    if missing._registry is not None:
+        missing._registry.close()
+
+
 @pytest.fixture
 def mock_openfda():
     """Mock all OpenFDA API endpoints using respx.
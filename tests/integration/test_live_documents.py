@@ -39,3 +39,14 @@ async def test_live_document_not_found():
     url = build_document_url("510k_summary", "K000001")
     with pytest.raises(DocumentNotFoundError):
         await fetch_and_extract_pdf(url)
+
+
+async def test_live_resolver_finds_legacy_layout():
+    """An older 510(k) resolves to one of the cdrh_docs/pdfN/ locations."""
+    from fda_mcp.documents.resolver import resolve_document_url
+
+    try:
+        url = await resolve_document_url("510k_summary", "K031234")
+    except DocumentNotFoundError:
+        pytest.skip("Document K031234 not found on FDA servers")
+    assert url.endswith("K031234.pdf")
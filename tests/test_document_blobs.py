@@ -0,0 +1,188 @@
+"""Tests for the content-addressable PDF blob store."""
+
+import asyncio
+import hashlib
+import os
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.blobs import BlobStore, get_blob_store
+from fda_mcp.documents.fetcher import ExtractedDocument
+
+PDF_URL = "https://www.accessdata.fda.gov/cdrh_docs/pdf20/P200001B.pdf"
+MIRROR_URL = "https://www.accessdata.fda.gov/cdrh_docs/pdf20/P200001b.pdf"
+
+
+def _store_bytes(store: BlobStore, url: str, data: bytes) -> str:
+    pending = store.create()
+    pending.write(data)
+    return store.commit(pending, url)
+
+
+class TestBlobStore:
+    def test_commit_and_lookup(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        path = _store_bytes(store, PDF_URL, b"%PDF-1.4 body")
+
+        assert store.lookup(PDF_URL) == path
+        assert os.path.basename(path) == hashlib.sha256(b"%PDF-1.4 body").hexdigest() + ".pdf"
+        with open(path, "rb") as f:
+            assert f.read() == b"%PDF-1.4 body"
+
+    def test_unknown_url(self, tmp_path):
+        assert BlobStore(str(tmp_path)).lookup(PDF_URL) is None
+
+    def test_identical_bytes_stored_once(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        a = _store_bytes(store, PDF_URL, b"%PDF same")
+        b = _store_bytes(store, MIRROR_URL, b"%PDF same")
+
+        assert a == b
+        assert len(os.listdir(os.path.dirname(a))) == 1
+
+    def test_shared_between_instances(self, tmp_path):
+        _store_bytes(BlobStore(str(tmp_path)), PDF_URL, b"%PDF shared")
+        assert BlobStore(str(tmp_path)).lookup(PDF_URL) is not None
+
+    def test_discard_leaves_nothing(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        pending = store.create()
+        pending.write(b"partial")
+        pending.discard()
+
+        assert os.listdir(tmp_path / "tmp") == []
+        assert store.lookup(PDF_URL) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        store = BlobStore(str(tmp_path), max_bytes=250)
+        old = _store_bytes(store, "https://example.com/old.pdf", b"a" * 100)
+        os.utime(old, (1, 1))
+        _store_bytes(store, "https://example.com/mid.pdf", b"b" * 100)
+        _store_bytes(store, "https://example.com/new.pdf", b"c" * 100)
+
+        assert store.lookup("https://example.com/old.pdf") is None
+        assert store.lookup("https://example.com/mid.pdf") is not None
+        assert store.lookup("https://example.com/new.pdf") is not None
+
+    def test_scans_only_past_the_limit(self, tmp_path, monkeypatch):
+        store = BlobStore(str(tmp_path), max_bytes=250)
+        scans = []
+        evict = store.evict
+        monkeypatch.setattr(
+            store, "evict", lambda keep=None: scans.append(keep) or evict(keep)
+        )
+        _store_bytes(store, "https://example.com/a.pdf", b"a" * 100)
+        _store_bytes(store, "https://example.com/b.pdf", b"b" * 100)
+        _store_bytes(store, "https://example.com/b2.pdf", b"b" * 100)
+        assert len(scans) == 1
+        _store_bytes(store, "https://example.com/c.pdf", b"c" * 100)
+        assert len(scans) == 2
+
+    def test_keeps_newest_blob_even_if_oversized(self, tmp_path):
+        store = BlobStore(str(tmp_path), max_bytes=10)
+        path = _store_bytes(store, PDF_URL, b"x" * 100)
+        assert os.path.exists(path)
+
+    def test_pinned_blob_survives_eviction(self, tmp_path):
+        store = BlobStore(str(tmp_path), max_bytes=150)
+        old = _store_bytes(store, "https://example.com/old.pdf", b"a" * 100)
+        os.utime(old, (1, 1))
+        with store.pinned(old):
+            _store_bytes(store, "https://example.com/new.pdf", b"b" * 100)
+            assert os.path.exists(old)
+        store.evict()
+        assert not os.path.exists(old)
+
+    def test_disabled_by_default(self):
+        assert get_blob_store() is None
+
+
+class TestLocalPdf:
+    @pytest.fixture
+    def store_enabled(self, monkeypatch):
+        monkeypatch.setattr(config, "blob_store_enabled", True)
+        return get_blob_store()
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_second_use_skips_download(self, store_enabled):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        async with fetcher.local_pdf(PDF_URL) as first:
+            pass
+        async with fetcher.local_pdf(PDF_URL) as second:
+            assert os.path.exists(second)
+
+        assert first == second
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_failed_download_not_stored(self, store_enabled):
+        respx.get(PDF_URL).mock(return_value=httpx.Response(500))
+        with pytest.raises(httpx.HTTPStatusError):
+            async with fetcher.local_pdf(PDF_URL):
+                pass
+
+        assert store_enabled.lookup(PDF_URL) is None
+        assert os.listdir(os.path.join(store_enabled.root, "tmp")) == []
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_blob_in_use_not_evicted_by_concurrent_download(
+        self, store_enabled, monkeypatch
+    ):
+        monkeypatch.setattr(store_enabled, "_max_bytes", 12)
+        respx.get(PDF_URL).mock(return_value=httpx.Response(200, content=b"%PDF-first"))
+        respx.get(MIRROR_URL).mock(return_value=httpx.Response(200, content=b"%PDF-second"))
+        reading = asyncio.Event()
+        stored = asyncio.Event()
+
+        async def reader():
+            async with fetcher.local_pdf(PDF_URL) as path:
+                os.utime(path, (1, 1))  # least recently used
+                reading.set()
+                await stored.wait()
+                with open(path, "rb") as f:
+                    return f.read()
+
+        async def writer():
+            await reading.wait()
+            async with fetcher.local_pdf(MIRROR_URL):
+                stored.set()
+
+        first, _ = await asyncio.gather(reader(), writer())
+
+        assert first == b"%PDF-first"
+        assert store_enabled.evict() == 1
+        assert store_enabled.lookup(PDF_URL) is None
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_temp_file_removed_without_store(self):
+        respx.get(PDF_URL).mock(return_value=httpx.Response(200, content=b"%PDF-fake"))
+        async with fetcher.local_pdf(PDF_URL) as path:
+            assert os.path.exists(path)
+        assert not os.path.exists(path)
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_reextraction_reads_stored_pdf(self, store_enabled, monkeypatch):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        monkeypatch.setattr(
+            fetcher, "_extract_file",
+            lambda url, path: ExtractedDocument(url, "x" * 200, 1, "text extraction"),
+        )
+
+        await fetcher.extract_document(PDF_URL)
+        fetcher.document_cache.clear()
+        await fetcher.extract_document(PDF_URL)
+
+        assert route.call_count == 1
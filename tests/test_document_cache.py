@@ -0,0 +1,56 @@
+"""Tests for the in-memory extracted-document cache."""
+
+from fda_mcp.documents.cache import DocumentCache
+from fda_mcp.documents.fetcher import ExtractedDocument
+
+
+def _doc(url: str, size: int) -> ExtractedDocument:
+    return ExtractedDocument(url, "x" * size, 1, "text extraction")
+
+
+def test_get_returns_cached_document():
+    cache = DocumentCache(max_chars=100)
+    cache.put(_doc("a", 10))
+    assert cache.get("a").text == "x" * 10
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used_by_total_chars():
+    cache = DocumentCache(max_chars=100)
+    cache.put(_doc("a", 40))
+    cache.put(_doc("b", 40))
+    cache.get("a")
+    cache.put(_doc("c", 40))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_oversized_document_is_not_cached():
+    cache = DocumentCache(max_chars=100)
+    cache.put(_doc("a", 101))
+    assert len(cache) == 0
+
+
+def test_replacing_entry_updates_size():
+    cache = DocumentCache(max_chars=100)
+    cache.put(_doc("a", 90))
+    cache.put(_doc("a", 10))
+    cache.put(_doc("b", 80))
+    assert "a" in cache and "b" in cache
+
+
+def test_tables_count_toward_size():
+    from fda_mcp.documents.tables import ExtractedTable
+
+    cache = DocumentCache(max_chars=100)
+    doc = _doc("a", 40)
+    cache.put(doc)
+    cache.put(_doc("b", 40))
+    doc.tables = [ExtractedTable(1, [["y" * 29]])]
+    cache.put(doc)  # re-counted at 70 chars, evicting b
+
+    assert "a" in cache
+    assert "b" not in cache
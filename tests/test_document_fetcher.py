@@ -1,15 +1,31 @@
 """Tests for PDF fetching and text extraction."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 import httpx
 import respx
 
-from fda_mcp.documents.fetcher import fetch_and_extract_pdf
-from fda_mcp.errors import DocumentNotFoundError
+from fda_mcp.config import config
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.fetcher import fetch_and_extract_pdf, select_backend
+from fda_mcp.errors import (
+    DocumentNotFoundError,
+    DocumentTooLargeError,
+    InvalidDocumentError,
+)
 
 PDF_URL = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K213456.pdf"
 
 
+@pytest.fixture(autouse=True)
+def _pin_pdfplumber_backend(monkeypatch):
+    """Keep tests on the pdfplumber backend even where poppler is installed."""
+    monkeypatch.setattr("fda_mcp.documents.fetcher._PDFTOTEXT_AVAILABLE", False)
+
+
 @pytest.fixture
 def mock_pdfplumber(monkeypatch):
     """Mock pdfplumber.open to return controlled text content."""
@@ -140,3 +156,195 @@ class TestFetchAndExtractPdf:
         result = await fetch_and_extract_pdf(PDF_URL, max_length=8000)
 
         assert "Truncated" not in result
+
+
+class TestStreamingDownload:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_extracts_from_file_on_disk(self, monkeypatch):
+        """The body is streamed to a temp file that extraction opens in place."""
+        body = b"%PDF-" + b"x" * 10_000
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(
+                200, content=body, headers={"content-type": "application/pdf"}
+            )
+        )
+        monkeypatch.setattr(config, "pdf_chunk_size", 1024)
+        seen = {}
+
+        def fake_extract(pdf_path):
+            with open(pdf_path, "rb") as f:
+                seen["bytes"] = f.read()
+            seen["path"] = pdf_path
+            return "Extracted text that is comfortably over one hundred chars. " * 3, 1
+
+        monkeypatch.setattr(
+            "fda_mcp.documents.fetcher._extract_with_pdfplumber", fake_extract
+        )
+
+        result = await fetch_and_extract_pdf(PDF_URL)
+
+        assert seen["bytes"] == body
+        assert not os.path.exists(seen["path"])
+        assert "Extracted text" in result
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_rejects_html_content_type(self, mock_pdfplumber):
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(
+                200,
+                content=b"<html>Not here</html>",
+                headers={"content-type": "text/html; charset=utf-8"},
+            )
+        )
+        mock_pdfplumber(["unused"])
+
+        with pytest.raises(InvalidDocumentError, match="text/html"):
+            await fetch_and_extract_pdf(PDF_URL)
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_aborts_when_body_exceeds_cap(self, mock_pdfplumber, monkeypatch):
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-" + b"x" * 4096)
+        )
+        mock_pdfplumber(["unused"])
+        monkeypatch.setattr(config, "pdf_max_bytes", 1000)
+        monkeypatch.setattr(config, "pdf_chunk_size", 256)
+
+        with pytest.raises(DocumentTooLargeError, match="1,000-byte"):
+            await fetch_and_extract_pdf(PDF_URL)
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_aborts_on_declared_content_length(self, mock_pdfplumber, monkeypatch):
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(
+                200,
+                content=b"%PDF-" + b"x" * 4096,
+                headers={"content-length": "4101"},
+            )
+        )
+        mock_pdfplumber(["unused"])
+        monkeypatch.setattr(config, "pdf_max_bytes", 1000)
+
+        with pytest.raises(DocumentTooLargeError):
+            await fetch_and_extract_pdf(PDF_URL)
+
+
+class TestExtractionBackends:
+    def test_auto_prefers_pdftotext_when_available(self, monkeypatch):
+        monkeypatch.setattr(fetcher, "_PDFTOTEXT_AVAILABLE", True)
+        assert select_backend("auto") == "pdftotext"
+
+    def test_auto_falls_back_to_pdfplumber(self):
+        assert select_backend("auto") == "pdfplumber"
+
+    def test_explicit_override(self, monkeypatch):
+        monkeypatch.setattr(fetcher, "_PDFTOTEXT_AVAILABLE", True)
+        assert select_backend("pdfplumber") == "pdfplumber"
+
+    def test_unavailable_override_falls_back(self):
+        assert select_backend("pdftotext") == "pdfplumber"
+
+    def test_default_comes_from_config(self, monkeypatch):
+        monkeypatch.setattr(fetcher, "_PDFTOTEXT_AVAILABLE", True)
+        monkeypatch.setattr(config, "pdf_backend", "pdfplumber")
+        assert select_backend() == "pdfplumber"
+
+    def test_pdftotext_splits_pages_on_form_feed(self, monkeypatch):
+        import subprocess
+
+        def fake_run(cmd, **kwargs):
+            assert cmd[0] == "pdftotext"
+            return subprocess.CompletedProcess(
+                cmd, 0, stdout=b"Page one\n\fPage two\n\f"
+            )
+
+        monkeypatch.setattr(fetcher.subprocess, "run", fake_run)
+        text, pages = fetcher._extract_with_pdftotext("doc.pdf")
+
+        assert pages == 2
+        assert text == "Page one\nPage two\n"
+
+    def test_pdftotext_failure_falls_back_to_pdfplumber(self, monkeypatch, mock_pdfplumber):
+        import subprocess
+
+        def fake_run(cmd, **kwargs):
+            raise subprocess.CalledProcessError(1, cmd)
+
+        monkeypatch.setattr(fetcher.subprocess, "run", fake_run)
+        mock_pdfplumber(["From pdfplumber"])
+
+        text, pages = fetcher._extract_with_pdftotext("doc.pdf")
+
+        assert pages == 1
+        assert "From pdfplumber" in text
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_header_names_backend(self, monkeypatch):
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        monkeypatch.setattr(fetcher, "_PDFTOTEXT_AVAILABLE", True)
+        monkeypatch.setattr(
+            fetcher,
+            "_extract_with_pdftotext",
+            lambda path: ("Poppler text long enough to skip the OCR path. " * 4, 2),
+        )
+
+        result = await fetch_and_extract_pdf(PDF_URL)
+
+        assert "Extraction: text extraction (pdftotext)" in result
+
+
+class TestExtractDocuments:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_concurrent_batch_isolates_failures(self, mock_pdfplumber):
+        missing = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K000001.pdf"
+        respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        respx.get(missing).mock(return_value=httpx.Response(404))
+        mock_pdfplumber(["Batch page text long enough to skip OCR entirely. " * 3])
+
+        results = await fetcher.extract_documents([PDF_URL, missing, PDF_URL])
+
+        assert isinstance(results[0], fetcher.ExtractedDocument)
+        assert isinstance(results[1], DocumentNotFoundError)
+        assert results[2].text == results[0].text
+
+
+class TestLazyLoading:
+    def test_server_import_skips_pdf_stack(self):
+        code = (
+            "import sys, fda_mcp.server; "
+            "print([m for m in ('pdfplumber', 'pdfminer', 'PIL.Image', "
+            "'pytesseract', 'pdf2image') if m in sys.modules])"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_tool_probes_run_once_on_first_use(self, monkeypatch):
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return None
+
+        monkeypatch.setattr(fetcher, "OCR_AVAILABLE", None)
+        monkeypatch.setattr(fetcher.shutil, "which", fake_which)
+
+        assert fetcher.ocr_available() is False
+        assert fetcher.ocr_available() is False
+        assert calls == ["tesseract"]
+
+    def test_warm_up_loads_pdf_stack(self, monkeypatch):
+        monkeypatch.setattr(fetcher, "OCR_AVAILABLE", False)
+        fetcher.warm_up()
+        assert "pdfplumber" in sys.modules
@@ -0,0 +1,99 @@
+"""Tests for the shared document HTTP client."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents.http import DocumentClient
+
+ACCESSDATA = "https://www.accessdata.fda.gov/cdrh_docs/reviews"
+OTHER_HOST = "https://www.fda.gov/media"
+
+
+def _tracking_route(pattern: str, peak: dict, key: str):
+    active = {"n": 0}
+
+    async def respond(request):
+        active["n"] += 1
+        peak[key] = max(peak.get(key, 0), active["n"])
+        await asyncio.sleep(0.01)
+        active["n"] -= 1
+        return httpx.Response(200)
+
+    return respx.head(url__regex=pattern).mock(side_effect=respond)
+
+
+class TestDocumentClient:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_per_host_limit(self, monkeypatch):
+        monkeypatch.setattr(config, "doc_max_in_flight", 10)
+        monkeypatch.setattr(config, "doc_max_per_host", 2)
+        peak: dict = {}
+        _tracking_route(r".*accessdata.*", peak, "accessdata")
+        _tracking_route(r".*www\.fda\.gov.*", peak, "fda")
+        client = DocumentClient()
+
+        await asyncio.gather(
+            *(client.head(f"{ACCESSDATA}/K{n:06d}.pdf") for n in range(6)),
+            *(client.head(f"{OTHER_HOST}/{n}.pdf") for n in range(6)),
+        )
+
+        assert peak == {"accessdata": 2, "fda": 2}
+        await client.aclose()
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_in_flight_limit_spans_hosts(self, monkeypatch):
+        monkeypatch.setattr(config, "doc_max_in_flight", 3)
+        monkeypatch.setattr(config, "doc_max_per_host", 3)
+        peak: dict = {}
+        _tracking_route(r".*", peak, "all")
+        client = DocumentClient()
+
+        await asyncio.gather(
+            *(client.head(f"{ACCESSDATA}/K{n:06d}.pdf") for n in range(5)),
+            *(client.head(f"{OTHER_HOST}/{n}.pdf") for n in range(5)),
+        )
+
+        assert peak["all"] == 3
+        await client.aclose()
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_stream_holds_slot_until_body_read(self, monkeypatch):
+        monkeypatch.setattr(config, "doc_max_in_flight", 1)
+        respx.get(f"{ACCESSDATA}/K213456.pdf").mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        client = DocumentClient()
+
+        async with client.stream("GET", f"{ACCESSDATA}/K213456.pdf") as response:
+            assert client._in_flight.locked()
+            assert await response.aread() == b"%PDF-fake"
+        assert not client._in_flight.locked()
+        await client.aclose()
+
+    @pytest.mark.anyio
+    async def test_reuses_pooled_client_with_document_timeouts(self, monkeypatch):
+        monkeypatch.setattr(config, "pdf_timeout", 45.0)
+        monkeypatch.setattr(config, "doc_connect_timeout", 5.0)
+        client = DocumentClient()
+
+        first = await client._get_client()
+        assert await client._get_client() is first
+        assert first.timeout.connect == 5.0
+        assert first.timeout.read == 45.0
+        await client.aclose()
+
+    def test_closes_client_of_previous_loop(self):
+        client = DocumentClient()
+        first = asyncio.run(client._get_client())
+        second = asyncio.run(client._get_client())
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+        asyncio.run(client.aclose())
@@ -0,0 +1,173 @@
+"""Tests for the persistent full-text decision-document index."""
+
+import sqlite3
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.index import DocumentIndex, get_document_index
+from fda_mcp.documents.urls import parse_document_url
+from fda_mcp.tools.document_search import search_decision_documents
+
+BASE = "https://www.accessdata.fda.gov/cdrh_docs"
+
+
+def _doc(url: str, text: str) -> ExtractedDocument:
+    return ExtractedDocument(url, text, 2, "text extraction")
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = DocumentIndex(str(tmp_path / "documents.db"))
+    yield idx
+    idx.close()
+
+
+class TestParseDocumentUrl:
+    @pytest.mark.parametrize("url,expected", [
+        (f"{BASE}/reviews/K213456.pdf", ("510k_summary", "K213456", None)),
+        (f"{BASE}/pdf3/k031234.pdf", ("510k_summary", "K031234", None)),
+        (f"{BASE}/reviews/DEN200001.pdf", ("denovo_decision", "DEN200001", None)),
+        (f"{BASE}/pdf20/P200001A.pdf", ("pma_approval", "P200001", None)),
+        (f"{BASE}/pdf5/P050001b.pdf", ("pma_ssed", "P050001", None)),
+        (f"{BASE}/pdf20/P200001S013A.pdf", ("pma_supplement", "P200001", "013")),
+    ])
+    def test_round_trip(self, url, expected):
+        assert parse_document_url(url) == expected
+
+    def test_unrecognized_url(self):
+        assert parse_document_url("https://example.com/doc.pdf") is None
+
+
+class TestDocumentIndex:
+    def test_search_finds_phrase_with_snippet(self, index):
+        index.add(_doc(f"{BASE}/reviews/K213456.pdf", "The predicate device is K123456, a pulse oximeter."))
+        index.add(_doc(f"{BASE}/reviews/K193012.pdf", "Infusion pump cleared under K987654."))
+
+        hits = index.search("K123456")
+
+        assert [h.submission_number for h in hits] == ["K213456"]
+        assert "[K123456]" in hits[0].snippet
+
+    def test_reindexing_replaces_document(self, index):
+        url = f"{BASE}/reviews/K213456.pdf"
+        index.add(_doc(url, "old text about catheters"))
+        index.add(_doc(url, "new text about oximeters"))
+
+        assert index.count() == 1
+        assert index.search("catheters") == []
+        assert len(index.search("oximeters")) == 1
+
+    def test_reindexes_database_without_rowids(self, tmp_path):
+        path = str(tmp_path / "documents.db")
+        url = f"{BASE}/reviews/K213456.pdf"
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE VIRTUAL TABLE documents USING fts5(
+                url UNINDEXED, document_type UNINDEXED, submission_number,
+                supplement_number UNINDEXED, text
+            );
+            CREATE TABLE document_meta (
+                url TEXT PRIMARY KEY, page_count INTEGER, method TEXT,
+                indexed_at REAL
+            );
+        """)
+        conn.execute(
+            "INSERT INTO documents VALUES (?, '510k_summary', 'K213456', NULL, "
+            "'old text about catheters')", (url,)
+        )
+        conn.execute("INSERT INTO document_meta VALUES (?, 2, 'text', 0)", (url,))
+        conn.commit()
+        conn.close()
+
+        index = DocumentIndex(path)
+        index.add(_doc(url, "new text about oximeters"))
+        assert index.search("catheters") == []
+        assert len(index.search("oximeters")) == 1
+        index.close()
+
+    def test_filter_by_document_type(self, index):
+        index.add(_doc(f"{BASE}/reviews/K213456.pdf", "biocompatibility testing"))
+        index.add(_doc(f"{BASE}/pdf20/P200001B.pdf", "biocompatibility testing"))
+
+        hits = index.search("biocompatibility", document_type="pma_ssed")
+
+        assert [h.document_type for h in hits] == ["pma_ssed"]
+
+    def test_invalid_syntax_falls_back_to_plain_terms(self, index):
+        index.add(_doc(f"{BASE}/reviews/K213456.pdf", "ISO 10993 (biocompatibility)"))
+        assert len(index.search("ISO 10993 (")) == 1
+
+    def test_skips_empty_and_unrecognized(self, index):
+        assert not index.add(_doc(f"{BASE}/reviews/K213456.pdf", "   "))
+        assert not index.add(_doc("https://example.com/x.pdf", "text"))
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "documents.db")
+        first = DocumentIndex(path)
+        first.add(_doc(f"{BASE}/reviews/K213456.pdf", "persistent text"))
+        first.close()
+
+        second = DocumentIndex(path)
+        assert len(second.search("persistent")) == 1
+        second.close()
+
+
+class TestIncrementalIndexing:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_extracted_documents_are_indexed(self, monkeypatch):
+        url = f"{BASE}/reviews/K213456.pdf"
+        respx.get(url).mock(return_value=httpx.Response(200, content=b"%PDF-fake"))
+        monkeypatch.setattr(
+            fetcher, "_extract_file",
+            lambda u, path: _doc(u, "Substantial equivalence to predicate K123456."),
+        )
+
+        await fetcher.extract_document(url)
+
+        hits = get_document_index().search("K123456")
+        assert [h.url for h in hits] == [url]
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_indexing_can_be_disabled(self, monkeypatch):
+        url = f"{BASE}/reviews/K213456.pdf"
+        respx.get(url).mock(return_value=httpx.Response(200, content=b"%PDF-fake"))
+        monkeypatch.setattr(config, "doc_index_enabled", False)
+        monkeypatch.setattr(
+            fetcher, "_extract_file", lambda u, path: _doc(u, "Not indexed.")
+        )
+
+        await fetcher.extract_document(url)
+
+        assert get_document_index().count() == 0
+
+
+class TestSearchDecisionDocumentsTool:
+    @pytest.mark.anyio
+    async def test_empty_index_message(self):
+        result = await search_decision_documents("K123456")
+        assert "No decision documents have been indexed yet" in result
+
+    @pytest.mark.anyio
+    async def test_returns_ranked_snippets(self):
+        get_document_index().add(
+            _doc(f"{BASE}/pdf20/P200001S013A.pdf", "Supplement adds a new pulse oximeter sensor.")
+        )
+
+        result = await search_decision_documents('"pulse oximeter"')
+
+        assert "Matches: 1 (searched 1 indexed documents)" in result
+        assert "pma_supplement P200001 S013" in result
+        assert "[pulse oximeter]" in result
+
+    @pytest.mark.anyio
+    async def test_no_match(self):
+        get_document_index().add(_doc(f"{BASE}/reviews/K213456.pdf", "text"))
+        result = await search_decision_documents("xylophone")
+        assert "Matches: 0" in result
@@ -0,0 +1,254 @@
+"""Tests for the CPU job scheduler."""
+
+import asyncio
+import threading
+
+import pytest
+
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.jobs import (
+    JobCancelled,
+    JobScheduler,
+    Priority,
+    check_cancelled,
+)
+
+PDF_URL = "https://www.accessdata.fda.gov/cdrh_docs/pdf20/P200001B.pdf"
+
+
+def _gate():
+    """A blocking job that waits for the returned event, and its started flag."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+        return "blocker"
+
+    return blocker, started, release
+
+
+async def _wait_for(event: threading.Event) -> None:
+    while not event.is_set():
+        await asyncio.sleep(0.005)
+
+
+class TestJobScheduler:
+    @pytest.mark.anyio
+    async def test_runs_job_and_returns_result(self):
+        scheduler = JobScheduler(max_concurrent=2)
+        assert await scheduler.run("k", lambda x: x * 2, 21) == 42
+        assert scheduler.stats().completed == 1
+
+    @pytest.mark.anyio
+    async def test_global_cap(self):
+        scheduler = JobScheduler(max_concurrent=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.02)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(scheduler.run(i, work) for i in range(6)))
+        assert peak == 2
+
+    @pytest.mark.anyio
+    async def test_interactive_runs_before_prefetch(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        blocker, started, release = _gate()
+        order = []
+
+        first = asyncio.ensure_future(scheduler.run("block", blocker))
+        await _wait_for(started)
+        prefetch = asyncio.ensure_future(scheduler.run(
+            "p", order.append, "prefetch", priority=Priority.PREFETCH
+        ))
+        interactive = asyncio.ensure_future(scheduler.run("i", order.append, "interactive"))
+        await asyncio.sleep(0)
+
+        stats = scheduler.stats()
+        assert stats.queued == {"interactive": 1, "prefetch": 1}
+        assert stats.running == 1
+        assert stats.queue_depth == 2
+
+        release.set()
+        await asyncio.gather(first, prefetch, interactive)
+        assert order == ["interactive", "prefetch"]
+
+    @pytest.mark.anyio
+    async def test_promote_moves_prefetch_ahead(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        blocker, started, release = _gate()
+        order = []
+
+        first = asyncio.ensure_future(scheduler.run("block", blocker))
+        await _wait_for(started)
+        a = asyncio.ensure_future(scheduler.run("a", order.append, "a"))
+        b = asyncio.ensure_future(
+            scheduler.run("b", order.append, "b", priority=Priority.PREFETCH)
+        )
+        await asyncio.sleep(0)
+        # Joining the prefetch job interactively promotes it.
+        b2 = asyncio.ensure_future(scheduler.run("b", order.append, "b"))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(first, a, b, b2)
+        assert order == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_promoted_job_counted_once(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        blocker, started, release = _gate()
+
+        first = asyncio.ensure_future(scheduler.run("block", blocker))
+        await _wait_for(started)
+        b = asyncio.ensure_future(
+            scheduler.run("b", str, priority=Priority.PREFETCH)
+        )
+        await asyncio.sleep(0)
+        assert scheduler.promote("b")
+        assert not scheduler.promote("b")
+
+        stats = scheduler.stats()
+        assert stats.queued == {"interactive": 1, "prefetch": 0}
+        assert stats.queue_depth == 1
+        assert sum(entry[2] is not None for entry in scheduler._queue) == 1
+
+        release.set()
+        await asyncio.gather(first, b)
+        assert scheduler.stats().completed == 2
+
+    @pytest.mark.anyio
+    async def test_identical_jobs_run_once(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        calls = []
+
+        def work():
+            calls.append(1)
+            threading.Event().wait(0.02)
+            return "done"
+
+        results = await asyncio.gather(*(scheduler.run("same", work) for _ in range(3)))
+        assert results == ["done"] * 3
+        assert len(calls) == 1
+        assert scheduler.stats().deduplicated == 2
+
+    @pytest.mark.anyio
+    async def test_cancelled_queued_job_never_runs(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        blocker, started, release = _gate()
+        ran = []
+
+        first = asyncio.ensure_future(scheduler.run("block", blocker))
+        await _wait_for(started)
+        queued = asyncio.ensure_future(scheduler.run("q", ran.append, 1))
+        await asyncio.sleep(0)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        await first
+        assert ran == []
+        assert scheduler.stats().cancelled == 1
+        assert scheduler.stats().queue_depth == 0
+
+    @pytest.mark.anyio
+    async def test_job_survives_while_another_caller_waits(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        blocker, started, release = _gate()
+
+        one = asyncio.ensure_future(scheduler.run("k", blocker))
+        two = asyncio.ensure_future(scheduler.run("k", blocker))
+        await _wait_for(started)
+        one.cancel()
+        await asyncio.sleep(0)
+
+        release.set()
+        assert await two == "blocker"
+
+    @pytest.mark.anyio
+    async def test_running_job_stops_at_checkpoint(self):
+        scheduler = JobScheduler(max_concurrent=1)
+        started = threading.Event()
+        outcome = []
+
+        def pages():
+            started.set()
+            try:
+                for _ in range(500):
+                    check_cancelled()
+                    threading.Event().wait(0.01)
+            except JobCancelled:
+                outcome.append("stopped")
+                raise
+
+        task = asyncio.ensure_future(scheduler.run("ocr", pages))
+        await _wait_for(started)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        for _ in range(100):
+            if outcome:
+                break
+            await asyncio.sleep(0.01)
+        assert outcome == ["stopped"]
+
+    def test_check_cancelled_is_noop_outside_jobs(self):
+        check_cancelled()
+
+
+class TestDocumentCancellation:
+    @pytest.mark.anyio
+    async def test_last_caller_cancelling_aborts_download(self, monkeypatch):
+        cancelled = asyncio.Event()
+
+        async def slow_download(url, client, priority=None, tables=False):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        monkeypatch.setattr(fetcher, "_download_and_extract", slow_download)
+        caller = asyncio.ensure_future(fetcher.extract_document(PDF_URL))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert PDF_URL not in fetcher._inflight
+
+    @pytest.mark.anyio
+    async def test_scanned_prefetch_queues_ocr_at_prefetch_priority(self, monkeypatch):
+        seen = []
+
+        async def fake_run(key, fn, *args, priority=Priority.INTERACTIVE):
+            seen.append((key, priority))
+            return "OCR text " * 20
+
+        async def fake_download(url, dest, client=None):
+            dest.write(b"%PDF-fake")
+
+        monkeypatch.setattr(fetcher, "OCR_AVAILABLE", True)
+        monkeypatch.setattr(fetcher, "_download_pdf", fake_download)
+        monkeypatch.setattr(
+            fetcher, "_extract_file",
+            lambda url, path: ExtractedDocument(url, "", 3, "none", needs_ocr=True),
+        )
+        monkeypatch.setattr(fetcher.cpu_jobs, "run", fake_run)
+
+        doc = await fetcher.extract_document(PDF_URL, speculative=True)
+
+        assert doc.method == "OCR (scanned document)"
+        assert seen == [(("ocr", PDF_URL), Priority.PREFETCH)]
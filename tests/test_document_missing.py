@@ -0,0 +1,137 @@
+"""Tests for the known-missing document registry."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents import missing, resolver
+from fda_mcp.documents.missing import BloomFilter, MissingRegistry, get_missing_registry
+from fda_mcp.documents.resolver import known_missing, resolve_document_url
+from fda_mcp.errors import DocumentNotFoundError
+
+PRIMARY = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K031234.pdf"
+KEY = "510k_summary:K031234"
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"510k_summary:K{n:06d}" for n in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for n in range(1000):
+            bloom.add(f"present:{n}")
+        false_positives = sum(f"absent:{n}" in bloom for n in range(10000))
+        assert false_positives < 300
+
+
+class TestMissingRegistry:
+    def test_add_and_lookup(self, tmp_path):
+        registry = MissingRegistry(str(tmp_path / "missing.db"))
+        assert not registry.is_missing(KEY)
+        registry.add(KEY)
+        assert registry.is_missing(KEY)
+        registry.close()
+
+    def test_persists_across_processes(self, tmp_path):
+        path = str(tmp_path / "missing.db")
+        first = MissingRegistry(path)
+        first.add(KEY)
+        first.close()
+
+        second = MissingRegistry(path)
+        assert second.is_missing(KEY)
+        second.close()
+
+    def test_remove(self, tmp_path):
+        registry = MissingRegistry(str(tmp_path / "missing.db"))
+        registry.add(KEY)
+        registry.remove(KEY)
+        # Still in the Bloom filter, but the table lookup says no.
+        assert not registry.is_missing(KEY)
+        registry.close()
+
+    def test_expired_entries_purged_on_load(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "missing.db")
+        registry = MissingRegistry(path)
+        registry.add(KEY)
+        registry.close()
+
+        monkeypatch.setattr(config, "missing_document_ttl", 0)
+        time.sleep(0.01)
+        registry = MissingRegistry(path)
+        assert not registry.is_missing(KEY)
+        registry.close()
+
+    def test_needs_recheck_after_interval(self, tmp_path, monkeypatch):
+        registry = MissingRegistry(str(tmp_path / "missing.db"))
+        registry.add(KEY)
+        assert not registry.needs_recheck(KEY)
+
+        monkeypatch.setattr(config, "missing_document_recheck", 0)
+        time.sleep(0.01)
+        assert registry.needs_recheck(KEY)
+        assert registry.is_missing(KEY)
+        registry.close()
+
+
+class TestResolverRecheck:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_registry_queried_off_the_event_loop(self, monkeypatch):
+        get_missing_registry().add(KEY)
+        threads = []
+        lookup = MissingRegistry._checked_at
+
+        def recording(self, key):
+            threads.append(threading.current_thread())
+            return lookup(self, key)
+
+        monkeypatch.setattr(MissingRegistry, "_checked_at", recording)
+
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+        assert await known_missing(
+            [("510k_summary", "K031234", None), ("510k_summary", "K999999", None)]
+        ) == [True, False]
+        assert threads
+        assert threading.main_thread() not in threads
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_known_missing_fails_without_network(self):
+        get_missing_registry().add(KEY)
+        route = respx.head(url__regex=r".*K031234\.pdf").mock(
+            return_value=httpx.Response(200)
+        )
+
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+        assert route.call_count == 0
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_stale_entry_rechecked_in_background(self, monkeypatch):
+        get_missing_registry().add(KEY)
+        monkeypatch.setattr(config, "missing_document_recheck", 0)
+        time.sleep(0.01)
+        respx.head(PRIMARY).mock(return_value=httpx.Response(200))
+        respx.head(url__regex=r".*K031234\.pdf").mock(return_value=httpx.Response(404))
+
+        # Still fails fast this time...
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+        await asyncio.gather(*resolver._rechecks.values())
+
+        # ...but the document has turned up, so the next call finds it.
+        assert not missing.get_missing_registry().is_missing(KEY)
+        assert await resolve_document_url("510k_summary", "K031234") == PRIMARY
@@ -0,0 +1,109 @@
+"""Tests for OCR profiles and page preprocessing."""
+
+from PIL import Image, ImageDraw
+
+from fda_mcp.config import config
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.ocr import (
+    OCR_PROFILES,
+    get_profile,
+    parse_page_size,
+    preprocess,
+    render_dpi,
+)
+
+
+def _page(noise: bool = False) -> Image.Image:
+    image = Image.new("RGB", (850, 1100), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((200, 300, 600, 320), fill="black")
+    if noise:
+        for x in range(0, 850, 37):
+            image.putpixel((x, 1050), (0, 0, 0))
+    return image
+
+
+class TestProfiles:
+    def test_default_profile_from_config(self, monkeypatch):
+        monkeypatch.setattr(config, "ocr_profile", "accurate")
+        assert get_profile().name == "accurate"
+
+    def test_unknown_profile_falls_back_to_fast(self):
+        assert get_profile("bogus").name == "fast"
+
+    def test_fast_is_cheaper_than_accurate(self):
+        fast, accurate = OCR_PROFILES["fast"], OCR_PROFILES["accurate"]
+        assert fast.dpi < accurate.dpi
+        assert fast.tesseract_config == "--psm 6 --oem 1"
+
+
+class TestRenderDpi:
+    def test_letter_page_uses_profile_dpi(self):
+        assert render_dpi((612, 792), OCR_PROFILES["fast"]) == 150
+
+    def test_large_page_lowers_dpi(self):
+        # 11x17 tabloid foldout: 17in * 150dpi would exceed 2000px.
+        assert render_dpi((792, 1224), OCR_PROFILES["fast"]) == 117
+
+    def test_unknown_size(self):
+        assert render_dpi(None, OCR_PROFILES["accurate"]) == 300
+
+    def test_parse_page_size(self):
+        assert parse_page_size("612 x 792 pts (letter)") == (612.0, 792.0)
+        assert parse_page_size(None) is None
+
+
+class TestPreprocess:
+    def test_grayscale_and_binarize(self):
+        image = preprocess(_page(), OCR_PROFILES["fast"])
+        assert image.mode == "L"
+        assert {v for _, v in image.getcolors()} <= {0, 255}
+
+    def test_crops_to_ink_ignoring_specks(self):
+        image = preprocess(_page(noise=True), OCR_PROFILES["fast"])
+        assert image.width < 500
+        assert image.height < 100
+
+    def test_blank_page_is_not_cropped(self):
+        blank = Image.new("L", (100, 100), 255)
+        assert preprocess(blank, OCR_PROFILES["accurate"]).size == (100, 100)
+
+
+class TestExtractWithOcr:
+    def test_renders_page_by_page_with_profile(self, monkeypatch):
+        rendered = []
+        configs = []
+
+        def fake_convert(path, dpi, first_page, last_page, grayscale):
+            rendered.append((dpi, first_page, last_page, grayscale))
+            return [_page()]
+
+        def fake_ocr(image, config):
+            configs.append(config)
+            return "Approval letter text"
+
+        monkeypatch.setattr("pdf2image.convert_from_path", fake_convert)
+        monkeypatch.setattr(
+            "pdf2image.pdfinfo_from_path",
+            lambda path: {"Pages": 3, "Page size": "612 x 792 pts (letter)"},
+        )
+        monkeypatch.setattr("pytesseract.image_to_string", fake_ocr)
+
+        text = fetcher._extract_with_ocr("/tmp/x.pdf", profile=OCR_PROFILES["accurate"])
+
+        assert rendered == [(300, n, n, True) for n in (1, 2, 3)]
+        assert configs == ["--psm 3 --oem 1"] * 3
+        assert "--- Page 3 ---" in text
+
+    def test_respects_max_pages(self, monkeypatch):
+        monkeypatch.setattr(
+            "pdf2image.convert_from_path", lambda path, **kw: [_page()]
+        )
+        monkeypatch.setattr(
+            "pdf2image.pdfinfo_from_path", lambda path: {"Pages": 50}
+        )
+        monkeypatch.setattr("pytesseract.image_to_string", lambda image, config: "x")
+
+        text = fetcher._extract_with_ocr("/tmp/x.pdf", max_pages=2)
+
+        assert text.count("--- Page") == 2
@@ -0,0 +1,153 @@
+"""Tests for speculative decision-document prefetch."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.cache import document_cache
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.prefetch import DocumentPrefetcher, submissions_from_results
+from fda_mcp.errors import DocumentNotFoundError
+
+PDF_URL = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K213456.pdf"
+
+
+@pytest.fixture
+def fake_extraction(monkeypatch):
+    """Resolve to the primary URL and extract canned text."""
+
+    async def fake_resolve(document_type, number, supplement=None):
+        if number == "K000001":
+            raise DocumentNotFoundError("missing")
+        return f"https://www.accessdata.fda.gov/cdrh_docs/reviews/{number}.pdf"
+
+    monkeypatch.setattr(
+        "fda_mcp.documents.prefetch.resolve_document_url", fake_resolve
+    )
+    monkeypatch.setattr(
+        fetcher,
+        "_extract_file",
+        lambda url, path: ExtractedDocument(url, "Prefetched text", 1, "text extraction"),
+    )
+
+
+class TestSubmissionsFromResults:
+    def test_510k_and_denovo_numbers(self):
+        results = [
+            {"k_number": "K213456"},
+            {"k_number": "DEN200001"},
+            {"k_number": "K213456"},
+            {"k_number": "K193012"},
+        ]
+        assert submissions_from_results("device/510k", results, 3) == [
+            ("510k_summary", "K213456", None),
+            ("denovo_decision", "DEN200001", None),
+            ("510k_summary", "K193012", None),
+        ]
+
+    def test_top_n_limit(self):
+        results = [{"k_number": f"K2100{i:02d}"} for i in range(10)]
+        assert len(submissions_from_results("device/510k", results, 2)) == 2
+
+    def test_pma_originals_and_supplements(self):
+        results = [
+            {"pma_number": "P200001", "supplement_number": ""},
+            {"pma_number": "P200001", "supplement_number": "013"},
+        ]
+        assert submissions_from_results("device/pma", results, 5) == [
+            ("pma_approval", "P200001", None),
+            ("pma_supplement", "P200001", "013"),
+        ]
+
+    def test_other_endpoints_have_no_documents(self):
+        assert submissions_from_results("drug/event", [{"k_number": "K1"}], 5) == []
+
+
+class TestDocumentPrefetcher:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_prefetch_fills_document_cache(self, fake_extraction):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        prefetcher = DocumentPrefetcher()
+
+        assert prefetcher.schedule([("510k_summary", "K213456", None)]) == 1
+        await asyncio.gather(*prefetcher._tasks)
+
+        assert PDF_URL in document_cache
+        result = await fetcher.fetch_and_extract_pdf(PDF_URL)
+        assert "Prefetched text" in result
+        assert route.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_errors_are_swallowed(self, fake_extraction):
+        prefetcher = DocumentPrefetcher()
+        prefetcher.schedule([("510k_summary", "K000001", None)])
+        await asyncio.gather(*prefetcher._tasks)
+        assert prefetcher.pending == 0
+
+    @pytest.mark.anyio
+    async def test_cancel_stops_pending_prefetches(self, monkeypatch):
+        started = asyncio.Event()
+
+        async def slow_prefetch(self, spec):
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(DocumentPrefetcher, "_prefetch", slow_prefetch)
+        prefetcher = DocumentPrefetcher()
+        prefetcher.schedule([("510k_summary", "K213456", None), ("510k_summary", "K193012", None)])
+        await started.wait()
+
+        assert prefetcher.cancel() == 2
+        assert prefetcher.pending == 0
+
+    @pytest.mark.anyio
+    async def test_disabled_by_default(self):
+        prefetcher = DocumentPrefetcher()
+        assert config.prefetch_documents == 0
+        results = [{"k_number": "K213456"}]
+        assert await prefetcher.schedule_from_results("device/510k", results) == 0
+
+
+class TestSpeculativeDownloads:
+    @pytest.mark.anyio
+    async def test_joined_download_survives_cancel(self, monkeypatch):
+        release = asyncio.Event()
+
+        async def slow_download(url, client, priority=None, tables=False):
+            await release.wait()
+            return ExtractedDocument(url, "Shared text", 1, "text extraction")
+
+        monkeypatch.setattr(fetcher, "_download_and_extract", slow_download)
+        speculative = asyncio.ensure_future(
+            fetcher.extract_document(PDF_URL, speculative=True)
+        )
+        await asyncio.sleep(0)
+        real = asyncio.ensure_future(fetcher.extract_document(PDF_URL))
+        await asyncio.sleep(0)
+
+        assert fetcher.cancel_speculative([PDF_URL]) == 0
+        release.set()
+        assert (await real).text == "Shared text"
+        assert (await speculative).text == "Shared text"
+
+    @pytest.mark.anyio
+    async def test_unjoined_download_is_cancelled(self, monkeypatch):
+        async def slow_download(url, client, priority=None, tables=False):
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(fetcher, "_download_and_extract", slow_download)
+        speculative = asyncio.ensure_future(
+            fetcher.extract_document(PDF_URL, speculative=True)
+        )
+        await asyncio.sleep(0)
+
+        assert fetcher.cancel_speculative([PDF_URL]) == 1
+        with pytest.raises(asyncio.CancelledError):
+            await speculative
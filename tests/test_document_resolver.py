@@ -0,0 +1,205 @@
+"""Tests for multi-candidate decision-document URL resolution."""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.config import config
+from fda_mcp.documents import resolver
+from fda_mcp.documents.resolver import (
+    ResolvedURLCache,
+    forget_document_url,
+    known_missing,
+    resolve_document_url,
+)
+from fda_mcp.errors import DocumentNotFoundError, InvalidIdentifierError
+
+PRIMARY = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K031234.pdf"
+LEGACY = "https://www.accessdata.fda.gov/cdrh_docs/pdf3/K031234.pdf"
+PDF03 = "https://www.accessdata.fda.gov/cdrh_docs/pdf03/K031234.pdf"
+
+
+class TestResolveDocumentUrl:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_returns_first_candidate_that_exists(self):
+        respx.head(PRIMARY).mock(return_value=httpx.Response(404))
+        respx.head(PDF03).mock(return_value=httpx.Response(404))
+        respx.head(LEGACY).mock(
+            return_value=httpx.Response(200, headers={"content-type": "application/pdf"})
+        )
+
+        url = await resolve_document_url("510k_summary", "K031234")
+
+        assert url == LEGACY
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_prefers_candidate_order_over_response_time(self):
+        async def slow_hit(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, headers={"content-type": "application/pdf"})
+
+        respx.head(PRIMARY).mock(side_effect=slow_hit)
+        respx.head(PDF03).mock(return_value=httpx.Response(404))
+        respx.head(LEGACY).mock(
+            return_value=httpx.Response(200, headers={"content-type": "application/pdf"})
+        )
+
+        url = await resolve_document_url("510k_summary", "K031234")
+
+        assert url == PRIMARY
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_resolved_url_is_cached_on_disk(self):
+        route = respx.head(url__regex=r".*K031234\.pdf").mock(
+            return_value=httpx.Response(200)
+        )
+        first = await resolve_document_url("510k_summary", "K031234")
+        calls = route.call_count
+
+        resolver._cache = None  # simulate a fresh process
+        second = await resolve_document_url("510k_summary", "k031234")
+
+        assert second == first
+        assert route.call_count == calls
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_all_missing_is_negatively_cached(self):
+        route = respx.head(url__regex=r".*K031234\.pdf").mock(
+            return_value=httpx.Response(404)
+        )
+
+        with pytest.raises(DocumentNotFoundError, match="2 alternative locations"):
+            await resolve_document_url("510k_summary", "K031234")
+        calls = route.call_count
+
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+        assert route.call_count == calls
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_negative_entry_expires(self, monkeypatch):
+        primary = respx.head(PRIMARY).mock(return_value=httpx.Response(404))
+        respx.head(url__regex=r".*K031234\.pdf").mock(return_value=httpx.Response(404))
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+
+        monkeypatch.setattr(config, "missing_document_ttl", 0)
+        primary.return_value = httpx.Response(200)
+        time.sleep(0.01)
+
+        assert await resolve_document_url("510k_summary", "K031234") == PRIMARY
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_falls_back_to_ranged_get_when_head_rejected(self):
+        respx.head(url__regex=r".*K031234\.pdf").mock(return_value=httpx.Response(405))
+        respx.get(PRIMARY).mock(return_value=httpx.Response(404))
+        respx.get(PDF03).mock(return_value=httpx.Response(404))
+        ranged = respx.get(LEGACY).mock(return_value=httpx.Response(206))
+
+        url = await resolve_document_url("510k_summary", "K031234")
+
+        assert url == LEGACY
+        assert ranged.calls[0].request.headers["range"] == "bytes=0-0"
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_inconclusive_probes_fall_back_to_primary(self):
+        respx.head(url__regex=r".*K031234\.pdf").mock(
+            side_effect=httpx.ConnectError("down")
+        )
+
+        url = await resolve_document_url("510k_summary", "K031234")
+
+        assert url == PRIMARY
+        assert await known_missing([("510k_summary", "K031234", None)]) == [False]
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_html_soft_404_is_not_a_hit(self):
+        respx.head(url__regex=r".*K031234\.pdf").mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/html"})
+        )
+        with pytest.raises(DocumentNotFoundError):
+            await resolve_document_url("510k_summary", "K031234")
+
+    @pytest.mark.anyio
+    async def test_invalid_identifier_raises_before_probing(self):
+        with pytest.raises(InvalidIdentifierError):
+            await resolve_document_url("510k_summary", "BAD")
+
+
+class TestResolvedURLCache:
+    @pytest.mark.anyio
+    async def test_forget_drops_stale_entry(self):
+        cache = resolver._get_cache()
+        cache.set_resolved("510k_summary:K031234", LEGACY)
+
+        await forget_document_url("510k_summary", "K031234")
+
+        assert cache.get("510k_summary:K031234") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "resolved_urls.json"
+        path.write_text("{not json")
+        cache = ResolvedURLCache(str(path))
+
+        assert cache.get("anything") is None
+        cache.set_resolved("k", "u")
+        assert ResolvedURLCache(str(path)).get("k") == "u"
+
+    def test_writes_merge_other_processes_entries(self, tmp_path):
+        path = str(tmp_path / "resolved_urls.json")
+        ours = ResolvedURLCache(path)
+        theirs = ResolvedURLCache(path)
+        ours.get("a")
+        theirs.set_resolved("b", "url-b")
+        ours.set_resolved("a", "url-a")
+        theirs.forget("a")
+        ours.set_resolved("c", "url-c")
+
+        fresh = ResolvedURLCache(path)
+        assert (fresh.get("a"), fresh.get("b"), fresh.get("c")) == (
+            None, "url-b", "url-c",
+        )
+        assert ours.get("b") == "url-b"
+
+    def test_oldest_entries_are_dropped_past_the_cap(self, tmp_path):
+        path = str(tmp_path / "resolved_urls.json")
+        cache = ResolvedURLCache(path, max_entries=2)
+        cache.set_resolved("a", "url-a")
+        cache.set_resolved("b", "url-b")
+        cache.set_resolved("a", "url-a")  # refreshed: now the newest
+        cache.set_resolved("c", "url-c")
+
+        fresh = ResolvedURLCache(path)
+        assert (fresh.get("a"), fresh.get("b"), fresh.get("c")) == (
+            "url-a", None, "url-c",
+        )
+
+    def test_concurrent_writers_lose_no_entries(self, tmp_path):
+        path = str(tmp_path / "resolved_urls.json")
+        caches = [ResolvedURLCache(path) for _ in range(4)]
+
+        def write(index: int) -> None:
+            for n in range(25):
+                caches[index].set_resolved(f"{index}:{n}", f"url-{index}-{n}")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(write, range(4)))
+
+        fresh = ResolvedURLCache(path)
+        assert all(
+            fresh.get(f"{i}:{n}") == f"url-{i}-{n}" for i in range(4) for n in range(25)
+        )
+        assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
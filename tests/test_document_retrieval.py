@@ -0,0 +1,88 @@
+"""Tests for BM25 passage retrieval in decision documents."""
+
+import pytest
+
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.retrieval import (
+    BM25Index,
+    format_passages,
+    get_index,
+    search_document,
+    split_passages,
+    tokenize,
+)
+
+FILLER = "General device description and labeling boilerplate text.\n" * 40
+PREDICATE = "The predicate device is K123456, a pulse oximeter cleared in 2012.\n"
+CLINICAL = "Clinical study results: the primary endpoint was met with 98% accuracy.\n"
+
+
+def _doc(text: str) -> ExtractedDocument:
+    return ExtractedDocument("https://example.com/doc.pdf", text, 12, "text extraction")
+
+
+class TestSplitPassages:
+    def test_covers_whole_text(self):
+        text = FILLER + PREDICATE + FILLER
+        spans = split_passages(text, 300)
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(text)
+        assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+
+    def test_prefers_line_breaks(self):
+        spans = split_passages(FILLER, 300)
+        assert all(FILLER[end - 1] == "\n" for _, end in spans)
+
+
+class TestBM25Index:
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("The Predicate device of K123456") == ["predicate", "device", "k123456"]
+
+    def test_ranks_matching_passage_first(self):
+        text = FILLER + PREDICATE + FILLER + CLINICAL + FILLER
+        index = BM25Index(text, 300)
+
+        score, best = index.search("predicate device")[0]
+        start, end = index.spans[best]
+        assert "K123456" in text[start:end]
+
+        _, best = index.search("clinical endpoint results")[0]
+        start, end = index.spans[best]
+        assert "primary endpoint" in text[start:end]
+
+    def test_no_match_returns_empty(self):
+        assert BM25Index(FILLER).search("xylophone") == []
+
+    def test_index_is_built_once_per_document(self):
+        doc = _doc(FILLER + PREDICATE)
+        assert get_index(doc) is get_index(doc)
+
+
+class TestFormatPassages:
+    def test_returns_relevant_passage_far_into_document(self):
+        doc = _doc(FILLER * 20 + CLINICAL + FILLER * 20)
+
+        result = format_passages(doc, "clinical study results", 1000)
+
+        assert "primary endpoint was met" in result
+        assert "Query: clinical study results" in result
+        body = result.split("\n\n", 1)[1]
+        assert len(body) < 1100
+
+    def test_no_match_falls_back_to_document_start(self):
+        doc = _doc(FILLER)
+        result = format_passages(doc, "xylophone", 200)
+        assert "No passages matched" in result
+        assert "General device description" in result
+
+    def test_passage_larger_than_budget_is_cut(self):
+        doc = _doc(PREDICATE * 50)
+        result = format_passages(doc, "predicate", 100)
+        body = result.split("\n\n", 1)[1]
+        assert len(body.split("\n", 1)[1]) <= 100
+
+    @pytest.mark.anyio
+    async def test_search_document_runs_in_worker_pool(self):
+        doc = _doc(FILLER + PREDICATE)
+        result = await search_document(doc, "predicate", 2000)
+        assert "K123456" in result
@@ -0,0 +1,111 @@
+"""Tests for section segmentation of decision documents."""
+
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.sections import detect_sections, format_sections, get_sections
+
+SUMMARY = """510(k) SUMMARY
+Table of Contents
+Indications for Use .......... 3
+1. Submitter Information
+Acme Medical Inc.
+2. Predicate Device
+The predicate device is K123456, the Acme Oximeter.
+3. Device Description
+The device is a fingertip pulse oximeter.
+4. Indications for Use
+For spot-check monitoring of SpO2 in adults.
+5. Comparison of Technological Characteristics with the Predicate
+Same sensor technology as the predicate.
+VI. NON-CLINICAL PERFORMANCE DATA
+ISO 80601-2-61 testing passed.
+7. Clinical Studies
+Clinical accuracy study in 12 subjects.
+8. Conclusion
+The device is substantially equivalent.
+"""
+
+
+def _doc(text: str = SUMMARY) -> ExtractedDocument:
+    return ExtractedDocument("https://example.com/K213456.pdf", text, 3, "text extraction")
+
+
+class TestDetectSections:
+    def test_detects_numbered_headings(self):
+        names = [s.name for s in detect_sections(SUMMARY)]
+        assert names == [
+            "predicate",
+            "device_description",
+            "indications",
+            "substantial_equivalence",
+            "performance_data",
+            "clinical",
+            "conclusion",
+        ]
+
+    def test_skips_table_of_contents_entries(self):
+        first = detect_sections(SUMMARY)[0]
+        assert first.title == "2. Predicate Device"
+
+    def test_sentence_starting_with_phrase_is_not_a_heading(self):
+        sections = detect_sections(SUMMARY)
+        predicate = sections[0]
+        assert "K123456" in SUMMARY[predicate.start:predicate.end]
+
+    def test_inline_heading(self):
+        sections = detect_sections("Header\nPredicate Device: K999999 (Acme)\nMore text\n")
+        assert [s.name for s in sections] == ["predicate"]
+
+    def test_lettered_headings_need_a_delimiter(self):
+        text = "Header\nb) Predicate Device\nK123456\nc. Device Description\nA pump.\n"
+        assert [s.name for s in detect_sections(text)] == [
+            "predicate", "device_description",
+        ]
+
+    def test_wrapped_prose_is_not_a_heading(self):
+        text = (
+            "2. Device Description\n"
+            "The device is substantially equivalent to\n"
+            "a predicate device cleared under\n"
+            "K123456 and has the same\n"
+            "intended use as the predicate\n"
+            "device.\n"
+        )
+        sections = detect_sections(text)
+        assert [s.name for s in sections] == ["device_description"]
+        assert sections[0].end == len(text)
+
+    def test_sections_are_contiguous(self):
+        sections = detect_sections(SUMMARY)
+        assert all(a.end == b.start for a, b in zip(sections, sections[1:]))
+        assert sections[-1].end == len(SUMMARY)
+
+    def test_get_sections_detects_lazily(self):
+        doc = _doc()
+        assert doc.sections is None
+        assert get_sections(doc) is get_sections(doc)
+
+
+class TestFormatSections:
+    def test_returns_only_requested_sections(self):
+        result = format_sections(_doc(), ["predicate", "clinical"], 8000)
+
+        assert "## 2. Predicate Device" in result
+        assert "K123456" in result
+        assert "Clinical accuracy study" in result
+        assert "fingertip pulse oximeter" not in result
+        assert "Sections: predicate, clinical" in result
+
+    def test_reports_missing_sections(self):
+        result = format_sections(_doc(), ["predicate", "benefit_risk"], 8000)
+        assert "[Not found in this document: benefit_risk]" in result
+
+    def test_falls_back_to_document_start(self):
+        result = format_sections(_doc("No headings here. " * 20), ["clinical"], 100)
+        assert "Requested sections not found: clinical" in result
+        assert "No headings here." in result
+
+    def test_budget_shared_across_sections(self):
+        text = "2. Predicate Device\n" + "p" * 1000 + "\n7. Clinical Studies\n" + "c" * 1000 + "\n"
+        result = format_sections(_doc(text), ["predicate", "clinical"], 400)
+        assert result.count("[truncated]") == 2
+        assert "p" * 200 not in result
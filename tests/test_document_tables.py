@@ -0,0 +1,166 @@
+"""Tests for decision-document table extraction."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from fda_mcp.documents import fetcher
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.tables import (
+    ExtractedTable,
+    extract_tables,
+    format_tables,
+)
+
+PDF_URL = "https://www.accessdata.fda.gov/cdrh_docs/pdf20/P200001B.pdf"
+
+
+def _doc(pages: int = 3) -> ExtractedDocument:
+    return ExtractedDocument(PDF_URL, "text " * 50, pages, "text extraction (pdfplumber)")
+
+
+@pytest.fixture
+def mock_tables(monkeypatch):
+    """Mock pdfplumber.open so page N yields the tables given for it."""
+    opened = []
+
+    class FakePage:
+        def __init__(self, tables):
+            self._tables = tables
+
+        def extract_tables(self):
+            return self._tables
+
+    class FakePDF:
+        def __init__(self, pages):
+            self.pages = [FakePage(t) for t in pages]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    def _factory(pages: list[list]):
+        def _open(path):
+            opened.append(path)
+            return FakePDF(pages)
+
+        monkeypatch.setattr("fda_mcp.documents.tables.pdfplumber.open", _open)
+        return opened
+
+    return _factory
+
+
+class TestExtractTables:
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_extracts_tables_in_page_order(self, mock_tables):
+        respx.get(PDF_URL).mock(return_value=httpx.Response(200, content=b"%PDF-fake"))
+        mock_tables([
+            [[["Endpoint", "Result"], ["Sensitivity", "94.1%"]]],
+            [],
+            [[["Adverse event", "n"], ["Bruising\nat site", None]]],
+        ])
+
+        tables = await extract_tables(_doc())
+
+        assert [t.page for t in tables] == [1, 3]
+        assert tables[0].rows[1] == ["Sensitivity", "94.1%"]
+        assert tables[1].rows[1] == ["Bruising at site", ""]
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_tables_are_cached_on_document(self, mock_tables):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(200, content=b"%PDF-fake")
+        )
+        mock_tables([[[["a", "b"]]]])
+        doc = _doc(pages=1)
+
+        first = await extract_tables(doc)
+        second = await extract_tables(doc)
+
+        assert first is second
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_extracted_with_document_in_one_download(
+        self, mock_tables, monkeypatch
+    ):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(
+                200, content=b"%PDF-fake", headers={"content-type": "application/pdf"}
+            )
+        )
+        monkeypatch.setattr(fetcher, "_extract_file", lambda url, path: _doc(pages=1))
+        mock_tables([[[["a", "b"]]]])
+
+        doc = await fetcher.extract_document(PDF_URL, tables=True)
+        tables = await extract_tables(doc)
+
+        assert tables == [ExtractedTable(1, [["a", "b"]])]
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_joining_plain_download_adds_tables(self, mock_tables, monkeypatch):
+        route = respx.get(PDF_URL).mock(
+            return_value=httpx.Response(
+                200, content=b"%PDF-fake", headers={"content-type": "application/pdf"}
+            )
+        )
+        monkeypatch.setattr(fetcher, "_extract_file", lambda url, path: _doc(pages=1))
+        mock_tables([[[["a", "b"]]]])
+
+        plain = asyncio.ensure_future(fetcher.extract_document(PDF_URL, speculative=True))
+        await asyncio.sleep(0)  # the prefetch owns the download
+        doc = await fetcher.extract_document(PDF_URL, tables=True)
+        tables = await extract_tables(doc)
+
+        assert await plain is doc
+        assert tables == [ExtractedTable(1, [["a", "b"]])]
+        assert route.call_count == 1
+        assert PDF_URL not in fetcher._with_tables
+
+    @respx.mock
+    @pytest.mark.anyio
+    async def test_drops_empty_rows(self, mock_tables):
+        respx.get(PDF_URL).mock(return_value=httpx.Response(200, content=b"%PDF-fake"))
+        mock_tables([[[["a", "b"], [None, ""], ["c", "d"]], [[None]]]])
+
+        tables = await extract_tables(_doc(pages=1))
+
+        assert len(tables) == 1
+        assert tables[0].rows == [["a", "b"], ["c", "d"]]
+
+
+class TestFormatTables:
+    def test_renders_tsv(self):
+        result = format_tables(
+            _doc(), [ExtractedTable(2, [["Endpoint", "Result"], ["Sens", "94%"]])], 1000
+        )
+        assert "Tables: 1 found" in result
+        assert "# Table 1 (page 2, 2 rows)" in result
+        assert "Endpoint\tResult\nSens\t94%" in result
+
+    def test_omits_tables_over_budget(self):
+        tables = [ExtractedTable(i, [["x" * 40, "y" * 40]] * 3) for i in range(1, 6)]
+        result = format_tables(_doc(), tables, 400)
+        assert "# Table 1 " in result
+        assert "# Table 5 " not in result
+        assert "more tables omitted" in result
+
+    def test_first_table_truncated_by_rows(self):
+        table = ExtractedTable(1, [[f"row{i}", "z" * 30] for i in range(50)])
+        result = format_tables(_doc(), [table], 200)
+        assert "row0\t" in result
+        assert "row49" not in result
+        assert "more rows truncated" in result
+
+    def test_no_tables_message(self):
+        result = format_tables(_doc(), [], 1000)
+        assert "No tables were detected" in result
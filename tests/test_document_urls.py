@@ -3,7 +3,7 @@
 import pytest
 from mcp.server.fastmcp.exceptions import ToolError
 
-from fda_mcp.documents.urls import build_document_url
+from fda_mcp.documents.urls import build_document_url, candidate_document_urls
 from fda_mcp.errors import InvalidIdentifierError
 
 
@@ -109,3 +109,31 @@ class TestInvalidDocumentType:
     def test_unknown_type_raises(self):
         with pytest.raises(InvalidIdentifierError):
             build_document_url("unknown_type", "K213456")
+
+
+class TestCandidateDocumentUrls:
+    def test_primary_url_comes_first(self):
+        urls = candidate_document_urls("510k_summary", "K213456")
+        assert urls[0] == build_document_url("510k_summary", "K213456")
+
+    def test_510k_year_directories(self):
+        urls = candidate_document_urls("510k_summary", "K031234")
+        assert "https://www.accessdata.fda.gov/cdrh_docs/pdf3/K031234.pdf" in urls
+        assert "https://www.accessdata.fda.gov/cdrh_docs/pdf03/K031234.pdf" in urls
+
+    def test_pre_2002_flat_directory(self):
+        urls = candidate_document_urls("510k_summary", "K991234")
+        assert "https://www.accessdata.fda.gov/cdrh_docs/pdf/K991234.pdf" in urls
+
+    def test_pma_lowercase_suffix(self):
+        urls = candidate_document_urls("pma_ssed", "P050001")
+        assert "https://www.accessdata.fda.gov/cdrh_docs/pdf5/P050001b.pdf" in urls
+
+    def test_pma_supplement(self):
+        urls = candidate_document_urls("pma_supplement", "P200001", "13")
+        assert urls[0].endswith("/pdf20/P200001S013A.pdf")
+        assert len(urls) == len(set(urls))
+
+    def test_invalid_identifier_raises(self):
+        with pytest.raises(InvalidIdentifierError):
+            candidate_document_urls("510k_summary", "X1")
@@ -0,0 +1,59 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+
+import pytest
+
+from fda_mcp.config import config
+from fda_mcp.jsoncodec import JSON_BACKENDS, backend_available, select_codec
+
+AVAILABLE = [name for name in JSON_BACKENDS if backend_available(name)]
+
+DOC = {
+    "meta": {"results": {"skip": 0, "limit": 2, "total": 2}},
+    "results": [
+        {"term": "NAUSEA", "count": 12345, "ratio": 0.25, "ok": True},
+        {"term": "Ménière’s disease", "count": 0, "ratio": None, "ok": False},
+    ],
+}
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_round_trip(name):
+    codec = select_codec(name)
+    assert codec.name == name
+    encoded = codec.dumps(DOC)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == DOC
+    assert codec.loads(encoded) == DOC
+    assert codec.loads(encoded.decode("utf-8")) == DOC
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_accepts_what_the_stdlib_accepts(name):
+    decoded = select_codec(name).loads(b'{"value": NaN, "big": Infinity}')
+    assert decoded["value"] != decoded["value"]
+    assert decoded["big"] == float("inf")
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_rejects_invalid_json(name):
+    with pytest.raises(ValueError):
+        select_codec(name).loads(b'{"results": [')
+
+
+def test_auto_prefers_first_available():
+    assert select_codec("auto").name == AVAILABLE[0]
+
+
+def test_unavailable_backend_falls_back(monkeypatch):
+    monkeypatch.setattr(
+        "fda_mcp.jsoncodec.backend_available", lambda name: name == "json"
+    )
+    assert select_codec("orjson").name == "json"
+    assert select_codec("auto").name == "json"
+
+
+def test_defaults_to_config(monkeypatch):
+    monkeypatch.setattr(config, "json_backend", "json")
+    assert select_codec().name == "json"
@@ -0,0 +1,38 @@
+"""Tests for the bounded JSON preview."""
+
+import json
+
+from fda_mcp.openfda.jsonpreview import json_preview
+
+RECORD = {
+    "id": 7,
+    "name": "Aspirin \"ASA\" — 81 mg",
+    "ratio": 0.5,
+    "flags": [True, False, None],
+    "empty": {},
+    "none": [],
+    "nested": {"codes": [{"code": "50-78-2", "system": "CAS"}], "ok": True},
+}
+
+
+def test_matches_json_dumps_prefix():
+    full = json.dumps(RECORD, indent=2, default=str)
+    for max_chars in (0, 1, 10, 57, 120, len(full) - 1, len(full), 10_000):
+        assert json_preview(RECORD, max_chars) == full[:max_chars]
+
+
+def test_non_json_values_shown_as_strings():
+    value = {"when": object, 1: "int key"}
+    assert json_preview(value, 1000) == json.dumps(value, indent=2, default=str)
+
+
+def test_long_arrays_elided_with_count():
+    text = json_preview({"items": list(range(25))}, 10_000, max_items=3)
+    assert json.loads(text) == {"items": [0, 1, 2, "... 22 more items"]}
+
+
+def test_stops_early_on_huge_records():
+    record = {"sections": ["s" * 1_000_000 for _ in range(50)]}
+    text = json_preview(record, 200)
+    assert len(text) == 200
+    assert text.startswith('{\n  "sections": [\n    "sss')
@@ -1,5 +1,6 @@
 """Tests for the OpenFDA HTTP client."""
 
+import json
 import os
 
 import httpx
@@ -140,3 +141,132 @@ async def test_handles_timeout(client, monkeypatch):
         )
         with pytest.raises(OpenFDAError, match="timed out"):
             await client.query(endpoint="drug/event", search="test")
+
+
+# -- Streaming --
+
+def _page_body(records: int, meta_first: bool = True) -> bytes:
+    meta = {"results": {"skip": 0, "limit": records, "total": 5000}}
+    results = [{"id": i} for i in range(records)]
+    body = {"meta": meta, "results": results}
+    if not meta_first:
+        body = {"results": results, "meta": meta}
+    return json.dumps(body).encode()
+
+
+async def test_stream_yields_meta_then_records(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(200, content=_page_body(5))
+        )
+        async with client.stream(endpoint="drug/event", search="test") as page:
+            assert page.meta["results"]["total"] == 5000
+            assert page.count == 5
+            records = [record async for record in page]
+    assert [r["id"] for r in records] == [0, 1, 2, 3, 4]
+
+
+async def test_stream_items_with_text(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(200, content=_page_body(3))
+        )
+        async with client.stream(endpoint="drug/event") as page:
+            items = [item async for item in page.items()]
+    assert [(record["id"], raw) for record, raw in items] == [
+        (0, '{"id": 0}'), (1, '{"id": 1}'), (2, '{"id": 2}'),
+    ]
+
+
+async def test_stream_meta_after_results(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(200, content=_page_body(3, meta_first=False))
+        )
+        async with client.stream(endpoint="drug/event") as page:
+            assert page.meta["results"]["limit"] == 3
+            assert len([record async for record in page]) == 3
+
+
+async def test_stream_count_without_meta(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(200, json={"results": [{"a": 1}, {"a": 2}]})
+        )
+        async with client.stream(endpoint="drug/event") as page:
+            assert page.count == 2
+
+
+async def test_stream_malformed_body(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(200, content=b'{"meta": {}, "results": [{"a"')
+        )
+        with pytest.raises(OpenFDAError, match="malformed"):
+            async with client.stream(endpoint="drug/event") as page:
+                [record async for record in page]
+
+
+async def test_stream_maps_status_errors(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(
+                400, json={"error": {"message": "bad field"}}
+            )
+        )
+        with pytest.raises(InvalidSearchError, match="bad field"):
+            async with client.stream(endpoint="drug/event", search="x:y"):
+                pass
+
+
+# -- Pagination --
+
+def _paged(request: httpx.Request, total: int = 2500) -> httpx.Response:
+    skip = int(request.url.params.get("skip", 0))
+    limit = int(request.url.params["limit"])
+    results = [{"id": i} for i in range(skip, min(skip + limit, total))]
+    meta = {"results": {"skip": skip, "limit": limit, "total": total}}
+    return httpx.Response(200, json={"meta": meta, "results": results})
+
+
+async def test_paginate_walks_pages(client):
+    with respx.mock:
+        route = respx.get(f"{BASE_URL}/drug/event.json").mock(side_effect=_paged)
+        ids = [
+            record["id"]
+            async for page in client.paginate("drug/event", max_records=5000)
+            async for record in page
+        ]
+    assert ids == list(range(2500))
+    assert [call.request.url.params["skip"] for call in route.calls] == [
+        "0", "1000", "2000",
+    ]
+
+
+async def test_paginate_stops_at_max_records(client):
+    with respx.mock:
+        route = respx.get(f"{BASE_URL}/drug/event.json").mock(side_effect=_paged)
+        counts = [
+            page.count async for page in client.paginate("drug/event", max_records=1200)
+        ]
+    assert counts == [1000, 200]
+    assert route.calls.last.request.url.params["limit"] == "200"
+
+
+async def test_paginate_tolerates_404_after_first_page(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(side_effect=[
+            _paged(httpx.Request("GET", f"{BASE_URL}/drug/event.json?limit=1000")),
+            httpx.Response(404, json={"error": {"message": "No matches found!"}}),
+        ])
+        pages = [page async for page in client.paginate("drug/event", max_records=3000)]
+    assert len(pages) == 1
+
+
+async def test_paginate_no_matches(client):
+    with respx.mock:
+        respx.get(f"{BASE_URL}/drug/event.json").mock(
+            return_value=httpx.Response(404, json={"error": {"message": "No matches found!"}})
+        )
+        with pytest.raises(NotFoundError):
+            [page async for page in client.paginate("drug/event")]
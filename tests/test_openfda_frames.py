@@ -0,0 +1,198 @@
+"""Tests for columnar frames and local group-by."""
+
+import math
+
+import pytest
+
+from fda_mcp.errors import MissingDependencyError
+from fda_mcp.openfda import frames
+from fda_mcp.openfda.frames import MISSING, FrameBuilder, GroupKey
+
+pytest.importorskip("numpy")
+
+DRUG = "patient.drug.medicinalproduct"
+INDICATION = "patient.drug.drugindication"
+REACTION = "patient.reaction.reactionmeddrapt"
+AGE = "patient.patientonsetage"
+SEX = "patient.patientsex"
+
+
+def _event(age, sex, drugs, reactions) -> dict:
+    patient = {
+        "drug": [
+            {"medicinalproduct": name, "drugindication": indication}
+            for name, indication in drugs
+        ],
+        "reaction": [{"reactionmeddrapt": name} for name in reactions],
+    }
+    if age is not None:
+        patient["patientonsetage"] = age
+    if sex is not None:
+        patient["patientsex"] = sex
+    return {"patient": patient}
+
+
+EVENTS = [
+    _event("30", "1", [("ASPIRIN", "PAIN"), ("IBUPROFEN", "FEVER")], ["Nausea", "Headache"]),
+    _event("70", "2", [("ASPIRIN", "PAIN")], ["Nausea"]),
+    _event("12", "2", [("IBUPROFEN", "FEVER")], []),
+    _event(None, None, [], ["Rash"]),
+]
+
+
+def _frame(strings, numbers=(), records=EVENTS):
+    builder = FrameBuilder(list(strings), list(numbers))
+    for record in records:
+        assert builder.add(record)
+    return builder.frame()
+
+
+def _table(grouping) -> dict:
+    return {
+        grouping.labels[i]: float(grouping.values[i]) for i in range(len(grouping))
+    }
+
+
+def test_lists_under_different_paths_crossed():
+    frame = _frame([DRUG, REACTION])
+    assert len(frame) == 4 + 1 + 1 + 1
+    grouping = frame.group_by([GroupKey(DRUG), GroupKey(REACTION)])
+    assert _table(grouping) == {
+        ("ASPIRIN", "Nausea"): 2,
+        ("ASPIRIN", "Headache"): 1,
+        ("IBUPROFEN", "Nausea"): 1,
+        ("IBUPROFEN", "Headache"): 1,
+        ("IBUPROFEN", MISSING): 1,
+        (MISSING, "Rash"): 1,
+    }
+
+
+def test_fields_under_one_list_stay_paired():
+    frame = _frame([DRUG, INDICATION])
+    grouping = frame.group_by([GroupKey(DRUG), GroupKey(INDICATION)])
+    assert _table(grouping) == {
+        ("ASPIRIN", "PAIN"): 2,
+        ("IBUPROFEN", "FEVER"): 2,
+        (MISSING, MISSING): 1,
+    }
+
+
+def test_strings_dictionary_encoded():
+    frame = _frame([DRUG, REACTION])
+    assert frame.categories[DRUG] == ["ASPIRIN", "IBUPROFEN"]
+    assert frame.codes[DRUG].dtype.name == "int32"
+    assert frame.codes[DRUG].tolist() == [0, 0, 1, 1, 0, 1, -1]
+    assert frame.record.tolist() == [0, 0, 0, 0, 1, 2, 3]
+
+
+def test_records_counted_once_rows_per_explosion():
+    frame = _frame([DRUG, REACTION])
+    grouping = frame.group_by([GroupKey(DRUG)], "rows")
+    assert _table(grouping) == {("ASPIRIN",): 3, ("IBUPROFEN",): 3, (MISSING,): 1}
+    assert dict(zip(grouping.labels, grouping.records.tolist())) == {
+        ("ASPIRIN",): 2, ("IBUPROFEN",): 2, (MISSING,): 1,
+    }
+
+
+def test_numeric_bands():
+    frame = _frame([SEX], [AGE])
+    key = GroupKey(AGE, [65, 18])
+    assert key.labels() == ["<18", "18-65", "65+"]
+    grouping = frame.group_by([key, GroupKey(SEX)])
+    assert _table(grouping) == {
+        ("<18", "2"): 1,
+        ("18-65", "1"): 1,
+        ("65+", "2"): 1,
+        (MISSING, MISSING): 1,
+    }
+
+
+def test_band_includes_lower_edge():
+    frame = _frame([], [AGE], [_event("18", None, [], []), _event("17.5", None, [], [])])
+    grouping = frame.group_by([GroupKey(AGE, [18])])
+    assert _table(grouping) == {("<18",): 1, ("18+",): 1}
+
+
+def test_ages_converted_to_years_by_unit():
+    def aged(age, unit):
+        event = _event(age, None, [], [])
+        if unit is not None:
+            event["patient"]["patientonsetageunit"] = unit
+        return event
+
+    records = [
+        aged("6", "802"),  # 6 months
+        aged("3", "800"),  # 3 decades
+        aged("40", "801"),
+        aged("10", "804"),  # 10 days
+        aged("70", None),  # no unit: years
+        aged("5", "999"),  # unknown unit
+    ]
+    frame = _frame([], [AGE], records)
+    grouping = frame.group_by([GroupKey(AGE, [2, 18, 65])])
+    assert _table(grouping) == {
+        ("<2",): 2,
+        ("18-65",): 2,
+        ("65+",): 1,
+        (MISSING,): 1,
+    }
+    assert list(frame.numbers[AGE][:3]) == [0.5, 30.0, 40.0]
+
+
+def test_value_counted_once_per_record():
+    # Record 0's age sits on four exploded rows but adds to each drug once.
+    frame = _frame([DRUG, REACTION], [AGE])
+    grouping = frame.group_by([GroupKey(DRUG)], "sum", AGE)
+    assert _table(grouping)[("ASPIRIN",)] == 100
+    assert _table(grouping)[("IBUPROFEN",)] == 42
+    assert math.isnan(_table(grouping)[(MISSING,)])
+
+
+@pytest.mark.parametrize("aggregate,expected", [
+    ("mean", 50), ("min", 30), ("max", 70),
+])
+def test_value_aggregates(aggregate, expected):
+    frame = _frame([DRUG, REACTION], [AGE])
+    grouping = frame.group_by([GroupKey(DRUG)], aggregate, AGE)
+    assert _table(grouping)[("ASPIRIN",)] == expected
+
+
+def test_top_orders_by_value():
+    frame = _frame([DRUG, REACTION], [AGE])
+    grouping = frame.group_by([GroupKey(DRUG)], "sum", AGE)
+    assert [grouping.labels[i] for i in grouping.top(2)] == [
+        ("ASPIRIN",), ("IBUPROFEN",),
+    ]
+
+
+def test_max_rows_stops_builder():
+    builder = FrameBuilder([DRUG, REACTION], [], max_rows=5)
+    assert builder.add(EVENTS[0])
+    assert not builder.add(EVENTS[0])
+    assert builder.full
+    assert not builder.add(EVENTS[2])
+    assert builder.frame().records == 1
+
+
+def test_max_rows_checked_before_rows_built(monkeypatch):
+    crossed = []
+    monkeypatch.setattr(
+        frames, "_cross", lambda parts, width: crossed.append(parts) or []
+    )
+    builder = FrameBuilder([DRUG, REACTION], [], max_rows=1000)
+    drugs = [(f"DRUG{i}", None) for i in range(100)]
+    reactions = [f"R{i}" for i in range(100)]
+    assert not builder.add(_event(None, None, drugs, reactions))
+    assert not crossed
+    assert builder.rows == 0
+
+
+def test_empty_frame():
+    grouping = FrameBuilder([DRUG], []).frame().group_by([GroupKey(DRUG)])
+    assert len(grouping) == 0
+
+
+def test_require_numpy_missing(monkeypatch):
+    monkeypatch.setattr(frames, "numpy_available", lambda: False)
+    with pytest.raises(MissingDependencyError, match=r"fda-mcp\[frames\]"):
+        frames.require_numpy()
@@ -0,0 +1,127 @@
+"""Tests for the per-record summary memo."""
+
+import json
+
+from fda_mcp.config import config
+from fda_mcp.openfda.memo import SummaryMemo, memo_key, summary_memo
+from fda_mcp.openfda.summarizer import SummaryWriter
+from fda_mcp.openfda.tabular import table_writer
+
+META = {"results": {"skip": 0, "limit": 3, "total": 3}}
+
+
+def _recall(number: str, reason: str = "Failed dissolution testing") -> dict:
+    return {
+        "recall_number": number,
+        "classification": "Class II",
+        "status": "Ongoing",
+        "recalling_firm": "Test Pharma Inc",
+        "reason_for_recall": reason,
+    }
+
+
+def _write(writer, records: list[dict], raw: bool = True) -> str:
+    for record in records:
+        writer.add(record, json.dumps(record) if raw else None)
+    return writer.text()
+
+
+def _summary(records: list[dict], budget: int | None = None, raw: bool = True):
+    writer = SummaryWriter("drug/enforcement", META, len(records), budget)
+    return _write(writer, records, raw)
+
+
+def test_memo_bounded_by_chars():
+    memo = SummaryMemo(max_chars=10)
+    memo.put(("e", "1", 1, "summary"), "aaaa")
+    memo.put(("e", "2", 2, "summary"), "bbbb")
+    memo.put(("e", "3", 3, "summary"), "cccc")
+    assert ("e", "1", 1, "summary") not in memo
+    assert len(memo) == 2
+    memo.put(("e", "4", 4, "summary"), "x" * 11)
+    assert len(memo) == 2
+    assert memo.get(("e", "2", 2, "summary")) == "bbbb"
+    assert memo.get(("e", "1", 1, "summary")) is None
+    assert (memo.hits, memo.misses, memo.hit_rate) == (1, 1, 0.5)
+
+
+def test_key_needs_a_string_id():
+    record = _recall("D-1")
+    raw = json.dumps(record)
+    assert memo_key("drug/enforcement", "summary", record, raw) == (
+        "drug/enforcement", "D-1", hash(raw), "summary",
+    )
+    assert memo_key("device/covid19serology", "summary", record, raw) is None
+    assert memo_key("drug/enforcement", "summary", {"recall_number": 7}, raw) is None
+
+
+def test_repeated_records_served_from_memo():
+    first = [_recall("D-1"), _recall("D-2"), _recall("D-3")]
+    expected = _summary(first, raw=False)
+    assert _summary(first) == expected
+    assert (summary_memo.hits, summary_memo.misses) == (0, 3)
+
+    second = [_recall("D-3"), _recall("D-2"), _recall("D-4")]
+    assert _summary(second) == _summary(second, raw=False)
+    assert (summary_memo.hits, summary_memo.misses) == (2, 4)
+
+
+def test_changed_record_rendered_again():
+    _summary([_recall("D-1")])
+    text = _summary([_recall("D-1", reason="Updated reason")])
+    assert "Updated reason" in text
+    assert summary_memo.hits == 0
+
+
+def test_formats_memoized_separately():
+    records = [_recall("D-1")]
+    summary = _summary(records)
+    table = _write(table_writer("drug/enforcement", META, 1), records)
+    assert table != summary
+    assert summary_memo.hits == 0
+    assert len(summary_memo) == 2
+
+
+def test_memoized_text_shortened_to_fit_budget():
+    records = [_recall(f"D-{i}", reason="x" * 400) for i in range(3)]
+    _summary(records)
+    text = _summary(records, budget=1000)
+    assert "[truncated]" in text
+    assert text == _summary(records, 1000, raw=False)
+    assert summary_memo.hits == 3
+
+
+def test_budget_renders_new_records_once(monkeypatch):
+    calls = []
+    render = SummaryWriter.render
+
+    def counted(self, record, share, limit):
+        calls.append(share)
+        return render(self, record, share, limit)
+
+    monkeypatch.setattr(SummaryWriter, "render", counted)
+    short = [_recall("D-1"), _recall("D-2")]
+    _summary(short, budget=2000)
+    assert len(calls) == 2 and None not in calls
+    assert len(summary_memo) == 2
+    assert _summary(short) == _summary(short, raw=False)
+    assert summary_memo.hits == 2
+
+
+def test_budget_cut_rendering_not_memoized():
+    records = [_recall(f"D-{i}", reason="x" * 400) for i in range(3)]
+    text = _summary(records, budget=1000)
+    assert "[truncated]" in text
+    assert len(summary_memo) == 0
+
+
+def test_dicts_without_text_not_memoized():
+    _summary([_recall("D-1")], raw=False)
+    assert len(summary_memo) == 0
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(config, "summary_memo_max_chars", 0)
+    _summary([_recall("D-1")])
+    assert len(summary_memo) == 0
+    assert summary_memo.misses == 0
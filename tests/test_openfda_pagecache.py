@@ -0,0 +1,75 @@
+"""Tests for the search page cache."""
+
+from fda_mcp.openfda.pagecache import PageCache, compact
+from fda_mcp.openfda.records import Device510k
+
+META = {"results": {"skip": 0, "limit": 2, "total": 2}}
+
+
+def _key(search: str = "test", endpoint: str = "device/510k"):
+    return (endpoint, search, 2, 0, None)
+
+
+def _records(count: int = 2) -> list:
+    return [
+        compact("device/510k", {"k_number": f"K{i}", "clearance_type": "Traditional"})
+        for i in range(count)
+    ]
+
+
+def test_pages_hold_models_and_give_records():
+    cache = PageCache(max_records=10, ttl=60)
+    cache.put(_key(), META, 2, _records())
+    page = cache.get(_key())
+    assert isinstance(page.records[0], Device510k)
+    assert list(page) == [{"k_number": "K0"}, {"k_number": "K1"}]
+    assert (page.meta, page.count) == (META, 2)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_records_without_a_model_kept_whole():
+    assert isinstance(compact("device/510k", {"device_name": ["odd"]}), Device510k)
+    record = {"k_number": "K1", "patient": "n/a"}
+    assert compact("drug/event", record) is record
+
+
+def test_expired_pages_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("fda_mcp.openfda.pagecache.time.monotonic", lambda: now[0])
+    cache = PageCache(max_records=10, ttl=60)
+    cache.put(_key(), META, 2, _records())
+    now[0] += 59
+    assert cache.get(_key()) is not None
+    now[0] += 1
+    assert cache.get(_key()) is None
+    assert len(cache) == 0
+
+
+def test_bounded_by_records_least_recently_used_first():
+    cache = PageCache(max_records=5, ttl=60)
+    cache.put(_key("a"), META, 2, _records())
+    cache.put(_key("b"), META, 2, _records())
+    cache.get(_key("a"))
+    cache.put(_key("c"), META, 2, _records())
+    assert _key("a") in cache and _key("c") in cache
+    assert _key("b") not in cache
+    cache.put(_key("d"), META, 6, _records(6))
+    assert _key("d") not in cache
+
+
+def test_replacing_a_page_recounts_records():
+    cache = PageCache(max_records=4, ttl=60)
+    for _ in range(3):
+        cache.put(_key("a"), META, 2, _records())
+    cache.put(_key("b"), META, 2, _records())
+    assert len(cache) == 2
+
+
+def test_only_model_endpoints_and_only_when_enabled():
+    cache = PageCache(max_records=10, ttl=60)
+    cache.put(_key(endpoint="drug/label"), META, 2, [{"id": "x"}])
+    assert cache.get(_key(endpoint="drug/label")) is None
+    assert (len(cache), cache.misses) == (0, 0)
+    for off in (PageCache(max_records=0, ttl=60), PageCache(max_records=10, ttl=0)):
+        off.put(_key(), META, 2, _records())
+        assert len(off) == 0
@@ -0,0 +1,146 @@
+"""Tests for the compact record models."""
+
+import json
+
+import pytest
+
+from fda_mcp.openfda.records import (
+    NULL,
+    RECORD_MODELS,
+    DeviceEvent,
+    DrugEvent,
+    Enforcement,
+    to_model,
+)
+from fda_mcp.openfda.summarizer import _PLANS, _SUMMARIZERS, _TABLES, summarize_response
+from fda_mcp.openfda.tabular import summarize_table
+from tests.test_summarizer import _fill, _key_paths, _replaced
+
+RECORDS = {
+    "drug/event": {
+        "safetyreportid": "10003301",
+        "receiptdate": "20240115",
+        "serious": "1",
+        "seriousnessdeath": "1",
+        "transmissiondate": "20240120",
+        "patient": {
+            "patientonsetage": "67",
+            "patientonsetageunit": "801",
+            "patientsex": "2",
+            "reaction": [{"reactionmeddrapt": "Nausea"}, {"reactionoutcome": "1"}],
+            "drug": [
+                {"medicinalproduct": f"DRUG {i}", "drugcharacterization": "1"}
+                for i in range(7)
+            ],
+        },
+    },
+    "device/event": {
+        "mdr_report_key": "5000001",
+        "date_received": "20240301",
+        "event_type": "Malfunction",
+        "device": [{"generic_name": "INFUSION PUMP", "brand_name": "PUMP 1"}],
+        "mdr_text": [{"text": "Pump stopped."}, {"text_type_code": "N"}],
+        "patient": [
+            {"sequence_number_outcome": ["Hospitalization"]},
+            {"sequence_number_outcome": ["Other"]},
+        ],
+    },
+    "device/510k": {
+        "k_number": "K230001",
+        "device_name": "Blood Glucose Test System",
+        "applicant": "Example Diagnostics",
+        "decision_description": "Substantially Equivalent",
+        "decision_date": "2024-01-15",
+        "product_code": "NBW",
+        "openfda": {"device_class": "2"},
+    },
+    "food/enforcement": {
+        "recall_number": "F-0001-2024",
+        "classification": "Class II",
+        "status": "Ongoing",
+        "recalling_firm": "Example Foods",
+        "product_description": "Granola bars",
+        "reason_for_recall": "Undeclared peanuts.",
+        "report_date": "20240110",
+    },
+}
+
+
+def _page(record: dict) -> dict:
+    return {
+        "meta": {"results": {"skip": 0, "limit": 1, "total": 1}},
+        "results": [record],
+    }
+
+
+@pytest.mark.parametrize("endpoint", RECORDS)
+def test_summaries_match_original_record(endpoint):
+    record = RECORDS[endpoint]
+    model = to_model(endpoint, record)
+    for budget in (None, 400):
+        assert summarize_response(
+            endpoint, _page(model.as_record()), budget
+        ) == summarize_response(endpoint, _page(record), budget)
+        assert summarize_table(
+            endpoint, _page(model.as_record()), budget
+        ) == summarize_table(endpoint, _page(record), budget)
+
+
+@pytest.mark.parametrize("endpoint", sorted(RECORD_MODELS))
+def test_odd_shaped_records_print_the_same_or_get_no_model(endpoint):
+    record: dict = {}
+    for spec in _SUMMARIZERS[endpoint]:
+        _fill(record, spec)
+    plan = _PLANS[endpoint]
+    row = _TABLES[endpoint][1]
+    for path in _key_paths(record):
+        for value in (None, {}, {"a": "b"}, "x", 7, [], [None], ["x"], [{}]):
+            odd = _replaced(record, path, value)
+            model = to_model(endpoint, odd)
+            if model is None:
+                continue
+            copy = model.as_record()
+            assert plan(copy) == plan(odd), (path, value)
+            assert plan(copy, 60, 1) == plan(odd, 60, 1), (path, value)
+            assert row(copy) == row(odd), (path, value)
+
+
+@pytest.mark.parametrize("endpoint", RECORDS)
+def test_round_trip(endpoint):
+    model = to_model(endpoint, RECORDS[endpoint])
+    assert to_model(endpoint, model.as_record()) == model
+
+
+def test_drops_unused_fields():
+    model = to_model("drug/event", RECORDS["drug/event"])
+    assert "transmissiondate" not in model.as_record()
+    assert "patientsex" not in model.as_record()["patient"]
+    assert not hasattr(model, "__dict__")
+
+
+def test_code_values_are_interned():
+    records = json.loads(json.dumps([RECORDS["food/enforcement"]] * 2))
+    assert records[0]["classification"] is not records[1]["classification"]
+    first, second = (Enforcement.from_record(record) for record in records)
+    assert first.classification is second.classification
+    assert first.status is second.status
+    # Free text isn't.
+    assert first.recalling_firm is not second.recalling_firm
+
+
+def test_missing_and_null_fields():
+    model = DrugEvent.from_record({"safetyreportid": "1", "serious": None})
+    assert model == DrugEvent("1", serious=NULL)
+    assert model.as_record() == {"safetyreportid": "1", "serious": None}
+
+
+def test_malformed_records_get_no_model():
+    assert to_model("drug/event", {"safetyreportid": "1", "patient": "n/a"}) is None
+    assert to_model("device/event", {"device": ["x", {"brand_name": "B"}]}) is None
+    assert to_model("device/event", {"patient": [{"sequence_number_outcome": "x"}]}) is None
+    assert to_model("device/510k", ["not", "a", "record"]) is None
+
+
+def test_endpoints_without_a_model():
+    assert to_model("drug/label", {"id": "x"}) is None
+    assert RECORD_MODELS["drug/enforcement"] is Enforcement
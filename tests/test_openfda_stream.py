@@ -0,0 +1,76 @@
+"""Tests for incremental parsing of search responses."""
+
+import json
+
+import pytest
+
+from fda_mcp.openfda.stream import ResultsParser
+
+BODY = {
+    "meta": {"results": {"skip": 0, "limit": 3, "total": 3}},
+    "results": [
+        {"id": 1, "text": "a \"quoted\" ] } value", "n": [1.5, -2e10, None]},
+        {"id": 2, "nested": {"deep": [{"x": True}, {"y": False}]}},
+        {"id": 3, "unicode": "héllo \\ wörld"},
+    ],
+}
+
+
+def _parse(text: str, size: int) -> tuple[list, ResultsParser]:
+    parser = ResultsParser()
+    items = []
+    for i in range(0, len(text), size):
+        items += parser.feed(text[i:i + size])
+    items += parser.close()
+    return items, parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 100_000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_match_json_loads_for_any_chunking(size, indent):
+    items, parser = _parse(json.dumps(BODY, indent=indent), size)
+    assert items == BODY["results"]
+    assert parser.fields == {"meta": BODY["meta"]}
+    assert parser.done
+
+
+def test_items_returned_as_soon_as_complete():
+    text = json.dumps(BODY)
+    second = text.index('{"id": 2')
+    parser = ResultsParser()
+    assert parser.feed(text[:second + 5]) == [BODY["results"][0]]
+    assert parser.fields["meta"] == BODY["meta"]
+    assert parser.feed(text[second + 5:]) == BODY["results"][1:]
+
+
+def test_meta_after_results_and_scalar_items():
+    text = '{"results": [1, 22, "x"], "meta": {"a": 1}}'
+    items, parser = _parse(text, 1)
+    assert items == [1, 22, "x"]
+    assert parser.fields["meta"] == {"a": 1}
+
+
+def test_truncated_body_raises_on_close():
+    text = json.dumps(BODY)
+    parser = ResultsParser()
+    parser.feed(text[:-20])
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_non_object_body_raises():
+    with pytest.raises(ValueError):
+        ResultsParser().feed("[1, 2]")
+
+
+@pytest.mark.parametrize("size", [5, 100_000])
+def test_keep_text_returns_item_json(size):
+    text = json.dumps(BODY, indent=2)
+    parser = ResultsParser(keep_text=True)
+    pairs = []
+    for i in range(0, len(text), size):
+        pairs += parser.feed(text[i:i + size])
+    pairs += parser.close()
+    assert [item for item, _ in pairs] == BODY["results"]
+    assert [json.loads(raw) for _, raw in pairs] == BODY["results"]
+    assert pairs[0][1].startswith("{") and pairs[0][1].endswith("}")
@@ -5,6 +5,7 @@ import pytest
 from fda_mcp.resources.query_syntax import get_query_syntax
 from fda_mcp.resources.endpoints_resource import get_endpoints
 from fda_mcp.resources.field_definitions import get_fields_resource, get_fields_text
+from fda_mcp.resources.status import get_job_status
 
 
 @pytest.mark.anyio
@@ -115,3 +116,11 @@ async def test_fields_text_includes_type_and_description():
     text = get_fields_text("drug/event")
     assert "(string)" in text or "(date)" in text
     assert "Drug brand name" in text
+
+
+@pytest.mark.anyio
+async def test_job_status_reports_queue():
+    """Job status resource shows slots and queued jobs per priority."""
+    text = await get_job_status()
+    assert "Running: 0 of" in text
+    assert "Queued: 0 (interactive 0, prefetch 0)" in text
@@ -1,7 +1,26 @@
 """Tests for the response summarizer — one test per endpoint type."""
 
+import copy
+import traceback
+
+import pytest
+
 from tests.conftest import SAMPLE_RESPONSES
-from fda_mcp.openfda.summarizer import summarize_response, summarize_count_response
+from fda_mcp.openfda.summarizer import (
+    _PLANS,
+    _SUMMARIZERS,
+    _TABLES,
+    Each,
+    Field,
+    Get,
+    Line,
+    Shape,
+    compile_plan,
+    compile_table,
+    plan_source,
+    summarize_count_response,
+    summarize_response,
+)
 
 
 def _assert_has_pagination(text: str):
@@ -230,3 +249,313 @@ def test_count_response_summary():
 def test_count_response_empty():
     result = summarize_count_response({"results": []})
     assert "No count results" in result
+
+
+# --- Compiled extraction plans ---
+
+
+def test_every_endpoint_has_a_compiled_plan():
+    assert set(_PLANS) == set(_SUMMARIZERS)
+
+
+def test_plan_fields_and_nested_defaults():
+    plan = compile_plan((
+        Field("ID", "id"),
+        Field("Brand", "openfda.brand_name", join=", "),
+        Field("Maker", "openfda.maker.name"),
+    ))
+    assert plan({"id": 7, "openfda": {"brand_name": ["A", "B"]}}) == (
+        "ID: 7\nBrand: A, B\nMaker: N/A"
+    )
+    assert plan({"openfda": None}) == "ID: N/A\nBrand: N/A\nMaker: N/A"
+
+
+def test_plan_skip_empty_codes_and_when():
+    plan = compile_plan((
+        Field("Tags", "tags", [], skip_empty=True, join="/", limit=2),
+        Line("Role: {}", Get("role", "", codes={"1": "Suspect"})),
+        Line("Fatal", when=("death", "1")),
+    ))
+    assert plan({"role": 1}) == "Role: Suspect"
+    assert plan({"tags": ["a", "b", "c"], "role": "9", "death": "1"}) == (
+        "Tags: a/b\nRole: 9\nFatal"
+    )
+
+
+def test_plan_each_with_overflow_and_truncation():
+    plan = compile_plan((
+        Each(
+            "items",
+            Field("Text", "text", "", indent="  ", max_chars=3),
+            limit=2,
+            overflow="  ... and {} more",
+        ),
+    ))
+    record = {"items": [{"text": "abcdef"}, {"text": "ab"}, {}, {}]}
+    assert plan(record) == (
+        "  Text: abc... [truncated]\n  Text: ab\n  ... and 2 more"
+    )
+    assert plan({}) == ""
+
+
+def test_plan_pluck_flatten_and_shape():
+    plan = compile_plan((
+        Field(
+            "Outcomes", "patient", [], pluck="outcome", pluck_default=[],
+            flatten=True, skip_empty=True, join=", ",
+        ),
+        Shape(
+            "product",
+            mapping=(Field("Code", "product.code"),),
+            sequence=(Each("product", Field("Code", "code"), limit=1),),
+        ),
+    ))
+    record = {
+        "patient": [{"outcome": ["Death", "Other"]}, {"outcome": "Injury"}, {}],
+        "product": [{"code": "A"}, {"code": "B"}],
+    }
+    assert plan(record) == "Outcomes: Death, Other, Injury\nCode: A"
+    assert plan({"product": {"code": "C"}}) == "Code: C"
+    assert plan({"product": "odd"}) == ""
+
+
+def _put(obj: dict, path: str, value) -> None:
+    *parents, last = path.split(".")
+    for key in parents:
+        obj = obj.setdefault(key, {})
+    obj[last] = value
+
+
+def _fill(obj: dict, spec) -> None:
+    """Give obj a value at every path spec reads."""
+    if isinstance(spec, Line):
+        for value in spec.values:
+            if value.pluck is not None:
+                _put(obj, value.path, [{value.pluck: "x"}])
+            else:
+                _put(obj, value.path, ["x"] if value.join or value.first else "x")
+        if spec.when is not None:
+            _put(obj, *spec.when)
+    elif isinstance(spec, Each):
+        item: dict = {}
+        for line in spec.lines:
+            _fill(item, line)
+        _put(obj, spec.path, [item, dict(item)])
+    else:
+        for line in spec.mapping:
+            _fill(obj, line)
+
+
+def _key_paths(value, prefix=()):
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield prefix + (key,)
+            yield from _key_paths(child, prefix + (key,))
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield prefix + (index,)
+            yield from _key_paths(child, prefix + (index,))
+
+
+def _replaced(record: dict, path: tuple, value) -> dict:
+    record = copy.deepcopy(record)
+    node = record
+    for key in path[:-1]:
+        node = node[key]
+    node[path[-1]] = value
+    return record
+
+
+@pytest.mark.parametrize("endpoint", sorted(_SUMMARIZERS))
+def test_plans_survive_null_and_odd_shaped_values(endpoint):
+    # Any value in a record may be null, an object where a list is
+    # expected, or the reverse; plans print around it instead of raising.
+    record: dict = {}
+    for spec in _SUMMARIZERS[endpoint]:
+        _fill(record, spec)
+    plan = _PLANS[endpoint]
+    row = _TABLES[endpoint][1]
+    for path in _key_paths(record):
+        for value in (None, {}, {"a": "b"}, "x", 7, [], [None], ["x"]):
+            odd = _replaced(record, path, value)
+            assert isinstance(plan(odd), str), (path, value)
+            assert isinstance(plan(odd, 60, 1000), str), (path, value)
+            assert len(row(odd)) == len(_TABLES[endpoint][0]), (path, value)
+
+
+def test_plan_template_braces_in_labels():
+    plan = compile_plan((Field("Set {x}", "x"),))
+    assert plan({"x": "1"}) == "Set {x}: 1"
+
+
+def test_generated_code_is_named_after_endpoint():
+    plan = _PLANS["drug/event"]
+    assert plan.__code__.co_filename == "<summarizer:drug/event>"
+    assert _TABLES["drug/event"][1].__code__.co_filename == (
+        "<summarizer:drug/event:table>"
+    )
+    direct = _PLANS["drug/label"].__globals__["direct"]
+    assert direct.__code__.co_filename == "<summarizer:drug/label:direct>"
+    assert "def summarize(record" in plan_source("drug/event")
+    assert "def row(record" in plan_source("drug/event", table=True)
+    assert plan_source("no/such") is None
+
+
+def test_generated_code_shows_in_tracebacks():
+    plan = compile_plan((Field("Code", "product.code"),), "test/broken")
+    with pytest.raises(AttributeError) as raised:
+        plan(None)
+    text = "".join(traceback.format_exception(raised.value))
+    assert 'File "<summarizer:test/broken>"' in text
+    assert "record.get(" in text
+
+
+def test_drug_event_drug_overflow_and_death():
+    drugs = [
+        {"medicinalproduct": f"D{i}", "drugcharacterization": "2"} for i in range(7)
+    ]
+    data = {
+        "meta": {"results": {"total": 1}},
+        "results": [{"patient": {"drug": drugs}, "seriousnessdeath": "1"}],
+    }
+    result = summarize_response("drug/event", data)
+    assert "  Drug: D4 (Concomitant)" in result
+    assert "D5" not in result
+    assert "  ... and 2 more drugs" in result
+    assert result.endswith("Outcome: Death reported")
+
+
+def test_drug_label_truncates_sections():
+    data = {
+        "meta": {"results": {"total": 1}},
+        "results": [{
+            "openfda": {"manufacturer_name": "Solo Pharma"},
+            "warnings": ["w" * 2500],
+        }],
+    }
+    result = summarize_response("drug/label", data)
+    assert "Manufacturer: Solo Pharma" in result
+    assert "\nWarnings:\n" + "w" * 2000 + "... [truncated]" in result
+
+
+# --- Output budget ---
+
+def _page(records: list[dict], skip: int = 0) -> dict:
+    return {
+        "meta": {"results": {"skip": skip, "total": skip + len(records)}},
+        "results": records,
+    }
+
+
+def _narrative_event(i: int, length: int) -> dict:
+    return {"mdr_report_key": str(i), "mdr_text": [{"text": "n" * length}]}
+
+
+def test_budget_none_matches_unbudgeted():
+    data = SAMPLE_RESPONSES["drug/label"]
+    assert summarize_response("drug/label", data, budget=None) == summarize_response(
+        "drug/label", data
+    )
+
+
+def test_budget_large_enough_changes_nothing():
+    data = SAMPLE_RESPONSES["device/event"]
+    full = summarize_response("device/event", data)
+    assert summarize_response("device/event", data, budget=len(full) + 200) == full
+
+
+def test_budget_shortens_long_fields_evenly():
+    data = _page([_narrative_event(i, 3000) for i in range(10)])
+    result = summarize_response("device/event", data, budget=3000)
+    assert len(result) <= 3000
+    records = result.split("\n---\n")
+    assert len(records) == 10
+    narratives = [line for line in result.splitlines() if "Narrative:" in line]
+    lengths = [len(line) for line in narratives]
+    assert max(lengths) - min(lengths) < 20
+    assert all(line.endswith("... [truncated]") for line in narratives)
+
+
+def test_budget_shortens_longest_fields_first():
+    data = _page([{"mdr_text": [{"text": "short"}, {"text": "x" * 5000}]}])
+    result = summarize_response("device/event", data, budget=400)
+    assert "  Narrative: short\n" in result
+    assert "x" * 100 in result and "x" * 500 not in result
+
+
+def test_budget_counts_records_that_do_not_fit():
+    data = _page([_narrative_event(i, 3000) for i in range(50)], skip=100)
+    result = summarize_response("device/event", data, budget=2000)
+    assert len(result) <= 2000
+    shown = result.count("Report Number:")
+    assert 0 < shown < 50
+    assert f"[{50 - shown} more records not shown" in result
+    assert f"use skip={100 + shown}" in result
+
+
+def test_budget_applies_to_generic_fallback():
+    data = _page([{"blob": "z" * 5000} for _ in range(5)])
+    result = summarize_response("unknown/endpoint", data, budget=1500)
+    assert len(result) <= 1500
+
+
+def test_plan_limit_returns_none_without_building():
+    plan = _PLANS["device/event"]
+    record = _narrative_event(1, 300)
+    assert plan(record, None, 50) is None
+    assert plan(record, None, 10_000) == plan(record)
+
+
+# --- Table plans ---
+
+
+def test_every_endpoint_has_a_table_plan():
+    assert set(_TABLES) == set(_SUMMARIZERS)
+    for endpoint, (columns, _) in _TABLES.items():
+        assert len(columns) == len(_SUMMARIZERS[endpoint])
+        assert all(columns), endpoint
+
+
+def test_table_plan_drops_labels_and_indentation():
+    columns, row = compile_table((
+        Field("ID", "id"),
+        Field("Tags", "tags", [], skip_empty=True, join="/"),
+        Line("Outcome: Death reported", when=("death", "1")),
+        Line("\nWarnings:\n{}", Get("warnings", None, first=True, max_chars=3)),
+    ))
+    assert columns == ["ID", "Tags", "Outcome", "Warnings"]
+    assert row({"id": 7, "death": "1", "warnings": ["abcdef"]}) == [
+        "7", "", "Death reported", "abc... [truncated]",
+    ]
+
+
+def test_table_plan_merges_item_lines_and_joins_items():
+    columns, row = compile_table((
+        Each(
+            "device",
+            Line("  Device: {} ({})", Get("name"), Get("brand")),
+            Field("Maker", "maker", indent="    "),
+            limit=2,
+            overflow="  ... and {} more",
+        ),
+    ))
+    assert columns == ["Device"]
+    devices = [{"name": "Pump", "brand": "X", "maker": "Acme"}, {"name": "Tube"}, {}]
+    assert row({"device": devices}) == [
+        "Pump (X), Maker: Acme; Tube (N/A), Maker: N/A; ... and 1 more"
+    ]
+    assert row({}) == [""]
+
+
+def test_table_plan_shape_branches():
+    columns, row = compile_table((
+        Shape(
+            "product",
+            mapping=(Field("Code", "product.code"),),
+            sequence=(Each("product", Field("Code", "code"), limit=2),),
+        ),
+    ))
+    assert columns == ["Code"]
+    assert row({"product": {"code": "C"}}) == ["C"]
+    assert row({"product": [{"code": "A"}, {"code": "B"}, {}]}) == ["A; B"]
+
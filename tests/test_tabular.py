@@ -0,0 +1,137 @@
+"""Tests for field projection and table output."""
+
+from tests.conftest import SAMPLE_RESPONSES
+from fda_mcp.openfda.summarizer import summarize_response
+from fda_mcp.openfda.tabular import (
+    TableWriter,
+    compile_projection,
+    summarize_projection,
+    summarize_table,
+)
+
+
+def _page(records: list[dict], skip: int = 0) -> dict:
+    return {
+        "meta": {"results": {"skip": skip, "total": skip + len(records)}},
+        "results": records,
+    }
+
+
+def test_projection_top_level_fields():
+    row = compile_projection(("k_number", "decision_date", "missing"))
+    record = SAMPLE_RESPONSES["device/510k"]["results"][0]
+    assert row(record) == ["K213456", "2024-01-15", ""]
+
+
+def test_projection_through_lists_keeps_distinct_values():
+    row = compile_projection(("patient.drug.openfda.brand_name",))
+    record = {
+        "patient": {
+            "drug": [
+                {"openfda": {"brand_name": ["ASPIRIN", "BAYER"]}},
+                {"openfda": {"brand_name": ["ASPIRIN"]}},
+                {"medicinalproduct": "NO OPENFDA"},
+            ]
+        }
+    }
+    assert row(record) == ["ASPIRIN, BAYER"]
+
+
+def test_projection_list_value_joined():
+    row = compile_projection(("openfda",))
+    assert row({"openfda": ["a", "b"]}) == ["a, b"]
+
+
+def test_projection_is_cached():
+    assert compile_projection(("a", "b")) is compile_projection(("a", "b"))
+
+
+def test_table_header_once_and_tsv_rows():
+    data = SAMPLE_RESPONSES["device/510k"]
+    result = summarize_projection(data, ["k_number", "decision_date"])
+    lines = result.splitlines()
+    assert lines[0].startswith("Results:")
+    assert "k_number\tdecision_date" in lines
+    assert "K213456\t2024-01-15" in lines
+    assert "K Number:" not in result
+
+
+def test_table_cells_stay_on_one_line():
+    writer = TableWriter(["a", "b"], compile_projection(("a", "b")), {}, 1)
+    writer.add({"a": "x\ty", "b": "line\nbreak"})
+    assert writer.text().splitlines()[-1] == "x y\tline break"
+
+
+def test_table_budget_cuts_long_cells_first():
+    rows = [["K%d" % i, "d" * 2000] for i in range(10)]
+    data = _page([{"k_number": k, "device_name": d} for k, d in rows])
+    result = summarize_projection(data, ["k_number", "device_name"], budget=3000)
+    assert len(result) <= 3000
+    for i in range(10):
+        assert f"K{i}\t" in result
+    assert "... [truncated]" in result
+
+
+def test_table_budget_counts_rows_that_dont_fit():
+    data = _page([{"k_number": "K%05d" % i} for i in range(1000)], skip=40)
+    result = summarize_projection(data, ["k_number"], budget=1000)
+    assert len(result) <= 1000
+    assert "not shown to stay within the output budget" in result
+    shown = sum(1 for line in result.splitlines() if line.startswith("K"))
+    assert f"skip={40 + shown}" in result
+
+
+def test_table_unbudgeted_shows_everything():
+    data = _page([{"k_number": "K%05d" % i} for i in range(200)])
+    result = summarize_projection(data, ["k_number"])
+    assert result.count("\nK") == 200
+    assert "not shown" not in result
+
+
+def test_table_writer_stops_when_full():
+    row = compile_projection(("k_number",))
+    writer = TableWriter(["k_number"], row, {"results": {"skip": 0}}, 500, 1000)
+    added = 0
+    while writer.add({"k_number": "K%05d" % added}):
+        added += 1
+    assert not writer.add({"k_number": "K99999"})
+    result = writer.text()
+    assert len(result) <= 1000
+    assert f"[{500 - added} more records not shown" in result
+    assert result.startswith("Results: 500 of 500 total")
+
+
+def test_summary_table_header_once():
+    data = _page([
+        {"k_number": f"K{i}", "device_name": "Oximeter", "decision_date": "20240101"}
+        for i in range(3)
+    ])
+    result = summarize_table("device/510k", data)
+    lines = result.splitlines()
+    assert lines[1].startswith("K Number\tDevice\tApplicant")
+    assert lines[2].startswith("K0\tOximeter\tN/A")
+    assert len(lines) == 5
+    assert result.count("Device") == 1
+
+
+def test_summary_table_smaller_than_summary():
+    record = SAMPLE_RESPONSES["device/510k"]["results"][0]
+    data = _page([dict(record) for _ in range(50)])
+    table = summarize_table("device/510k", data)
+    assert len(table) < len(summarize_response("device/510k", data)) * 0.7
+
+
+def test_summary_table_budget():
+    data = _page([
+        {"mdr_report_key": str(i), "mdr_text": [{"text": "n" * 3000}]}
+        for i in range(30)
+    ])
+    result = summarize_table("device/event", data, budget=4000)
+    assert len(result) <= 4000
+    assert "... [truncated]" in result
+
+
+def test_summary_table_unknown_endpoint_falls_back():
+    data = _page([{"blob": "z"}])
+    assert '"blob": "z"' in summarize_table("unknown/endpoint", data)
+
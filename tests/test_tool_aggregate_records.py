@@ -0,0 +1,147 @@
+"""Tests for the aggregate_records tool."""
+
+import httpx
+import pytest
+import respx
+from mcp.server.fastmcp.exceptions import ToolError
+
+from fda_mcp.config import config
+from fda_mcp.openfda import frames
+from fda_mcp.tools.aggregate import aggregate_records
+
+BASE_URL = "https://api.fda.gov"
+EVENT_URL = f"{BASE_URL}/drug/event.json"
+
+
+def _event(i: int) -> dict:
+    return {
+        "safetyreportid": str(i),
+        "patient": {
+            "patientonsetage": str(10 + i % 70),
+            "patientsex": "1" if i % 2 else "2",
+            "drug": [{"medicinalproduct": "ASPIRIN"}]
+            + ([{"medicinalproduct": "IBUPROFEN"}] if i % 3 == 0 else []),
+            "reaction": [{"reactionmeddrapt": "Nausea" if i % 4 else "Rash"}],
+        },
+    }
+
+
+def _paged(request: httpx.Request, total: int = 1500) -> httpx.Response:
+    skip = int(request.url.params.get("skip", 0))
+    limit = int(request.url.params["limit"])
+    results = [_event(i) for i in range(skip, min(skip + limit, total))]
+    meta = {"results": {"skip": skip, "limit": limit, "total": total}}
+    return httpx.Response(200, json={"meta": meta, "results": results})
+
+
+@pytest.fixture
+def mock_events():
+    pytest.importorskip("numpy")
+    with respx.mock(assert_all_called=False) as router:
+        router.get(EVENT_URL).mock(side_effect=_paged)
+        yield router
+
+
+@pytest.mark.asyncio
+async def test_groups_drug_by_reaction(mock_events):
+    result = await aggregate_records(
+        endpoint="drug/event",
+        group_by=[
+            "patient.drug.medicinalproduct.exact",
+            "patient.reaction.reactionmeddrapt",
+        ],
+        max_records=1500,
+    )
+    assert "Grouped 1,500 of 1,500 matching drug/event records" in result
+    lines = result.split("\n\n", 1)[1].splitlines()
+    assert lines[0] == (
+        "patient.drug.medicinalproduct\tpatient.reaction.reactionmeddrapt\trecords"
+    )
+    assert lines[1] == "ASPIRIN\tNausea\t1,125"
+    assert "IBUPROFEN\tRash\t125" in lines
+    assert len(mock_events.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_age_bands_mean(mock_events):
+    result = await aggregate_records(
+        endpoint="drug/event",
+        group_by=["patient.patientonsetage"],
+        bins={"patient.patientonsetage": [18, 65]},
+        aggregate="mean",
+        value_field="patient.patientonsetage",
+    )
+    assert "patient.patientonsetage\tmean(patient.patientonsetage)\trecords" in result
+    assert "18-65\t" in result
+    assert "<18\t13.5" in result.replace(",", "")
+
+
+@pytest.mark.asyncio
+async def test_partial_fetch_noted(mock_events):
+    result = await aggregate_records(
+        endpoint="drug/event", group_by=["patient.patientsex"], max_records=100,
+    )
+    assert "Grouped 100 of 1,500" in result
+    assert "only the first 100 matching records" in result
+    assert mock_events.calls.last.request.url.params["limit"] == "100"
+
+
+@pytest.mark.asyncio
+async def test_max_records_clamped(mock_events, monkeypatch):
+    monkeypatch.setattr(config, "aggregate_max_records", 50)
+    result = await aggregate_records(
+        endpoint="drug/event", group_by=["patient.patientsex"], max_records=500,
+    )
+    assert "reduced from 500 to 50" in result
+    assert "Grouped 50 of" in result
+
+
+@pytest.mark.asyncio
+async def test_row_cap_stops_fetch(mock_events, monkeypatch):
+    monkeypatch.setattr(config, "aggregate_max_rows", 10)
+    result = await aggregate_records(
+        endpoint="drug/event", group_by=["patient.drug.medicinalproduct"],
+    )
+    assert "stopped after" in result
+    assert len(mock_events.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_field(mock_events):
+    with pytest.raises(ToolError, match="not_a_field"):
+        await aggregate_records(endpoint="drug/event", group_by=["not_a_field"])
+    assert not mock_events.calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kwargs,message", [
+    ({"endpoint": "drug/nope", "group_by": ["serious"]}, "Unknown endpoint"),
+    ({"endpoint": "drug/event", "group_by": []}, "1 to 4"),
+    (
+        {"endpoint": "drug/event", "group_by": ["serious"], "aggregate": "sum"},
+        "needs a value_field",
+    ),
+    (
+        {"endpoint": "drug/event", "group_by": ["serious"],
+         "bins": {"patient.patientonsetage": [18]}},
+        "not in group_by",
+    ),
+    (
+        {"endpoint": "drug/event", "group_by": ["patient.patientonsetage"],
+         "bins": {"patient.patientonsetage": []}},
+        "at least one edge",
+    ),
+])
+async def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ToolError, match=message):
+        await aggregate_records(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_missing_numpy(monkeypatch):
+    monkeypatch.setattr(frames, "numpy_available", lambda: False)
+    with respx.mock(assert_all_called=False) as router:
+        route = router.get(EVENT_URL)
+        with pytest.raises(ToolError, match=r'pip install "fda-mcp\[frames\]"'):
+            await aggregate_records(endpoint="drug/event", group_by=["serious"])
+    assert not route.called
@@ -3,8 +3,30 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from fda_mcp.tools.decision_documents import get_decision_document
-from fda_mcp.errors import InvalidIdentifierError
+from mcp.server.fastmcp.exceptions import ToolError
+
+from fda_mcp.documents.budget import allocate_budget
+from fda_mcp.documents.fetcher import ExtractedDocument
+from fda_mcp.documents.missing import get_missing_registry
+from fda_mcp.documents.tables import ExtractedTable
+from fda_mcp.documents.urls import build_document_url
+from fda_mcp.tools.decision_documents import (
+    DocumentRequest,
+    get_decision_document,
+    get_decision_documents,
+)
+from fda_mcp.errors import DocumentNotFoundError, InvalidIdentifierError
+
+
+@pytest.fixture(autouse=True)
+def mock_resolve():
+    """Resolve to the primary URL without probing FDA servers."""
+    with patch(
+        "fda_mcp.tools.decision_documents.resolve_document_url",
+        new_callable=AsyncMock,
+        side_effect=lambda *args: build_document_url(*args),
+    ) as mock:
+        yield mock
 
 
 MOCK_PDF_TEXT = "Source: https://example.com/doc.pdf\nPages: 2\nExtraction: text extraction\n\nSample document content."
@@ -89,6 +111,29 @@ class TestGetDecisionDocumentPMA:
             await get_decision_document("pma_approval", "BADNUM")
 
 
+class TestGetDecisionDocumentResolution:
+    @pytest.mark.anyio
+    async def test_fetches_resolved_url(self, mock_fetch, mock_resolve):
+        alt = "https://www.accessdata.fda.gov/cdrh_docs/pdf21/K213456.pdf"
+        mock_resolve.side_effect = None
+        mock_resolve.return_value = alt
+
+        await get_decision_document("510k_summary", "K213456")
+
+        mock_resolve.assert_awaited_once_with("510k_summary", "K213456", None)
+        mock_fetch.assert_called_once_with(alt, max_length=8000)
+
+    @pytest.mark.anyio
+    async def test_stale_location_is_forgotten(self, mock_fetch):
+        mock_fetch.side_effect = DocumentNotFoundError("https://example.com/x.pdf")
+        with patch(
+            "fda_mcp.tools.decision_documents.forget_document_url"
+        ) as forget:
+            with pytest.raises(DocumentNotFoundError):
+                await get_decision_document("510k_summary", "K213456")
+        forget.assert_called_once_with("510k_summary", "K213456", None)
+
+
 class TestGetDecisionDocumentMaxLength:
     @pytest.mark.anyio
     async def test_custom_max_length(self, mock_fetch):
@@ -106,3 +151,176 @@ class TestGetDecisionDocumentMaxLength:
 
         _, kwargs = mock_fetch.call_args
         assert kwargs["max_length"] == 8000
+
+
+class TestGetDecisionDocuments:
+    @staticmethod
+    def _doc(url, text):
+        return ExtractedDocument(url, text, 3, "text extraction (pdfplumber)")
+
+    @pytest.mark.anyio
+    async def test_batch_isolates_per_item_errors(self):
+        ok_url = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K213456.pdf"
+        missing_url = "https://www.accessdata.fda.gov/cdrh_docs/reviews/K193012.pdf"
+
+        async def fake_extract(urls):
+            assert urls == [ok_url, missing_url]
+            return [self._doc(ok_url, "Predicate device text."), DocumentNotFoundError(missing_url)]
+
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_documents", side_effect=fake_extract
+        ):
+            result = await get_decision_documents([
+                DocumentRequest(document_type="510k_summary", submission_number="K213456"),
+                DocumentRequest(document_type="510k_summary", submission_number="K193012"),
+                DocumentRequest(document_type="510k_summary", submission_number="BAD"),
+            ])
+
+        assert "3 requested, 1 retrieved, 2 failed" in result
+        assert "=== [1] 510k_summary K213456 ===" in result
+        assert "Predicate device text." in result
+        assert "Document not found" in result
+        assert "Invalid identifier 'BAD'" in result
+
+    @pytest.mark.anyio
+    async def test_batch_reports_known_missing(self, mock_resolve):
+        get_missing_registry().add("510k_summary:K193012")
+
+        async def resolve(document_type, number, supplement=None):
+            if number == "K193012":
+                raise DocumentNotFoundError(build_document_url(document_type, number))
+            return build_document_url(document_type, number)
+
+        mock_resolve.side_effect = resolve
+
+        async def fake_extract(urls):
+            return [self._doc(urls[0], "Predicate device text.")]
+
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_documents", side_effect=fake_extract
+        ):
+            result = await get_decision_documents([
+                DocumentRequest(document_type="510k_summary", submission_number="K213456"),
+                DocumentRequest(document_type="510k_summary", submission_number="K193012"),
+            ])
+
+        assert "2 requested, 1 retrieved, 1 failed (1 known missing)" in result
+
+    @pytest.mark.anyio
+    async def test_batch_shares_character_budget(self):
+        async def fake_extract(urls):
+            return [self._doc(urls[0], "a" * 50), self._doc(urls[1], "b" * 5000)]
+
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_documents", side_effect=fake_extract
+        ):
+            result = await get_decision_documents(
+                [
+                    DocumentRequest(document_type="510k_summary", submission_number="K213456"),
+                    DocumentRequest(document_type="pma_supplement", submission_number="P200001", supplement_number="13"),
+                ],
+                max_length=1000,
+            )
+
+        assert "a" * 50 in result
+        # The short document's unused share goes to the long one.
+        assert "b" * 950 in result
+        assert "b" * 951 not in result
+        assert "pma_supplement P200001 S013" in result
+
+    @pytest.mark.anyio
+    async def test_batch_rejects_too_many(self):
+        docs = [
+            DocumentRequest(document_type="510k_summary", submission_number="K213456")
+        ] * 31
+        with pytest.raises(ToolError, match="at most 30"):
+            await get_decision_documents(docs)
+
+
+class TestAllocateBudget:
+    def test_even_split(self):
+        assert allocate_budget([100, 100], 100) == [50, 50]
+
+    def test_short_items_release_their_share(self):
+        assert allocate_budget([10, 500, 500], 300) == [10, 145, 145]
+
+    def test_never_exceeds_item_size(self):
+        assert allocate_budget([5, 7], 1000) == [5, 7]
+
+
+class TestGetDecisionDocumentQuery:
+    @pytest.mark.anyio
+    async def test_query_returns_ranked_passages(self):
+        text = "Boilerplate labeling text.\n" * 200 + "The predicate device is K123456.\n"
+        doc = ExtractedDocument(
+            "https://www.accessdata.fda.gov/cdrh_docs/reviews/K213456.pdf",
+            text, 4, "text extraction (pdfplumber)",
+        )
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_document",
+            new_callable=AsyncMock,
+            return_value=doc,
+        ):
+            result = await get_decision_document(
+                "510k_summary", "K213456", max_length=500, query="predicate device"
+            )
+
+        assert "K123456" in result
+        assert "Query: predicate device" in result
+
+
+class TestGetDecisionDocumentSections:
+    @pytest.mark.anyio
+    async def test_sections_returns_selected_sections(self):
+        text = (
+            "510(k) Summary\n2. Predicate Device\nK123456 Acme Oximeter.\n"
+            "3. Device Description\nFingertip oximeter.\n"
+        )
+        doc = ExtractedDocument(
+            "https://www.accessdata.fda.gov/cdrh_docs/reviews/K213456.pdf",
+            text, 2, "text extraction (pdfplumber)",
+        )
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_document",
+            new_callable=AsyncMock,
+            return_value=doc,
+        ):
+            result = await get_decision_document(
+                "510k_summary", "K213456", sections=["predicate"]
+            )
+
+        assert "K123456 Acme Oximeter." in result
+        assert "Fingertip oximeter." not in result
+
+    @pytest.mark.anyio
+    async def test_query_and_sections_are_exclusive(self):
+        with pytest.raises(ToolError, match="only one of query, sections or tables"):
+            await get_decision_document(
+                "510k_summary", "K213456", query="predicate", sections=["predicate"]
+            )
+
+
+class TestGetDecisionDocumentTables:
+    @pytest.mark.anyio
+    async def test_tables_mode_returns_tsv(self):
+        doc = ExtractedDocument(
+            "https://www.accessdata.fda.gov/cdrh_docs/pdf20/P200001B.pdf",
+            "text", 5, "text extraction (pdfplumber)",
+        )
+        doc.tables = [ExtractedTable(4, [["Endpoint", "Result"], ["Sens", "94%"]])]
+        with patch(
+            "fda_mcp.tools.decision_documents.extract_document",
+            new_callable=AsyncMock,
+            return_value=doc,
+        ):
+            result = await get_decision_document("pma_ssed", "P200001", tables=True)
+
+        assert "# Table 1 (page 4, 2 rows)" in result
+        assert "Sens\t94%" in result
+
+    @pytest.mark.anyio
+    async def test_tables_and_query_are_exclusive(self):
+        with pytest.raises(ToolError, match="only one of query, sections or tables"):
+            await get_decision_document(
+                "pma_ssed", "P200001", query="endpoint", tables=True
+            )
@@ -0,0 +1,35 @@
+"""Each tool module imports on its own, in a fresh interpreter."""
+
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import fda_mcp.tools
+
+TOOL_MODULES = [
+    "fda_mcp.tools.search",
+    "fda_mcp.tools.count",
+    "fda_mcp.tools.aggregate",
+    "fda_mcp.tools.fields",
+    "fda_mcp.tools.decision_documents",
+    "fda_mcp.tools.document_search",
+]
+
+
+@pytest.mark.parametrize("module", TOOL_MODULES)
+def test_tool_module_imports_alone(module):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_every_tool_module_listed():
+    modules = {
+        f"fda_mcp.tools.{info.name}"
+        for info in pkgutil.iter_modules(fda_mcp.tools.__path__)
+        if not info.name.startswith("_")
+    }
+    assert modules == set(TOOL_MODULES)
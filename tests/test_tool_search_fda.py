@@ -207,3 +207,178 @@ async def test_invalid_dataset_raises_error():
     """Invalid dataset value raises ToolError."""
     with pytest.raises(ToolError, match="Unknown dataset"):
         await search_fda(dataset="invalid_thing", search="test")  # type: ignore[arg-type]
+
+
+# -- Decision-document prefetch --
+
+@pytest.mark.anyio
+async def test_prefetch_scheduled_for_510k_results(mock_openfda, monkeypatch):
+    from fda_mcp.config import config
+    from fda_mcp.documents.prefetch import document_prefetcher
+
+    scheduled = []
+    monkeypatch.setattr(config, "prefetch_documents", 3)
+    monkeypatch.setattr(document_prefetcher, "schedule", scheduled.append)
+
+    await search_fda(dataset="device_510k", search='device_name:"oximeter"')
+
+    assert scheduled and scheduled[0][0][0] == "510k_summary"
+
+
+@pytest.mark.anyio
+async def test_prefetch_not_scheduled_for_other_datasets(mock_openfda, monkeypatch):
+    from fda_mcp.config import config
+    from fda_mcp.documents.prefetch import document_prefetcher
+
+    scheduled = []
+    monkeypatch.setattr(config, "prefetch_documents", 3)
+    monkeypatch.setattr(document_prefetcher, "schedule", scheduled.append)
+
+    await search_fda(dataset="drug_adverse_events", search="test")
+
+    assert scheduled == []
+
+
+# -- Output budget --
+
+def _label_page(records: int) -> dict:
+    return {
+        "meta": {"results": {"skip": 0, "limit": records, "total": records}},
+        "results": [
+            {
+                "openfda": {"brand_name": [f"BRAND{i}"]},
+                "warnings": ["w" * 2000],
+                "adverse_reactions": ["a" * 2000],
+            }
+            for i in range(records)
+        ],
+    }
+
+
+@pytest.mark.anyio
+async def test_max_length_bounds_output(mock_openfda):
+    import httpx
+
+    mock_openfda.get("https://api.fda.gov/drug/label.json").mock(
+        return_value=httpx.Response(200, json=_label_page(20))
+    )
+    result = await search_fda(dataset="drug_labels", search="test", max_length=5000)
+    assert len(result) <= 5000
+    assert "BRAND0" in result
+    assert "not shown to stay within the output budget" in result
+
+
+@pytest.mark.anyio
+async def test_default_budget_from_config(mock_openfda, monkeypatch):
+    import httpx
+    from fda_mcp.config import config
+
+    mock_openfda.get("https://api.fda.gov/drug/label.json").mock(
+        return_value=httpx.Response(200, json=_label_page(20))
+    )
+    monkeypatch.setattr(config, "search_output_budget", 0)
+    result = await search_fda(dataset="drug_labels", search="test")
+    assert "BRAND19" in result
+    assert "w" * 2000 in result
+
+
+# -- Field projection --
+
+@pytest.mark.anyio
+async def test_fields_projection_returns_table(mock_openfda):
+    result = await search_fda(
+        dataset="device_510k", search="test", fields=["k_number", "decision_date"]
+    )
+    assert "k_number\tdecision_date" in result
+    assert "K213456\t2024-01-15" in result
+    assert "Pulse Oximeter" not in result
+
+
+@pytest.mark.anyio
+async def test_fields_unknown_rejected_before_query(mock_openfda):
+    with pytest.raises(ToolError, match="Unknown field") as exc:
+        await search_fda(
+            dataset="device_510k", search="test", fields=["k_number", "decison_date"]
+        )
+    assert "decision_date" in str(exc.value)
+    assert "list_searchable_fields" in str(exc.value)
+    assert not mock_openfda.calls
+
+
+@pytest.mark.anyio
+async def test_table_format(mock_openfda):
+    result = await search_fda(dataset="device_510k", search="test", format="table")
+    assert "K Number\tDevice\tApplicant" in result
+    assert "K213456\tPulse Oximeter\tTest Medical Inc" in result
+    assert "K Number:" not in result
+
+
+
+# -- Summary memo --
+
+@pytest.mark.anyio
+async def test_repeated_search_served_from_memo(mock_openfda):
+    from fda_mcp.openfda.memo import summary_memo
+
+    # drug/drugsfda pages aren't cached, so the second query reads the body.
+    first = await search_fda(dataset="drug_approvals", search="test")
+    second = await search_fda(dataset="drug_approvals", search="test")
+    assert first == second
+    assert (summary_memo.hits, summary_memo.misses) == (1, 1)
+
+
+# -- Page cache --
+
+@pytest.mark.anyio
+async def test_repeated_search_served_from_page_cache(mock_openfda):
+    from fda_mcp.openfda.pagecache import page_cache
+
+    first = await search_fda(dataset="drug_recalls", search="test")
+    table = await search_fda(dataset="drug_recalls", search="test", format="table")
+    assert mock_openfda.calls.call_count == 1
+    assert (page_cache.hits, page_cache.misses) == (1, 1)
+    page_cache.clear()
+    assert await search_fda(dataset="drug_recalls", search="test") == first
+    assert await search_fda(
+        dataset="drug_recalls", search="test", format="table", max_length=0
+    ) == table
+    assert mock_openfda.calls.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_page_cache_keyed_by_query(mock_openfda):
+    await search_fda(dataset="device_510k", search="test")
+    await search_fda(dataset="device_510k", search="test", skip=1)
+    await search_fda(dataset="device_510k", search="other")
+    await search_fda(dataset="device_adverse_events", search="test")
+    assert mock_openfda.calls.call_count == 4
+
+
+@pytest.mark.anyio
+async def test_projection_skips_page_cache(mock_openfda):
+    await search_fda(dataset="device_510k", search="test")
+    await search_fda(
+        dataset="device_510k", search="test", fields=["k_number", "decision_date"]
+    )
+    assert mock_openfda.calls.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_partly_read_page_not_cached(mock_openfda):
+    import httpx
+
+    from fda_mcp.openfda.pagecache import page_cache
+
+    records = [
+        {"recall_number": f"D-{i:04d}-2024", "reason_for_recall": "x" * 3000}
+        for i in range(20)
+    ]
+    body = {"meta": {"results": {"skip": 0, "limit": 20, "total": 20}}, "results": records}
+    mock_openfda.get("https://api.fda.gov/drug/enforcement.json").mock(
+        return_value=httpx.Response(200, json=body)
+    )
+    result = await search_fda(dataset="drug_recalls", search="test", limit=20, max_length=1000)
+    assert "not shown" in result
+    assert len(page_cache) == 0
+    await search_fda(dataset="drug_recalls", search="test", limit=20)
+    assert len(page_cache) == 1